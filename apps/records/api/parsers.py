@@ -0,0 +1,20 @@
+from apps.records.services.blob_service import FileBlobService
+from apps.records.services.import_service import RecordImportService
+from apps.records.services.upload_service import RecordUploadService
+from apps.utils.storage import StreamingMultiPartParser
+
+
+class RecordFileParser(StreamingMultiPartParser):
+    """
+    Streams record files into object storage under the same keys as direct
+    uploads, unless the same content is already stored.
+    """
+
+    key_func = staticmethod(RecordUploadService.build_key)
+    content_lookup = staticmethod(FileBlobService.find_key)
+
+
+class RecordImportParser(StreamingMultiPartParser):
+    """Streams import sources into object storage under ``imports/``."""
+
+    key_func = staticmethod(RecordImportService.build_key)
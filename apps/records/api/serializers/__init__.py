@@ -5,12 +5,44 @@ from apps.records.api.serializers.records_serializers import (
     NotFoundResponseSerializer,
     DeletedResponseSerializer,
 )
+from apps.records.api.serializers.records_list_serializer import DataRecordListSerializer
+from apps.records.api.serializers.upload_serializers import (
+    UploadRequestSerializer,
+    UploadCommitSerializer,
+    UploadTicketResponseSerializer,
+    UploadCommitResponseSerializer,
+)
+from apps.records.api.serializers.bulk_serializers import (
+    BulkCreateItemSerializer,
+    BulkUpdateItemSerializer,
+    BulkDeleteSerializer,
+    BulkResponseSerializer,
+)
+from apps.records.api.serializers.export_serializers import ExportJobResponseSerializer
+from apps.records.api.serializers.import_serializers import (
+    ImportRequestSerializer,
+    ImportJobSerializer,
+    ImportJobResponseSerializer,
+)
 
 __all__ = [
     'DataRecordSerializer',
+    'DataRecordListSerializer',
     'RecordResponseSerializer',
     'RecordListResponseSerializer',
     'NotFoundResponseSerializer',
     'DeletedResponseSerializer',
+    'UploadRequestSerializer',
+    'UploadCommitSerializer',
+    'UploadTicketResponseSerializer',
+    'UploadCommitResponseSerializer',
+    'BulkCreateItemSerializer',
+    'BulkUpdateItemSerializer',
+    'BulkDeleteSerializer',
+    'BulkResponseSerializer',
+    'ExportJobResponseSerializer',
+    'ImportRequestSerializer',
+    'ImportJobSerializer',
+    'ImportJobResponseSerializer',
 ]
 
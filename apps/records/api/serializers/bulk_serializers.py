@@ -0,0 +1,49 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from apps.records.models.records_model import DataRecord
+
+
+class BulkCreateItemSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DataRecord
+        fields = ['title', 'description', 'is_active']
+
+
+class BulkUpdateItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField(min_value=1)
+    title = serializers.CharField(max_length=200, required=False)
+    description = serializers.CharField(required=False, allow_blank=True)
+    is_active = serializers.BooleanField(required=False)
+
+    def validate(self, attrs):
+        if len(attrs) == 1:
+            raise serializers.ValidationError("Provide at least one field to update.")
+        return attrs
+
+
+class BulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=settings.RECORDS_BULK_MAX_ITEMS,
+    )
+
+
+class BulkItemResultSerializer(serializers.Serializer):
+    index = serializers.IntegerField(help_text="Position of the item in the request.")
+    status = serializers.ChoiceField(choices=['created', 'updated', 'deleted', 'not_found', 'error'])
+    id = serializers.IntegerField(required=False)
+    message = serializers.CharField(required=False)
+
+
+class BulkResultSerializer(serializers.Serializer):
+    succeeded = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    results = BulkItemResultSerializer(many=True)
+
+
+class BulkResponseSerializer(serializers.Serializer):
+    success = serializers.BooleanField()
+    message = serializers.CharField()
+    data = BulkResultSerializer()
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+
+class ExportJobSerializer(serializers.Serializer):
+    id = serializers.CharField()
+    status = serializers.ChoiceField(choices=['pending', 'running', 'completed', 'failed'])
+    format = serializers.CharField()
+    download_url = serializers.CharField(required=False, help_text="Presigned link, once the job completed.")
+    error = serializers.CharField(required=False)
+
+
+class ExportJobResponseSerializer(serializers.Serializer):
+    success = serializers.BooleanField()
+    message = serializers.CharField()
+    data = ExportJobSerializer()
@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+from apps.records.models import RecordImportJob
+
+
+class ImportRequestSerializer(serializers.Serializer):
+    file = serializers.FileField(help_text="CSV with a header row, or NDJSON (one object per line).")
+    format = serializers.ChoiceField(
+        choices=RecordImportJob.Format.choices, required=False,
+        help_text="Defaults to the file extension (.csv, .ndjson, .jsonl).",
+    )
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RecordImportJob
+        fields = [
+            'id', 'format', 'status', 'rows_processed', 'rows_created', 'rows_rejected',
+            'rejected', 'error', 'created_at', 'updated_at', 'finished_at',
+        ]
+
+
+class ImportJobResponseSerializer(serializers.Serializer):
+    success = serializers.BooleanField()
+    message = serializers.CharField()
+    data = ImportJobSerializer()
@@ -5,7 +5,10 @@ from apps.records.models.records_model import DataRecord
 class DataRecordSerializer(serializers.ModelSerializer):
     class Meta:
         model = DataRecord
-        fields = ['id', 'title', 'description', 'file', 'created_at', 'updated_at', 'is_active']
+        fields = [
+            'id', 'title', 'description', 'file', 'file_name', 'created_at', 'updated_at', 'is_active',
+            'file_status', 'file_size', 'file_checksum', 'file_mime_type', 'thumbnail',
+        ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
@@ -18,6 +21,7 @@ class RecordResponseSerializer(serializers.Serializer):
 
 class RecordListDataSerializer(serializers.Serializer):
     count = serializers.IntegerField()
+    count_exact = serializers.BooleanField(help_text="False when count is a planner estimate.")
     total_pages = serializers.IntegerField()
     current_page = serializers.IntegerField()
     page_size = serializers.IntegerField()
@@ -0,0 +1,39 @@
+from rest_framework import serializers
+
+from apps.records.api.serializers.records_serializers import DataRecordSerializer
+
+
+class UploadRequestSerializer(serializers.Serializer):
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1, help_text="Exact size of the file in bytes.")
+    content_type = serializers.CharField(max_length=255, required=False, allow_blank=True)
+
+
+class UploadCommitSerializer(serializers.Serializer):
+    upload_token = serializers.CharField()
+    record = serializers.IntegerField(
+        required=False, help_text="Attach the file to this record instead of creating a new one.",
+    )
+    title = serializers.CharField(max_length=200, required=False)
+    description = serializers.CharField(required=False, allow_blank=True)
+    is_active = serializers.BooleanField(required=False)
+
+
+class UploadTicketSerializer(serializers.Serializer):
+    key = serializers.CharField()
+    url = serializers.CharField(help_text="POST a multipart form with `fields` followed by `file` here.")
+    fields = serializers.DictField(child=serializers.CharField())
+    expires_in = serializers.IntegerField()
+    upload_token = serializers.CharField()
+
+
+class UploadTicketResponseSerializer(serializers.Serializer):
+    success = serializers.BooleanField()
+    message = serializers.CharField()
+    data = UploadTicketSerializer()
+
+
+class UploadCommitResponseSerializer(serializers.Serializer):
+    success = serializers.BooleanField()
+    message = serializers.CharField()
+    data = DataRecordSerializer()
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from apps.records.api.views import (
     RecordListView,
@@ -5,10 +6,33 @@ from apps.records.api.views import (
     RecordRetrieveView,
     RecordUpdateView,
     RecordDeleteView,
+    AsyncRecordListView,
+    AsyncRecordCreateView,
+    AsyncRecordRetrieveView,
+    AsyncRecordUpdateView,
+    AsyncRecordDeleteView,
+    RecordBulkCreateView,
+    RecordBulkUpdateView,
+    RecordBulkDeleteView,
+    RecordExportView,
+    RecordExportJobView,
+    RecordExportJobDetailView,
+    RecordFileView,
+    RecordImportView,
+    RecordImportJobView,
+    RecordImportResumeView,
+    RecordUploadView,
+    RecordUploadCommitView,
 )
 
 
-
+# Under an ASGI server the async variants let one worker overlap many requests' I/O.
+if settings.RECORDS_ASYNC_VIEWS:
+    RecordListView = AsyncRecordListView
+    RecordCreateView = AsyncRecordCreateView
+    RecordRetrieveView = AsyncRecordRetrieveView
+    RecordUpdateView = AsyncRecordUpdateView
+    RecordDeleteView = AsyncRecordDeleteView
 
 
 urlpatterns = [
@@ -17,4 +41,16 @@ urlpatterns = [
     path('records/<int:pk>/', RecordRetrieveView.as_view(), name='record-detail'),
     path('records/<int:pk>/update/', RecordUpdateView.as_view(), name='record-update'),
     path('records/<int:pk>/delete/', RecordDeleteView.as_view(), name='record-delete'),
+    path('records/bulk/create/', RecordBulkCreateView.as_view(), name='record-bulk-create'),
+    path('records/bulk/update/', RecordBulkUpdateView.as_view(), name='record-bulk-update'),
+    path('records/bulk/delete/', RecordBulkDeleteView.as_view(), name='record-bulk-delete'),
+    path('records/export/', RecordExportView.as_view(), name='record-export'),
+    path('records/export/jobs/', RecordExportJobView.as_view(), name='record-export-job'),
+    path('records/export/jobs/<str:job_id>/', RecordExportJobDetailView.as_view(), name='record-export-job-detail'),
+    path('records/<int:pk>/file/', RecordFileView.as_view(), name='record-file'),
+    path('records/imports/', RecordImportView.as_view(), name='record-import'),
+    path('records/imports/<uuid:job_id>/', RecordImportJobView.as_view(), name='record-import-job'),
+    path('records/imports/<uuid:job_id>/resume/', RecordImportResumeView.as_view(), name='record-import-resume'),
+    path('records/uploads/', RecordUploadView.as_view(), name='record-upload'),
+    path('records/uploads/commit/', RecordUploadCommitView.as_view(), name='record-upload-commit'),
 ]
@@ -5,6 +5,30 @@ from apps.records.api.views.records_views import (
     RecordUpdateView,
     RecordDeleteView,
 )
+from apps.records.api.views.async_records_views import (
+    AsyncRecordListView,
+    AsyncRecordCreateView,
+    AsyncRecordRetrieveView,
+    AsyncRecordUpdateView,
+    AsyncRecordDeleteView,
+)
+from apps.records.api.views.bulk_views import (
+    RecordBulkCreateView,
+    RecordBulkUpdateView,
+    RecordBulkDeleteView,
+)
+from apps.records.api.views.export_views import (
+    RecordExportView,
+    RecordExportJobView,
+    RecordExportJobDetailView,
+)
+from apps.records.api.views.file_views import RecordFileView
+from apps.records.api.views.import_views import (
+    RecordImportView,
+    RecordImportJobView,
+    RecordImportResumeView,
+)
+from apps.records.api.views.upload_views import RecordUploadView, RecordUploadCommitView
 
 __all__ = [
     'RecordListView',
@@ -12,4 +36,21 @@ __all__ = [
     'RecordRetrieveView',
     'RecordUpdateView',
     'RecordDeleteView',
+    'AsyncRecordListView',
+    'AsyncRecordCreateView',
+    'AsyncRecordRetrieveView',
+    'AsyncRecordUpdateView',
+    'AsyncRecordDeleteView',
+    'RecordBulkCreateView',
+    'RecordBulkUpdateView',
+    'RecordBulkDeleteView',
+    'RecordExportView',
+    'RecordExportJobView',
+    'RecordExportJobDetailView',
+    'RecordFileView',
+    'RecordImportView',
+    'RecordImportJobView',
+    'RecordImportResumeView',
+    'RecordUploadView',
+    'RecordUploadCommitView',
 ]
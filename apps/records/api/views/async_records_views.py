@@ -0,0 +1,244 @@
+from adrf.views import APIView
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from drf_spectacular.utils import extend_schema
+from rest_framework.exceptions import NotFound
+from rest_framework.parsers import FormParser, JSONParser
+
+from apps.records.api.parsers import RecordFileParser
+from apps.records.api.serializers import (
+    DataRecordSerializer,
+    DataRecordListSerializer,
+    RecordResponseSerializer,
+    RecordListResponseSerializer,
+    NotFoundResponseSerializer,
+    DeletedResponseSerializer,
+)
+from apps.records.api.views.records_views import (
+    _IF_MATCH_PARAM,
+    _IF_NONE_MATCH_PARAM,
+    _LIST_FILTER_PARAMS,
+    _detail_etag,
+    _discard_streamed_files,
+    _expected_version,
+    _url_epoch,
+)
+from apps.records.selectors import DataRecordSelector, RecordDetailCache
+from apps.records.services import DataRecordService, RecordNotFound, RecordVersionConflict, RECORD_COUNT_NAMESPACE
+from apps.utils import (
+    BaseResponse,
+    DataRecordFilter,
+    StandardResultsPagination,
+    KeysetCursorPagination,
+    AdaptiveCount,
+    IsAdmin,
+    IsEditorOrAdmin,
+    IsAnyRole,
+    make_etag,
+    is_not_modified,
+)
+from apps.utils.conditional import digest
+from apps.utils.pagination import get_count_version
+
+# Async variants of the views in records_views, routed instead of them when
+# RECORDS_ASYNC_VIEWS is set. Under an ASGI server queries go through the async
+# ORM and everything still sync (parsing, serializing, cache and storage calls)
+# runs in the request's worker thread, so one worker overlaps many requests.
+
+
+async def _alist_etag(request, records) -> str:
+    last_modified = await DataRecordSelector.aget_last_modified(records)
+    return make_etag(
+        'l',
+        RecordDetailCache.version_from(last_modified) if last_modified else 0,
+        await sync_to_async(get_count_version)(RECORD_COUNT_NAMESPACE),
+        _url_epoch(),
+        digest(request.get_full_path()),
+    )
+
+
+async def _aread_data(request):
+    # Parsing may stream file parts into object storage.
+    return await sync_to_async(lambda: request.data)()
+
+
+async def _aserialize(serializer):
+    return await sync_to_async(lambda: serializer.data)()
+
+
+class AsyncRecordListView(APIView):
+    permission_classes = [IsAnyRole]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="List records",
+        parameters=_LIST_FILTER_PARAMS + [_IF_NONE_MATCH_PARAM],
+        responses={200: RecordListResponseSerializer, 304: None, 404: NotFoundResponseSerializer},
+    )
+    async def get(self, request):
+        try:
+            records = DataRecordSelector.get_all_records()
+            records = DataRecordFilter().filter_queryset(request, records, self)
+
+            etag = await _alist_etag(request, records)
+            if is_not_modified(request, etag):
+                return BaseResponse.not_modified(etag)
+
+            if 'cursor' in request.query_params:
+                paginator = KeysetCursorPagination()
+            else:
+                paginator = StandardResultsPagination(
+                    count_strategy=AdaptiveCount(namespace=RECORD_COUNT_NAMESPACE),
+                )
+            page = await paginator.apaginate_queryset(DataRecordListSerializer.values(records), request)
+            data = await _aserialize(DataRecordListSerializer(page))
+            response = paginator.get_paginated_response(data)
+            response['ETag'] = etag
+            return response
+        except ValidationError as e:
+            return BaseResponse.validation_error(e.message_dict)
+        except NotFound as e:
+            # Invalid cursor or page out of range.
+            return BaseResponse.not_found(str(e.detail))
+        except Exception as e:
+            return BaseResponse.error(str(e))
+
+
+class AsyncRecordCreateView(APIView):
+    permission_classes = [IsEditorOrAdmin]
+    parser_classes = [JSONParser, FormParser, RecordFileParser]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Create a record",
+        request=DataRecordSerializer,
+        responses={
+            201: RecordResponseSerializer,
+            400: NotFoundResponseSerializer,
+        },
+    )
+    async def post(self, request):
+        try:
+            serializer = DataRecordSerializer(data=await _aread_data(request))
+            if not serializer.is_valid():
+                await sync_to_async(_discard_streamed_files)(request)
+                return BaseResponse.validation_error(serializer.errors)
+
+            record = await DataRecordService.acreate_record(
+                title=serializer.validated_data.get('title'),
+                description=serializer.validated_data.get('description', ''),
+                file=serializer.validated_data.get('file', None),
+                is_active=serializer.validated_data.get('is_active', True),
+            )
+
+            data = await _aserialize(DataRecordSerializer(record))
+            return BaseResponse.created(data=data)
+
+        except ValidationError as e:
+            await sync_to_async(_discard_streamed_files)(request)
+            return BaseResponse.error(str(e))
+
+
+class AsyncRecordRetrieveView(APIView):
+    permission_classes = [IsAnyRole]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Retrieve a record",
+        parameters=[_IF_NONE_MATCH_PARAM],
+        responses={
+            200: RecordResponseSerializer,
+            304: None,
+            404: NotFoundResponseSerializer,
+        },
+    )
+    async def get(self, request, pk):
+        try:
+            if request.headers.get('If-None-Match'):
+                version = await RecordDetailCache.aget_current_version(pk)
+                if version is None:
+                    return BaseResponse.not_found()
+                if is_not_modified(request, _detail_etag(version)):
+                    return BaseResponse.not_modified(_detail_etag(version))
+
+            entry = await RecordDetailCache.aget_or_build_entry(
+                pk, lambda record: DataRecordSerializer(record).data,
+            )
+            if entry is None:
+                return BaseResponse.not_found()
+
+            version, data = entry
+            response = BaseResponse.success(data=data)
+            response['ETag'] = _detail_etag(version)
+            return response
+        except Exception as e:
+            return BaseResponse.error(str(e))
+
+
+class AsyncRecordUpdateView(APIView):
+    permission_classes = [IsEditorOrAdmin]
+    parser_classes = [JSONParser, FormParser, RecordFileParser]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Partially update a record",
+        request=DataRecordSerializer,
+        parameters=[_IF_MATCH_PARAM],
+        responses={
+            200: RecordResponseSerializer,
+            404: NotFoundResponseSerializer,
+            412: NotFoundResponseSerializer,
+        },
+    )
+    async def patch(self, request, pk):
+        try:
+            serializer = DataRecordSerializer(data=await _aread_data(request), partial=True)
+            if not serializer.is_valid():
+                await sync_to_async(_discard_streamed_files)(request)
+                return BaseResponse.validation_error(serializer.errors)
+
+            updated_record = await DataRecordService.aupdate_record(
+                pk,
+                expected_version=_expected_version(request),
+                **serializer.validated_data,
+            )
+            data = await _aserialize(DataRecordSerializer(updated_record))
+            response = BaseResponse.success(data=data)
+            response['ETag'] = _detail_etag(RecordDetailCache.get_version(updated_record))
+            return response
+
+        except RecordNotFound:
+            await sync_to_async(_discard_streamed_files)(request)
+            return BaseResponse.not_found()
+        except RecordVersionConflict as e:
+            await sync_to_async(_discard_streamed_files)(request)
+            return BaseResponse.precondition_failed(e.message)
+        except ValidationError as e:
+            await sync_to_async(_discard_streamed_files)(request)
+            return BaseResponse.error(str(e))
+
+
+class AsyncRecordDeleteView(APIView):
+    permission_classes = [IsAdmin]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Delete a record",
+        parameters=[_IF_MATCH_PARAM],
+        responses={
+            204: DeletedResponseSerializer,
+            404: NotFoundResponseSerializer,
+            412: NotFoundResponseSerializer,
+        },
+    )
+    async def delete(self, request, pk):
+        try:
+            await DataRecordService.adelete_record(pk, expected_version=_expected_version(request))
+            return BaseResponse.deleted()
+
+        except RecordNotFound:
+            return BaseResponse.not_found()
+        except RecordVersionConflict as e:
+            return BaseResponse.precondition_failed(e.message)
+        except ValidationError as e:
+            return BaseResponse.error(str(e))
@@ -0,0 +1,94 @@
+from django.conf import settings
+from drf_spectacular.utils import extend_schema
+from rest_framework.views import APIView
+
+from apps.records.api.serializers import (
+    BulkCreateItemSerializer,
+    BulkUpdateItemSerializer,
+    BulkDeleteSerializer,
+    BulkResponseSerializer,
+    NotFoundResponseSerializer,
+)
+from apps.records.services import RecordBulkService
+from apps.utils import BaseResponse, IsAdmin, IsEditorOrAdmin
+
+_BULK_RESPONSES = {
+    200: BulkResponseSerializer,
+    400: NotFoundResponseSerializer,
+}
+
+
+def _bulk_response(results: list[dict]):
+    failed = sum(1 for result in results if result['status'] in ('error', 'not_found'))
+    return BaseResponse.success(
+        data={'succeeded': len(results) - failed, 'failed': failed, 'results': results},
+        message=f'Processed {len(results)} records',
+    )
+
+
+def _items_serializer(serializer_class, request):
+    return serializer_class(
+        data=request.data,
+        many=True,
+        allow_empty=False,
+        max_length=settings.RECORDS_BULK_MAX_ITEMS,
+    )
+
+
+class RecordBulkCreateView(APIView):
+    permission_classes = [IsEditorOrAdmin]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Create records in bulk",
+        description=(
+            "Accepts a JSON array of records. The whole array is validated first; any "
+            "invalid item rejects the request with errors keyed by item index. Valid "
+            "arrays are saved in chunked transactions and the response holds one result "
+            "per item, in request order."
+        ),
+        request=BulkCreateItemSerializer(many=True),
+        responses=_BULK_RESPONSES,
+    )
+    def post(self, request):
+        serializer = _items_serializer(BulkCreateItemSerializer, request)
+        if not serializer.is_valid():
+            return BaseResponse.validation_error(serializer.errors)
+        return _bulk_response(RecordBulkService.create_records(serializer.validated_data))
+
+
+class RecordBulkUpdateView(APIView):
+    permission_classes = [IsEditorOrAdmin]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Update records in bulk",
+        description=(
+            "Accepts a JSON array of partial updates, each with the record `id`. Unknown "
+            "IDs are reported as `not_found`; the other items are saved in chunked "
+            "transactions."
+        ),
+        request=BulkUpdateItemSerializer(many=True),
+        responses=_BULK_RESPONSES,
+    )
+    def patch(self, request):
+        serializer = _items_serializer(BulkUpdateItemSerializer, request)
+        if not serializer.is_valid():
+            return BaseResponse.validation_error(serializer.errors)
+        return _bulk_response(RecordBulkService.update_records(serializer.validated_data))
+
+
+class RecordBulkDeleteView(APIView):
+    permission_classes = [IsAdmin]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Delete records in bulk",
+        request=BulkDeleteSerializer,
+        responses=_BULK_RESPONSES,
+    )
+    def post(self, request):
+        serializer = BulkDeleteSerializer(data=request.data)
+        if not serializer.is_valid():
+            return BaseResponse.validation_error(serializer.errors)
+        return _bulk_response(RecordBulkService.delete_records(serializer.validated_data['ids']))
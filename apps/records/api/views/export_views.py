@@ -0,0 +1,120 @@
+from django.core.exceptions import ValidationError
+from django.http import StreamingHttpResponse
+from django.utils.http import content_disposition_header
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.views import APIView
+
+from apps.records.api.serializers import (
+    ExportJobResponseSerializer,
+    NotFoundResponseSerializer,
+)
+from apps.records.api.views.records_views import _LIST_FILTER_PARAMS
+from apps.records.services import JobNotQueued, RecordExportService
+from apps.utils import BaseResponse, IsAnyRole
+from apps.utils.responses import streaming_content
+
+_EXPORT_PARAMS = [
+    OpenApiParameter("export_format", OpenApiTypes.STR, enum=["csv", "ndjson"], description="Output format (default: csv)."),
+] + [param for param in _LIST_FILTER_PARAMS if param.name not in ("page", "page_size", "cursor")]
+
+
+def _export_format(request) -> str:
+    return RecordExportService.validate_format(request.query_params.get('export_format', 'csv'))
+
+
+class RecordExportView(APIView):
+    permission_classes = [IsAnyRole]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Export records",
+        description=(
+            "Streams every record matching the list filters as CSV or NDJSON. Files are "
+            "given as storage keys. Rows are read through a server-side cursor, so the "
+            "export size is not limited by server memory."
+        ),
+        parameters=_EXPORT_PARAMS,
+        responses={
+            (200, "text/csv"): OpenApiTypes.BINARY,
+            (200, "application/x-ndjson"): OpenApiTypes.BINARY,
+            400: NotFoundResponseSerializer,
+        },
+    )
+    def get(self, request):
+        try:
+            export_format = _export_format(request)
+        except ValidationError as e:
+            return BaseResponse.validation_error({'export_format': e.messages})
+        try:
+            records = RecordExportService.filter_records(request.query_params)
+        except ValidationError as e:
+            return BaseResponse.validation_error(e.message_dict)
+
+        response = StreamingHttpResponse(
+            streaming_content(request, RecordExportService.iter_export(records, export_format)),
+            content_type=RecordExportService.content_type(export_format),
+        )
+        response['Content-Disposition'] = content_disposition_header(
+            True, RecordExportService.filename(export_format),
+        )
+        return response
+
+
+class RecordExportJobView(APIView):
+    permission_classes = [IsAnyRole]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Start a background export",
+        description=(
+            "Queues the same export as `GET /records/export/` with the given query "
+            "parameters. The file is written to object storage; poll the job for its "
+            "download link."
+        ),
+        parameters=_EXPORT_PARAMS,
+        request=None,
+        responses={
+            202: ExportJobResponseSerializer,
+            400: NotFoundResponseSerializer,
+            503: NotFoundResponseSerializer,
+        },
+    )
+    def post(self, request):
+        try:
+            export_format = _export_format(request)
+        except ValidationError as e:
+            return BaseResponse.validation_error({'export_format': e.messages})
+        try:
+            job_id = RecordExportService.start_job(request.user.id, request.query_params.urlencode(), export_format)
+        except ValidationError as e:
+            return BaseResponse.validation_error(e.message_dict)
+        except JobNotQueued:
+            return BaseResponse.error(
+                'Export could not be queued; try again later', status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        return BaseResponse.success(
+            data=RecordExportService.get_job(request.user.id, job_id),
+            message='Export queued',
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
+
+class RecordExportJobDetailView(APIView):
+    permission_classes = [IsAnyRole]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Get a background export",
+        responses={
+            200: ExportJobResponseSerializer,
+            404: NotFoundResponseSerializer,
+        },
+    )
+    def get(self, request, job_id):
+        job = RecordExportService.get_job(request.user.id, job_id)
+        if job is None:
+            return BaseResponse.not_found()
+        return BaseResponse.success(data=job)
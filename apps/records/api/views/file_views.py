@@ -0,0 +1,120 @@
+import logging
+import os
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.views import APIView
+
+from apps.records.api.serializers import NotFoundResponseSerializer
+from apps.records.selectors import DataRecordSelector
+from apps.utils import BaseResponse, IsAnyRole
+from apps.utils.conditional import RangeNotSatisfiable, if_range_allows, parse_range
+from apps.utils.responses import streaming_content
+from apps.utils.storage import is_missing_object
+
+logger = logging.getLogger(__name__)
+
+
+class RecordFileView(APIView):
+    permission_classes = [IsAnyRole]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Download a record's file",
+        description=(
+            "Streams the file from object storage. Supports single `Range` requests "
+            "(206), `If-Range`, `If-None-Match`/`If-Modified-Since` (304) and "
+            "`If-Match`/`If-Unmodified-Since` (412). With `redirect=true` the response "
+            "is a 302 to a presigned URL instead."
+        ),
+        parameters=[
+            OpenApiParameter("redirect", OpenApiTypes.BOOL, description="Redirect to a presigned URL instead of proxying the bytes."),
+            OpenApiParameter("Range", OpenApiTypes.STR, location=OpenApiParameter.HEADER, description="Single byte range, e.g. bytes=0-1023."),
+        ],
+        responses={
+            (200, "application/octet-stream"): OpenApiTypes.BINARY,
+            (206, "application/octet-stream"): OpenApiTypes.BINARY,
+            302: None,
+            304: None,
+            404: NotFoundResponseSerializer,
+            412: None,
+            416: None,
+            502: NotFoundResponseSerializer,
+            503: NotFoundResponseSerializer,
+        },
+    )
+    def get(self, request, pk):
+        record = DataRecordSelector.get_record_by_id(pk)
+        if not record or not record.file:
+            return BaseResponse.not_found()
+
+        try:
+            return self._file_response(request, record)
+        except ClientError as e:
+            if is_missing_object(e):
+                return BaseResponse.not_found('File not found in storage')
+            logger.exception("Could not read the file of record %s from storage", pk)
+            return BaseResponse.error('File storage error', status_code=status.HTTP_502_BAD_GATEWAY)
+        except BotoCoreError:
+            logger.exception("File storage unreachable for record %s", pk)
+            return BaseResponse.error(
+                'File storage is unavailable; try again later', status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+    @staticmethod
+    def _file_response(request, record):
+        storage = record.file.storage
+        redirect = request.query_params.get('redirect')
+        use_redirect = settings.RECORDS_FILE_REDIRECT if redirect is None else redirect.lower() == 'true'
+        if use_redirect:
+            return HttpResponseRedirect(storage.presigned_url(record.file.name))
+
+        stat = storage.head(record.file.name)
+        if stat is None:
+            return BaseResponse.not_found('File not found in storage')
+
+        etag = stat['etag']
+        last_modified = int(stat['last_modified'].timestamp()) if stat['last_modified'] else None
+        conditional = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if conditional is not None:
+            if etag:
+                conditional['ETag'] = etag
+            return conditional
+
+        size = stat['size']
+        try:
+            byte_range = parse_range(request.headers.get('Range'), size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+        if byte_range and not if_range_allows(request, etag, last_modified):
+            byte_range = None
+
+        chunk_size = settings.RECORDS_FILE_STREAM_CHUNK_SIZE
+        if byte_range:
+            start, end = byte_range
+            chunks = storage.iter_object(record.file.name, start, end, chunk_size=chunk_size)
+            response = StreamingHttpResponse(streaming_content(request, chunks), status=206)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = end - start + 1
+        else:
+            chunks = storage.iter_object(record.file.name, chunk_size=chunk_size)
+            response = StreamingHttpResponse(streaming_content(request, chunks))
+            response['Content-Length'] = size
+
+        response['Content-Type'] = stat['content_type'] or 'application/octet-stream'
+        filename = record.file_name or os.path.basename(record.file.name)
+        response['Content-Disposition'] = content_disposition_header(True, filename)
+        response['Accept-Ranges'] = 'bytes'
+        if etag:
+            response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
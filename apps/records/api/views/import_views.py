@@ -0,0 +1,118 @@
+from django.core.exceptions import ValidationError
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.views import APIView
+
+from apps.records.api.parsers import RecordImportParser
+from apps.records.api.serializers import (
+    ImportRequestSerializer,
+    ImportJobSerializer,
+    ImportJobResponseSerializer,
+    NotFoundResponseSerializer,
+)
+from apps.records.api.views.records_views import _discard_streamed_files
+from apps.records.services import JobNotQueued, RecordImportService
+from apps.utils import BaseResponse, IsEditorOrAdmin
+
+
+def _not_queued(error: JobNotQueued):
+    return BaseResponse.error(
+        'Import could not be queued; resume it later',
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        errors={'id': str(error)},
+    )
+
+
+class RecordImportView(APIView):
+    permission_classes = [IsEditorOrAdmin]
+    parser_classes = [RecordImportParser]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Import records from a file",
+        description=(
+            "Upload a CSV or NDJSON file with `title`, `description` and `is_active` "
+            "columns. The file is streamed to object storage and imported by a background "
+            "job; poll the job for progress and rejected rows."
+        ),
+        request={"multipart/form-data": ImportRequestSerializer},
+        responses={
+            202: ImportJobResponseSerializer,
+            400: NotFoundResponseSerializer,
+            503: NotFoundResponseSerializer,
+        },
+    )
+    def post(self, request):
+        try:
+            serializer = ImportRequestSerializer(data=request.data)
+            if not serializer.is_valid():
+                _discard_streamed_files(request)
+                return BaseResponse.validation_error(serializer.errors)
+
+            uploaded = serializer.validated_data['file']
+            job = RecordImportService.start_job(
+                getattr(uploaded, 'key', uploaded.name),
+                serializer.validated_data.get('format'),
+                user_id=request.user.id,
+            )
+            return BaseResponse.success(
+                data=ImportJobSerializer(job).data,
+                message='Import queued',
+                status_code=status.HTTP_202_ACCEPTED,
+            )
+
+        except ValidationError as e:
+            _discard_streamed_files(request)
+            return BaseResponse.error(str(e))
+        except JobNotQueued as e:
+            # The upload is kept: the failed job can be resumed once the broker is back.
+            return _not_queued(e)
+
+
+class RecordImportJobView(APIView):
+    permission_classes = [IsEditorOrAdmin]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Get an import job",
+        responses={
+            200: ImportJobResponseSerializer,
+            404: NotFoundResponseSerializer,
+        },
+    )
+    def get(self, request, job_id):
+        job = RecordImportService.get_job(request.user.id, job_id)
+        if job is None:
+            return BaseResponse.not_found()
+        return BaseResponse.success(data=ImportJobSerializer(job).data)
+
+
+class RecordImportResumeView(APIView):
+    permission_classes = [IsEditorOrAdmin]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Resume a failed import job",
+        request=None,
+        responses={
+            202: ImportJobResponseSerializer,
+            400: NotFoundResponseSerializer,
+            404: NotFoundResponseSerializer,
+            503: NotFoundResponseSerializer,
+        },
+    )
+    def post(self, request, job_id):
+        job = RecordImportService.get_job(request.user.id, job_id)
+        if job is None:
+            return BaseResponse.not_found()
+        try:
+            job = RecordImportService.resume_job(job)
+        except ValidationError as e:
+            return BaseResponse.error(e.messages[0])
+        except JobNotQueued as e:
+            return _not_queued(e)
+        return BaseResponse.success(
+            data=ImportJobSerializer(job).data,
+            message='Import resumed',
+            status_code=status.HTTP_202_ACCEPTED,
+        )
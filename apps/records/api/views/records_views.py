@@ -1,28 +1,119 @@
+import time
+
+from django.conf import settings
+from rest_framework.exceptions import NotFound
+from rest_framework.parsers import FormParser, JSONParser
 from rest_framework.views import APIView
 from django.core.exceptions import ValidationError
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 from apps.records.api.serializers import (
     DataRecordSerializer,
+    DataRecordListSerializer,
     RecordResponseSerializer,
     RecordListResponseSerializer,
     NotFoundResponseSerializer,
     DeletedResponseSerializer,
 )
-from apps.records.selectors import DataRecordSelector
-from apps.records.services import DataRecordService
-from apps.utils import BaseResponse, DataRecordFilter, StandardResultsPagination, IsAdmin, IsEditorOrAdmin, IsAnyRole
+from apps.records.api.parsers import RecordFileParser
+from apps.records.models.records_model import DataRecord
+from apps.records.selectors import DataRecordSelector, RecordDetailCache
+from apps.records.services import DataRecordService, RecordNotFound, RecordVersionConflict, RECORD_COUNT_NAMESPACE
+from apps.utils import (
+    BaseResponse,
+    DataRecordFilter,
+    StandardResultsPagination,
+    KeysetCursorPagination,
+    AdaptiveCount,
+    IsAdmin,
+    IsEditorOrAdmin,
+    IsAnyRole,
+    make_etag,
+    is_not_modified,
+    if_match_etags,
+)
+from apps.utils.conditional import digest
+from apps.utils.pagination import get_count_version
+from apps.utils.storage import StreamedUploadedFile
 
 _LIST_FILTER_PARAMS = [
-    OpenApiParameter("search", OpenApiTypes.STR, description="Case-insensitive search in title or description."),
+    OpenApiParameter("search", OpenApiTypes.STR, description="Full-text search in title and description. Every word is prefix-matched; results are ranked by relevance unless ordering is given."),
     OpenApiParameter("is_active", OpenApiTypes.BOOL, description="Filter by active status."),
-    OpenApiParameter("created_at_after", OpenApiTypes.DATE, description="Include records created on or after this date (YYYY-MM-DD)."),
-    OpenApiParameter("created_at_before", OpenApiTypes.DATE, description="Include records created on or before this date (YYYY-MM-DD)."),
+    OpenApiParameter("created_at_after", OpenApiTypes.DATE, description="Include records created on or after this date (YYYY-MM-DD) in the request time zone."),
+    OpenApiParameter("created_at_before", OpenApiTypes.DATE, description="Include records created on or before this date (YYYY-MM-DD) in the request time zone."),
+    OpenApiParameter("created_at_gte", OpenApiTypes.DATETIME, description="Include records created at or after this ISO 8601 datetime."),
+    OpenApiParameter("created_at_lt", OpenApiTypes.DATETIME, description="Include records created before this ISO 8601 datetime."),
+    OpenApiParameter("updated_at_after", OpenApiTypes.DATE, description="Include records updated on or after this date (YYYY-MM-DD) in the request time zone."),
+    OpenApiParameter("updated_at_before", OpenApiTypes.DATE, description="Include records updated on or before this date (YYYY-MM-DD) in the request time zone."),
+    OpenApiParameter("updated_at_gte", OpenApiTypes.DATETIME, description="Include records updated at or after this ISO 8601 datetime."),
+    OpenApiParameter("updated_at_lt", OpenApiTypes.DATETIME, description="Include records updated before this ISO 8601 datetime."),
+    OpenApiParameter("tz", OpenApiTypes.STR, description="IANA time zone for date parameters and naive datetimes (default: server time zone)."),
     OpenApiParameter("ordering", OpenApiTypes.STR, description="Sort field. Options: title, -title, created_at, -created_at, updated_at, -updated_at, is_active, -is_active."),
     OpenApiParameter("page", OpenApiTypes.INT, description="Page number (default: 1)."),
+    OpenApiParameter("cursor", OpenApiTypes.STR, description="Opt-in keyset pagination. Pass an empty value for the first page, then follow the returned next/previous links. Responses omit count/total_pages."),
     OpenApiParameter("page_size", OpenApiTypes.INT, description="Results per page (default: 10, max: 100)."),
 ]
 
+_IF_NONE_MATCH_PARAM = OpenApiParameter(
+    "If-None-Match", OpenApiTypes.STR, location=OpenApiParameter.HEADER,
+    description="ETag from a previous response; returns 304 Not Modified while it is still current.",
+)
+_IF_MATCH_PARAM = OpenApiParameter(
+    "If-Match", OpenApiTypes.STR, location=OpenApiParameter.HEADER,
+    description="ETag of the version being modified; returns 412 Precondition Failed if the record changed since.",
+)
+
+
+def _url_epoch() -> int:
+    """
+    Number of the window that payloads' presigned file URLs were signed in, or 0
+    when URLs are not signed. Served URLs stay valid for at least
+    ``MINIO_PRESIGNED_URL_MIN_VALIDITY`` seconds less the time a payload may sit in the
+    detail cache. ETags include the window, so a 304 never keeps a client on URLs
+    older than that.
+    """
+    storage = DataRecord._meta.get_field('file').storage
+    if not getattr(storage, 'signs_urls', lambda: False)():
+        return 0
+    window = max(settings.MINIO_PRESIGNED_URL_MIN_VALIDITY - settings.RECORDS_DETAIL_CACHE_TIMEOUT, 1)
+    return int(time.time()) // window
+
+
+def _detail_etag(version: int) -> str:
+    return make_etag(version, _url_epoch())
+
+
+def _list_etag(request, records) -> str:
+    # Inserts and updates move max(updated_at); deletes move the count version.
+    last_modified = DataRecordSelector.get_last_modified(records)
+    return make_etag(
+        'l',
+        RecordDetailCache.version_from(last_modified) if last_modified else 0,
+        get_count_version(RECORD_COUNT_NAMESPACE),
+        _url_epoch(),
+        digest(request.get_full_path()),
+    )
+
+
+def _expected_version(request) -> set[int] | None:
+    """
+    Versions an If-Match write may find, read from the detail ETags in the header
+    (the service compares them under its row lock); None when it is unconditional.
+    """
+    etags = if_match_etags(request)
+    if etags is None:
+        return None
+    # Detail ETags start with the quoted version; weak or foreign tags match nothing.
+    versions = (etag[1:-1].split('-')[0] for etag in etags if etag.startswith('"'))
+    return {int(version) for version in versions if version.isdigit()}
+
+
+def _discard_streamed_files(request):
+    """Delete files streamed into storage for a request that did not save them."""
+    for uploaded in request.FILES.values():
+        if isinstance(uploaded, StreamedUploadedFile):
+            uploaded.discard()
+
 
 class RecordListView(APIView):
     permission_classes = [IsAnyRole]
@@ -30,24 +121,41 @@ class RecordListView(APIView):
     @extend_schema(
         tags=["Records"],
         summary="List records",
-        parameters=_LIST_FILTER_PARAMS,
-        responses={200: RecordListResponseSerializer},
+        parameters=_LIST_FILTER_PARAMS + [_IF_NONE_MATCH_PARAM],
+        responses={200: RecordListResponseSerializer, 304: None, 404: NotFoundResponseSerializer},
     )
     def get(self, request):
         try:
             records = DataRecordSelector.get_all_records()
             records = DataRecordFilter().filter_queryset(request, records, self)
 
-            paginator = StandardResultsPagination()
-            page = paginator.paginate_queryset(records, request)
-            serializer = DataRecordSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
+            etag = _list_etag(request, records)
+            if is_not_modified(request, etag):
+                return BaseResponse.not_modified(etag)
+
+            if 'cursor' in request.query_params:
+                paginator = KeysetCursorPagination()
+            else:
+                paginator = StandardResultsPagination(
+                    count_strategy=AdaptiveCount(namespace=RECORD_COUNT_NAMESPACE),
+                )
+            page = paginator.paginate_queryset(DataRecordListSerializer.values(records), request)
+            serializer = DataRecordListSerializer(page)
+            response = paginator.get_paginated_response(serializer.data)
+            response['ETag'] = etag
+            return response
+        except ValidationError as e:
+            return BaseResponse.validation_error(e.message_dict)
+        except NotFound as e:
+            # Invalid cursor or page out of range.
+            return BaseResponse.not_found(str(e.detail))
         except Exception as e:
             return BaseResponse.error(str(e))
 
 
 class RecordCreateView(APIView):
     permission_classes = [IsEditorOrAdmin]
+    parser_classes = [JSONParser, FormParser, RecordFileParser]
 
     @extend_schema(
         tags=["Records"],
@@ -62,6 +170,7 @@ class RecordCreateView(APIView):
         try:
             serializer = DataRecordSerializer(data=request.data)
             if not serializer.is_valid():
+                _discard_streamed_files(request)
                 return BaseResponse.validation_error(serializer.errors)
 
             record = DataRecordService.create_record(
@@ -75,6 +184,7 @@ class RecordCreateView(APIView):
             return BaseResponse.created(data=output_serializer.data)
 
         except ValidationError as e:
+            _discard_streamed_files(request)
             return BaseResponse.error(str(e))
 
 
@@ -84,50 +194,74 @@ class RecordRetrieveView(APIView):
     @extend_schema(
         tags=["Records"],
         summary="Retrieve a record",
+        parameters=[_IF_NONE_MATCH_PARAM],
         responses={
             200: RecordResponseSerializer,
+            304: None,
             404: NotFoundResponseSerializer,
         },
     )
     def get(self, request, pk):
         try:
-            record = DataRecordSelector.get_record_by_id(pk)
-            if not record:
+            if request.headers.get('If-None-Match'):
+                version = RecordDetailCache.get_current_version(pk)
+                if version is None:
+                    return BaseResponse.not_found()
+                if is_not_modified(request, _detail_etag(version)):
+                    return BaseResponse.not_modified(_detail_etag(version))
+
+            entry = RecordDetailCache.get_or_build_entry(pk, lambda record: DataRecordSerializer(record).data)
+            if entry is None:
                 return BaseResponse.not_found()
 
-            serializer = DataRecordSerializer(record)
-            return BaseResponse.success(data=serializer.data)
+            version, data = entry
+            response = BaseResponse.success(data=data)
+            response['ETag'] = _detail_etag(version)
+            return response
         except Exception as e:
             return BaseResponse.error(str(e))
 
 
 class RecordUpdateView(APIView):
     permission_classes = [IsEditorOrAdmin]
+    parser_classes = [JSONParser, FormParser, RecordFileParser]
 
     @extend_schema(
         tags=["Records"],
         summary="Partially update a record",
         request=DataRecordSerializer,
+        parameters=[_IF_MATCH_PARAM],
         responses={
             200: RecordResponseSerializer,
             404: NotFoundResponseSerializer,
+            412: NotFoundResponseSerializer,
         },
     )
     def patch(self, request, pk):
         try:
-            record = DataRecordSelector.get_record_by_id(pk)
-            if not record:
-                return BaseResponse.not_found()
-
             serializer = DataRecordSerializer(data=request.data, partial=True)
             if not serializer.is_valid():
+                _discard_streamed_files(request)
                 return BaseResponse.validation_error(serializer.errors)
 
-            updated_record = DataRecordService.update_record(pk, **serializer.validated_data)
+            updated_record = DataRecordService.update_record(
+                pk,
+                expected_version=_expected_version(request),
+                **serializer.validated_data,
+            )
             output_serializer = DataRecordSerializer(updated_record)
-            return BaseResponse.success(data=output_serializer.data)
+            response = BaseResponse.success(data=output_serializer.data)
+            response['ETag'] = _detail_etag(RecordDetailCache.get_version(updated_record))
+            return response
 
+        except RecordNotFound:
+            _discard_streamed_files(request)
+            return BaseResponse.not_found()
+        except RecordVersionConflict as e:
+            _discard_streamed_files(request)
+            return BaseResponse.precondition_failed(e.message)
         except ValidationError as e:
+            _discard_streamed_files(request)
             return BaseResponse.error(str(e))
 
 
@@ -137,19 +271,21 @@ class RecordDeleteView(APIView):
     @extend_schema(
         tags=["Records"],
         summary="Delete a record",
+        parameters=[_IF_MATCH_PARAM],
         responses={
             204: DeletedResponseSerializer,
             404: NotFoundResponseSerializer,
+            412: NotFoundResponseSerializer,
         },
     )
     def delete(self, request, pk):
         try:
-            record = DataRecordSelector.get_record_by_id(pk)
-            if not record:
-                return BaseResponse.not_found()
-
-            DataRecordService.delete_record(pk)
+            DataRecordService.delete_record(pk, expected_version=_expected_version(request))
             return BaseResponse.deleted()
 
+        except RecordNotFound:
+            return BaseResponse.not_found()
+        except RecordVersionConflict as e:
+            return BaseResponse.precondition_failed(e.message)
         except ValidationError as e:
             return BaseResponse.error(str(e))
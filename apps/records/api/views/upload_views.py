@@ -0,0 +1,86 @@
+from rest_framework.views import APIView
+from django.core.exceptions import ValidationError
+from drf_spectacular.utils import extend_schema
+from apps.records.api.serializers import (
+    DataRecordSerializer,
+    NotFoundResponseSerializer,
+    UploadRequestSerializer,
+    UploadCommitSerializer,
+    UploadTicketResponseSerializer,
+    UploadCommitResponseSerializer,
+)
+from apps.records.services import RecordUploadService
+from apps.utils import BaseResponse, IsEditorOrAdmin
+
+
+class RecordUploadView(APIView):
+    permission_classes = [IsEditorOrAdmin]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Request a direct upload",
+        description=(
+            "Returns a presigned POST for uploading one file straight to object storage. "
+            "Send `fields` plus the file as multipart/form-data to `url`, then commit the "
+            "`upload_token` with the commit endpoint."
+        ),
+        request=UploadRequestSerializer,
+        responses={
+            201: UploadTicketResponseSerializer,
+            400: NotFoundResponseSerializer,
+        },
+    )
+    def post(self, request):
+        try:
+            serializer = UploadRequestSerializer(data=request.data)
+            if not serializer.is_valid():
+                return BaseResponse.validation_error(serializer.errors)
+
+            ticket = RecordUploadService.create_upload(
+                user_id=request.user.id,
+                filename=serializer.validated_data['filename'],
+                size=serializer.validated_data['size'],
+                content_type=serializer.validated_data.get('content_type', ''),
+            )
+            return BaseResponse.created(data=ticket, message='Upload URL created')
+
+        except ValidationError as e:
+            return BaseResponse.error(str(e))
+
+
+class RecordUploadCommitView(APIView):
+    permission_classes = [IsEditorOrAdmin]
+
+    @extend_schema(
+        tags=["Records"],
+        summary="Commit a direct upload",
+        description=(
+            "Verifies that the uploaded object exists and has the declared size, then "
+            "creates a record for it or attaches it to `record`."
+        ),
+        request=UploadCommitSerializer,
+        responses={
+            200: UploadCommitResponseSerializer,
+            201: UploadCommitResponseSerializer,
+            400: NotFoundResponseSerializer,
+        },
+    )
+    def post(self, request):
+        try:
+            serializer = UploadCommitSerializer(data=request.data)
+            if not serializer.is_valid():
+                return BaseResponse.validation_error(serializer.errors)
+
+            fields = dict(serializer.validated_data)
+            record_id = fields.pop('record', None)
+            record = RecordUploadService.commit_upload(
+                request.user.id, fields.pop('upload_token'), record_id=record_id, **fields,
+            )
+
+            output_serializer = DataRecordSerializer(record)
+            if record_id is None:
+                return BaseResponse.created(data=output_serializer.data)
+            return BaseResponse.success(data=output_serializer.data)
+
+        except ValidationError as e:
+            return BaseResponse.error(str(e))
@@ -0,0 +1,61 @@
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from apps.records.models import DataRecord
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the per-page cost of signing record file URLs one at a time with "
+        "MinIOStorage's batched, cached presigned URLs. Signing is local; MinIO is not contacted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100])
+        parser.add_argument("--iterations", type=int, default=50)
+
+    def handle(self, *args, **options):
+        storage = DataRecord._meta.get_field("file").storage
+        if not hasattr(storage, "urls"):
+            raise CommandError("The default storage does not support batched URLs.")
+        if not storage.querystring_auth:
+            raise CommandError("Presigned URLs are disabled (MINIO_PRESIGNED_URLS=False).")
+        page_sizes = options["page_sizes"]
+        iterations = options["iterations"]
+        if iterations < 1 or min(page_sizes) < 1:
+            raise CommandError("--iterations and --page-sizes must be positive.")
+
+        # Build the per-thread resource and the shared client outside the measurement.
+        S3Boto3Storage.url(storage, "records/warm-up")
+        storage.client
+
+        self.stdout.write(f"{'page size':>9}  {'path':<12} {'per page (us)':>14} {'per url (us)':>13}")
+        for page_size in page_sizes:
+            pages = [
+                [f"records/benchmark-{page_size}-{run}-{i}.pdf" for i in range(page_size)]
+                for run in range(iterations)
+            ]
+            try:
+                per_record = self._measure(pages, lambda names: [
+                    S3Boto3Storage.url(storage, name) for name in names
+                ])
+                cold = self._measure(pages, storage.urls)
+                warm = self._measure(pages, storage.urls)
+            finally:
+                expire = storage.querystring_expire
+                cache.delete_many([
+                    storage._url_cache_key(name, expire) for names in pages for name in names
+                ])
+
+            for label, per_page in (("per-record", per_record), ("batch cold", cold), ("batch warm", warm)):
+                self.stdout.write(f"{page_size:>9}  {label:<12} {per_page:>14.1f} {per_page / page_size:>13.1f}")
+
+    @staticmethod
+    def _measure(pages, run) -> float:
+        start = time.perf_counter()
+        for names in pages:
+            run(names)
+        return (time.perf_counter() - start) / len(pages) * 1_000_000
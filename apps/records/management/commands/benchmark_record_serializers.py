@@ -0,0 +1,68 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.records.api.serializers import DataRecordListSerializer, DataRecordSerializer
+from apps.records.models import DataRecord
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the per-row cost of DataRecordSerializer and the .values() fast path "
+        "used by the record list, fetching and serializing one page at a time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100])
+        parser.add_argument("--iterations", type=int, default=200)
+        parser.add_argument(
+            "--with-files",
+            action="store_true",
+            help="Give the generated rows a file so the file URL is part of the measurement.",
+        )
+
+    def handle(self, *args, **options):
+        page_sizes = options["page_sizes"]
+        iterations = options["iterations"]
+        if iterations < 1 or min(page_sizes) < 1:
+            raise CommandError("--iterations and --page-sizes must be positive.")
+
+        # Missing rows are generated inside a transaction that is rolled back.
+        with transaction.atomic():
+            self._ensure_rows(max(page_sizes), options["with_files"])
+            self.stdout.write(f"{'page size':>9}  {'path':<10} {'per row (us)':>13} {'per page (us)':>14}")
+            for page_size in page_sizes:
+                queryset = DataRecord.objects.order_by("-created_at", "-id")
+                model = self._measure(iterations, page_size, lambda: DataRecordSerializer(
+                    list(queryset[:page_size]), many=True,
+                ).data)
+                fast = self._measure(iterations, page_size, lambda: DataRecordListSerializer(
+                    list(DataRecordListSerializer.values(queryset)[:page_size]),
+                ).data)
+                for label, per_row in (("model", model), ("values", fast)):
+                    self.stdout.write(
+                        f"{page_size:>9}  {label:<10} {per_row:>13.1f} {per_row * page_size:>14.1f}"
+                    )
+                self.stdout.write(f"{page_size:>9}  speedup    {model / fast:>13.2f}x")
+            transaction.set_rollback(True)
+
+    def _ensure_rows(self, count, with_files):
+        missing = count - DataRecord.objects.count()
+        if missing > 0:
+            DataRecord.objects.bulk_create(
+                DataRecord(
+                    title=f"Benchmark record {i}",
+                    description="Generated by benchmark_record_serializers",
+                    file=f"records/benchmark-{i}.pdf" if with_files else None,
+                )
+                for i in range(missing)
+            )
+
+    @staticmethod
+    def _measure(iterations, page_size, run) -> float:
+        run()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            run()
+        return (time.perf_counter() - start) / iterations / page_size * 1_000_000
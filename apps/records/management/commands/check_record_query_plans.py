@@ -0,0 +1,109 @@
+import itertools
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.records.models import DataRecord
+from apps.utils.filters import DataRecordFilter
+
+
+FILTER_COMBINATIONS = [
+    {},
+    {"is_active": "true"},
+    {"is_active": "false"},
+    {"created_at_after": "2025-01-01", "created_at_before": "2025-12-31"},
+    {"is_active": "true", "created_at_after": "2025-01-01", "created_at_before": "2025-12-31"},
+    {"updated_at_gte": "2025-06-01T00:00:00Z"},
+    {"is_active": "false", "updated_at_after": "2025-06-01"},
+    {"search": "report"},
+    {"search": "report", "is_active": "true"},
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN every filter/ordering combination DataRecordFilter produces for the "
+        "record list and fail if any plan reads records_datarecord with a sequential scan, "
+        "or walks a whole index only to sort the rows afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=10)
+        parser.add_argument(
+            "--use-statistics",
+            action="store_true",
+            help=(
+                "Plan with the table's real statistics. By default sequential scans are "
+                "disabled for the check, so one only shows up when no index can serve the query. "
+                "Either way, run it against analyzed data: the list indexes are partial, and on an "
+                "empty table the planner may walk any of them instead of the one that fits."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Query plan checks require PostgreSQL.")
+
+        factory = APIRequestFactory()
+        table = DataRecord._meta.db_table
+        orderings = sorted(DataRecordFilter.ALLOWED_ORDERING_FIELDS) + [None]
+        failures = []
+
+        for params, ordering in itertools.product(FILTER_COMBINATIONS, orderings):
+            query_params = dict(params)
+            if ordering:
+                query_params["ordering"] = ordering
+            request = Request(factory.get("/api/records/", query_params))
+            queryset = DataRecordFilter().filter_queryset(request, DataRecord.objects.all(), view=None)
+
+            with transaction.atomic():
+                if not options["use_statistics"]:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SET LOCAL enable_seqscan = off")
+                plan = json.loads(queryset[:options["page_size"]].explain(format="json"))[0]["Plan"]
+
+            nodes = list(self._walk(plan))
+            label = " ".join(f"{key}={value}" for key, value in query_params.items()) or "(no filters)"
+            scans = [node for node in nodes if node.get("Relation Name") == table]
+            indexes = sorted({node["Index Name"] for node in nodes if "Index Name" in node})
+            summary = ", ".join(node["Node Type"] for node in scans)
+            if indexes:
+                summary += f" using {', '.join(indexes)}"
+
+            sorted_afterwards = any(node["Node Type"] == "Sort" for node in nodes)
+            # Bitmap index scans name only the index; the records table is the only one queried.
+            bitmap_scans = [node for node in nodes if node["Node Type"] == "Bitmap Index Scan"]
+            if any(self._is_sequential(node, sorted_afterwards) for node in scans + bitmap_scans):
+                failures.append(label)
+                self.stdout.write(self.style.ERROR(f"SEQ SCAN  {label}: {summary}"))
+            elif sorted_afterwards:
+                self.stdout.write(self.style.WARNING(f"SORT      {label}: {summary}"))
+            else:
+                self.stdout.write(f"OK        {label}: {summary}")
+
+        if failures:
+            raise CommandError(f"{len(failures)} record list queries fall back to a sequential scan.")
+        self.stdout.write(self.style.SUCCESS("Every record list query is served by an index."))
+
+    @staticmethod
+    def _is_sequential(node, sorted_afterwards):
+        if node["Node Type"] == "Seq Scan":
+            return True
+        if node["Node Type"] == "Bitmap Index Scan":
+            # A bitmap over a whole (partial) index reads every live row.
+            return "Index Cond" not in node
+        # With enable_seqscan off the planner walks an arbitrary index end to end
+        # instead; without an index condition or a useful order it is the same scan.
+        return (
+            node["Node Type"] in ("Index Scan", "Index Only Scan")
+            and "Index Cond" not in node
+            and sorted_afterwards
+        )
+
+    def _walk(self, node):
+        yield node
+        for child in node.get("Plans", []):
+            yield from self._walk(child)
@@ -0,0 +1,53 @@
+import os
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.records.models import RecordImportJob
+from apps.records.services import RecordImportService
+
+
+class Command(BaseCommand):
+    help = (
+        "Import records from a local CSV or NDJSON file in batches. "
+        "Progress is committed per batch; rerun with --resume JOB_ID after a failure."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", nargs="?", help="Path to a .csv, .ndjson or .jsonl file.")
+        parser.add_argument("--format", choices=RecordImportJob.Format.values, help="Override the format detected from the extension.")
+        parser.add_argument("--resume", metavar="JOB_ID", help="Continue a failed import after its last committed row.")
+        parser.add_argument("--batch-size", type=int, help="Rows per batch (default: RECORDS_IMPORT_BATCH_SIZE).")
+
+    def handle(self, *args, **options):
+        if options["resume"]:
+            job = RecordImportJob.objects.filter(pk=options["resume"]).first()
+            if job is None:
+                raise CommandError(f"Import job {options['resume']} does not exist")
+        elif options["source"]:
+            if not os.path.isfile(options["source"]):
+                raise CommandError(f"{options['source']} is not a file")
+            try:
+                job = RecordImportService.create_job(
+                    os.path.abspath(options["source"]), options["format"], local=True,
+                )
+            except ValidationError as e:
+                raise CommandError(e.messages[0])
+        else:
+            raise CommandError("Pass a source file or --resume JOB_ID")
+
+        self.stdout.write(f"Import job {job.pk}")
+        try:
+            job = RecordImportService.run(job.pk, on_progress=self._progress, batch_size=options["batch_size"])
+        except Exception as e:
+            job.refresh_from_db()
+            raise CommandError(f"Import failed after {job.rows_processed} rows: {e}. Resume with --resume {job.pk}")
+
+        for rejected in job.rejected:
+            self.stdout.write(self.style.WARNING(f"Row {rejected['row']}: {rejected['message']}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {job.rows_created} of {job.rows_processed} rows ({job.rows_rejected} rejected)."
+        ))
+
+    def _progress(self, job):
+        self.stdout.write(f"Processed {job.rows_processed} rows ({job.rows_created} created, {job.rows_rejected} rejected)")
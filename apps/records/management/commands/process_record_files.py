@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from apps.records.models import DataRecord
+from apps.records.services import RecordFileProcessingService
+from apps.records.tasks import process_record_file
+
+
+class Command(BaseCommand):
+    help = (
+        "Extract checksum, size, MIME type, text and thumbnails for record files. "
+        "Only files that were never processed or failed are touched unless --all is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Reprocess every file.")
+        parser.add_argument("--enqueue", action="store_true", help="Queue a task per record instead of processing here.")
+
+    def handle(self, *args, **options):
+        queryset = DataRecord.objects.exclude(file="").exclude(file__isnull=True).order_by("pk")
+        if not options["all"]:
+            queryset = queryset.exclude(file_status=DataRecord.FileStatus.COMPLETED)
+
+        total = failed = 0
+        for record_id in queryset.values_list("pk", flat=True).iterator():
+            total += 1
+            if options["enqueue"]:
+                process_record_file.delay(record_id)
+                continue
+            try:
+                RecordFileProcessingService.process(record_id)
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"Record {record_id}: {e}")
+
+        verb = "Queued" if options["enqueue"] else "Processed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {total} files ({failed} failed)."))
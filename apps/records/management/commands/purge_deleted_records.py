@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from apps.records.services import RecordPurgeService
+from apps.records.tasks import purge_deleted_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Hard-delete records that were soft-deleted more than RECORDS_PURGE_AFTER seconds ago, "
+        "in small throttled batches. Run it off-peak, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than", type=int, default=None, help="Seconds since deletion (default: RECORDS_PURGE_AFTER).")
+        parser.add_argument("--batch-size", type=int, default=None, help="Rows per transaction (default: RECORDS_PURGE_BATCH_SIZE).")
+        parser.add_argument("--pause", type=float, default=None, help="Seconds between batches (default: RECORDS_PURGE_PAUSE).")
+        parser.add_argument("--time-limit", type=float, default=None, help="Stop starting batches after this many seconds.")
+        parser.add_argument("--enqueue", action="store_true", help="Run the purge on the heavy queue with the default settings.")
+
+    def handle(self, *args, **options):
+        if options["enqueue"]:
+            purge_deleted_records.delay()
+            self.stdout.write(self.style.SUCCESS("Queued the purge."))
+            return
+
+        purged = RecordPurgeService.purge(
+            older_than=options["older_than"],
+            batch_size=options["batch_size"],
+            pause=options["pause"],
+            time_limit=options["time_limit"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} deleted records."))
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.records.models import DataRecord
+from apps.records.models.records_queryset import build_search_vector
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill DataRecord.search_vector in primary-key batches. "
+        "Only rows without a vector are touched unless --all is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--all", action="store_true", help="Rebuild every row, not just missing vectors.")
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between batches.")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = DataRecord.objects.order_by("pk")
+        if not options["all"]:
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        last_pk = 0
+        total = 0
+        while True:
+            pks = list(queryset.filter(pk__gt=last_pk).values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+
+            # Each batch is its own short UPDATE so locks and WAL stay bounded.
+            total += DataRecord.objects.filter(pk__gte=pks[0], pk__lte=pks[-1]).filter(
+                pk__in=pks
+            ).update(search_vector=build_search_vector())
+            last_pk = pks[-1]
+            self.stdout.write(f"Indexed {total} records (last id {last_pk})")
+
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Search vectors rebuilt for {total} records."))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from apps.records.services import ObjectCleanupService
+from apps.records.tasks import delete_stored_objects
+
+
+class Command(BaseCommand):
+    help = (
+        "List record files and thumbnails in the bucket and queue the ones no record "
+        "or blob refers to for deletion, along with expired export files and import "
+        "sources, then delete everything queued."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only print the stray keys.")
+        parser.add_argument(
+            "--min-age", type=int, default=None,
+            help="Ignore record objects younger than this many seconds (default: RECORDS_ORPHAN_MIN_AGE).",
+        )
+        parser.add_argument("--enqueue", action="store_true", help="Queue the deletion instead of deleting here.")
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            found = 0
+            for strays in ObjectCleanupService.find_unused(min_age=options["min_age"]):
+                found += len(strays)
+                for key in strays:
+                    self.stdout.write(key)
+            self.stdout.write(self.style.SUCCESS(f"Found {found} stray objects."))
+            return
+
+        found = ObjectCleanupService.reconcile(min_age=options["min_age"])
+        if options["enqueue"]:
+            delete_stored_objects.delay()
+            self.stdout.write(self.style.SUCCESS(f"Queued {found} stray objects for deletion."))
+            return
+        deleted = ObjectCleanupService.purge()
+        self.stdout.write(self.style.SUCCESS(f"Found {found} stray objects; deleted {deleted} queued objects."))
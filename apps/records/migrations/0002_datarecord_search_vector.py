@@ -0,0 +1,42 @@
+# Generated by Django 5.2.11 on 2026-10-18 14:03
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+CREATE_TRIGGER = """
+CREATE FUNCTION records_datarecord_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER records_datarecord_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON records_datarecord
+    FOR EACH ROW EXECUTE FUNCTION records_datarecord_search_vector_update();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS records_datarecord_search_vector_trigger ON records_datarecord;
+DROP FUNCTION IF EXISTS records_datarecord_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("records", "0001_initial"),
+    ]
+
+    operations = [
+        # Nullable without a default, so adding the column does not rewrite the table.
+        # Existing rows are filled by `manage.py rebuild_search_vectors`.
+        migrations.AddField(
+            model_name="datarecord",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
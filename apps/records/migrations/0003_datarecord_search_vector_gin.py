@@ -0,0 +1,23 @@
+# Generated by Django 5.2.11 on 2026-10-18 14:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("records", "0002_datarecord_search_vector"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="records_search_vector_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.11 on 2026-10-18 14:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("records", "0003_datarecord_search_vector_gin"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(fields=["created_at", "id"], name="records_created_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(
+                fields=["is_active", "created_at", "id"], name="records_active_created_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(
+                fields=["updated_at", "created_at", "id"], name="records_updated_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(
+                fields=["is_active", "updated_at", "created_at", "id"],
+                name="records_active_updated_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(fields=["title", "created_at", "id"], name="records_title_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(
+                fields=["is_active", "title", "created_at", "id"], name="records_active_title_idx"
+            ),
+        ),
+    ]
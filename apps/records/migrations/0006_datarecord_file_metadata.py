@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:46
+
+from django.db import migrations, models
+
+# Extracted file text joins the search vector with the lowest weight.
+UPDATE_TRIGGER = """
+CREATE OR REPLACE FUNCTION records_datarecord_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.file_text, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER records_datarecord_search_vector_trigger ON records_datarecord;
+CREATE TRIGGER records_datarecord_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, file_text ON records_datarecord
+    FOR EACH ROW EXECUTE FUNCTION records_datarecord_search_vector_update();
+"""
+
+RESTORE_TRIGGER = """
+CREATE OR REPLACE FUNCTION records_datarecord_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER records_datarecord_search_vector_trigger ON records_datarecord;
+CREATE TRIGGER records_datarecord_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON records_datarecord
+    FOR EACH ROW EXECUTE FUNCTION records_datarecord_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('records', '0005_recordimportjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datarecord',
+            name='file_checksum',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='datarecord',
+            name='file_mime_type',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='datarecord',
+            name='file_size',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='datarecord',
+            name='file_status',
+            field=models.CharField(blank=True, choices=[('', 'No file'), ('pending', 'Pending'), ('completed', 'Completed'), ('failed', 'Failed')], editable=False, max_length=20),
+        ),
+        migrations.AddField(
+            model_name='datarecord',
+            name='file_text',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='datarecord',
+            name='thumbnail',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='thumbnails/'),
+        ),
+        migrations.RunSQL(UPDATE_TRIGGER, RESTORE_TRIGGER),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:52
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("records", "0007_fileblob"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(fields=["file"], name="records_file_idx"),
+        ),
+    ]
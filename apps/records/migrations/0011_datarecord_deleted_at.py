@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('records', '0010_datarecord_thumbnail_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datarecord',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
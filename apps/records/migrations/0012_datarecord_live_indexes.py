@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+LIVE = models.Q(("deleted_at__isnull", True))
+
+
+class Migration(migrations.Migration):
+    """Swap the list indexes for partial ones over live rows; the new ones are built before the old ones go."""
+
+    atomic = False
+
+    dependencies = [
+        ("records", "0011_datarecord_deleted_at"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=django.contrib.postgres.indexes.GinIndex(
+                condition=LIVE, fields=["search_vector"], name="records_search_live_gin"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(condition=LIVE, fields=["created_at", "id"], name="records_created_live_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(
+                condition=LIVE, fields=["is_active", "created_at", "id"], name="records_act_created_live_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(
+                condition=LIVE, fields=["updated_at", "created_at", "id"], name="records_updated_live_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(
+                condition=LIVE,
+                fields=["is_active", "updated_at", "created_at", "id"],
+                name="records_act_updated_live_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(condition=LIVE, fields=["title", "created_at", "id"], name="records_title_live_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(
+                condition=LIVE, fields=["is_active", "title", "created_at", "id"], name="records_act_title_live_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="datarecord",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)), fields=["deleted_at"], name="records_deleted_idx"
+            ),
+        ),
+        RemoveIndexConcurrently(model_name="datarecord", name="records_search_vector_gin"),
+        RemoveIndexConcurrently(model_name="datarecord", name="records_created_idx"),
+        RemoveIndexConcurrently(model_name="datarecord", name="records_active_created_idx"),
+        RemoveIndexConcurrently(model_name="datarecord", name="records_updated_idx"),
+        RemoveIndexConcurrently(model_name="datarecord", name="records_active_updated_idx"),
+        RemoveIndexConcurrently(model_name="datarecord", name="records_title_idx"),
+        RemoveIndexConcurrently(model_name="datarecord", name="records_active_title_idx"),
+    ]
@@ -1,3 +1,6 @@
 from apps.records.models.records_model import DataRecord
+from apps.records.models.import_job_model import RecordImportJob
+from apps.records.models.file_blob_model import FileBlob
+from apps.records.models.object_deletion_model import StoredObjectDeletion
 
-__all__ = ['DataRecord']
+__all__ = ['DataRecord', 'RecordImportJob', 'FileBlob', 'StoredObjectDeletion']
@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class FileBlob(models.Model):
+    """
+    One stored object per distinct file content. Records with identical files
+    point their ``file`` at the same ``key``; ``ref_count`` counts them, and a blob
+    whose count drops to zero is deleted together with its object.
+    """
+
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    # The key the content was first stored under; DataRecord.file holds the same value.
+    key = models.CharField(max_length=100, unique=True)
+    size = models.BigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['created_at'], condition=models.Q(ref_count=0), name='records_blob_unreferenced_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return self.key
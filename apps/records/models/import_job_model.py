@@ -0,0 +1,46 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+
+class RecordImportJob(models.Model):
+    """
+    Progress of one bulk import. ``rows_processed`` counts source rows whose
+    outcome is committed, so a failed job resumes right after them.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending'
+        RUNNING = 'running'
+        COMPLETED = 'completed'
+        FAILED = 'failed'
+
+    class Format(models.TextChoices):
+        CSV = 'csv'
+        NDJSON = 'ndjson'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name='+',
+    )
+    # An object key in the records storage, or a server path for command-line imports.
+    source = models.CharField(max_length=500)
+    source_is_local = models.BooleanField(default=False)
+    format = models.CharField(max_length=10, choices=Format.choices)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    rows_processed = models.PositiveBigIntegerField(default=0)
+    rows_created = models.PositiveBigIntegerField(default=0)
+    rows_rejected = models.PositiveBigIntegerField(default=0)
+    # The first RECORDS_IMPORT_MAX_REPORTED_ERRORS rejected rows: {"row": n, "message": ...}.
+    rejected = models.JSONField(default=list, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Import {self.id} ({self.status})"
@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class StoredObjectDeletion(models.Model):
+    """
+    A storage key queued for deletion. Rows are written in the transaction that
+    stops using the key, so a rolled-back write never loses its object; the
+    ``delete_stored_objects`` task deletes the objects in batches afterwards.
+    """
+
+    key = models.CharField(max_length=255, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    def __str__(self):
+        return self.key
@@ -1,17 +1,68 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
+from apps.records.models.records_queryset import DataRecordQuerySet, LiveDataRecordManager
+
+_LIVE = models.Q(deleted_at__isnull=True)
+
 
 class DataRecord(models.Model):
+    class FileStatus(models.TextChoices):
+        NONE = '', 'No file'
+        PENDING = 'pending', 'Pending'
+        COMPLETED = 'completed', 'Completed'
+        FAILED = 'failed', 'Failed'
+
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     file = models.FileField(upload_to='records/', blank=True, null=True)
+    # Name the file was uploaded as; ``file`` may point at a blob first stored under another name.
+    file_name = models.CharField(max_length=255, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
+    # Filled in the background by RecordFileProcessingService whenever the file changes.
+    file_status = models.CharField(max_length=20, choices=FileStatus.choices, blank=True, editable=False)
+    file_size = models.BigIntegerField(null=True, blank=True, editable=False)
+    file_checksum = models.CharField(max_length=64, blank=True, editable=False)
+    file_mime_type = models.CharField(max_length=100, blank=True, editable=False)
+    file_text = models.TextField(blank=True, editable=False)
+    thumbnail = models.ImageField(upload_to='thumbnails/', blank=True, null=True, editable=False)
+    # Maintained by a database trigger from title, description and file_text; see
+    # migrations 0002 and 0006.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Set by deletes; RecordPurgeService removes the row (and releases its files) later.
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # ``objects`` hides soft-deleted rows; ``all_objects`` is for code that must
+    # see them too (file references, the purger).
+    objects = LiveDataRecordManager()
+    all_objects = DataRecordQuerySet.as_manager()
 
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = "Data Records"
+        # One B-tree per ordering DataRecordFilter emits (field + created_at, id
+        # tiebreakers), alone and behind the is_active filter. B-trees scan both
+        # ways, so each covers the ascending and descending variant. List indexes
+        # cover live rows only, matching the default manager's filter.
+        indexes = [
+            GinIndex(fields=['search_vector'], name='records_search_live_gin', condition=_LIVE),
+            models.Index(fields=['created_at', 'id'], name='records_created_live_idx', condition=_LIVE),
+            models.Index(fields=['is_active', 'created_at', 'id'], name='records_act_created_live_idx', condition=_LIVE),
+            models.Index(fields=['updated_at', 'created_at', 'id'], name='records_updated_live_idx', condition=_LIVE),
+            models.Index(
+                fields=['is_active', 'updated_at', 'created_at', 'id'], name='records_act_updated_live_idx', condition=_LIVE,
+            ),
+            models.Index(fields=['title', 'created_at', 'id'], name='records_title_live_idx', condition=_LIVE),
+            models.Index(fields=['is_active', 'title', 'created_at', 'id'], name='records_act_title_live_idx', condition=_LIVE),
+            # Purge candidates.
+            models.Index(fields=['deleted_at'], name='records_deleted_idx', condition=models.Q(deleted_at__isnull=False)),
+            # Reference lookups by object key (upload commits, blob adoption, cleanup).
+            models.Index(fields=['file'], name='records_file_idx'),
+            models.Index(fields=['thumbnail'], name='records_thumbnail_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,73 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections, models, transaction
+from django.db.models import sql
+from django.db.models.functions import Cast, Now
+
+SEARCH_CONFIG = 'english'
+
+_SEARCH_TOKEN = re.compile(r'[^\W_]+')
+
+
+def build_search_vector():
+    """Expression for ``DataRecord.search_vector``; mirrors the database trigger."""
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector('description', weight='B', config=SEARCH_CONFIG)
+        + SearchVector('file_text', weight='C', config=SEARCH_CONFIG)
+    )
+
+
+def build_search_query(text: str) -> SearchQuery | None:
+    """Prefix-match every word of ``text``: ``"ann rep"`` -> ``ann:* & rep:*``."""
+    tokens = _SEARCH_TOKEN.findall(text)
+    if not tokens:
+        return None
+    raw = ' & '.join(f'{token}:*' for token in tokens)
+    return SearchQuery(raw, search_type='raw', config=SEARCH_CONFIG)
+
+
+class DataRecordQuerySet(models.QuerySet):
+
+    def update_returning(self, **kwargs) -> list:
+        """
+        ``update()`` that hands back the updated rows: one ``UPDATE ... RETURNING``
+        statement, so there is no read before the write and nothing to race.
+        Like ``update()``, it sets only the given columns and skips ``auto_now``.
+        """
+        query = self.query.chain(sql.UpdateQuery)
+        query.add_update_values(kwargs)
+        query.clear_select_clause()
+        update_sql, params = query.get_compiler(self.db).as_sql()
+
+        fields = self.model._meta.concrete_fields
+        quote = connections[self.db].ops.quote_name
+        table = quote(self.model._meta.db_table)
+        returning = ', '.join(f'{table}.{quote(field.column)}' for field in fields)
+        with transaction.mark_for_rollback_on_error(using=self.db), connections[self.db].cursor() as cursor:
+            cursor.execute(f'{update_sql} RETURNING {returning}', params)
+            rows = cursor.fetchall()
+        attnames = [field.attname for field in fields]
+        return [self.model.from_db(self.db, attnames, row) for row in rows]
+
+    def soft_delete(self) -> int:
+        """Mark the live records in this queryset deleted; returns how many were."""
+        return self.filter(deleted_at__isnull=True).update(deleted_at=Now())
+
+    def search(self, text: str):
+        query = build_search_query(text)
+        if query is None:
+            return self.annotate(search_rank=models.Value(0.0, models.FloatField())).none()
+        # ts_rank() returns real; widen it so the value round-trips exactly through
+        # Python floats, which keyset cursors compare against.
+        return self.filter(search_vector=query).annotate(
+            search_rank=Cast(SearchRank(models.F('search_vector'), query), models.FloatField()),
+        )
+
+
+class LiveDataRecordManager(models.Manager.from_queryset(DataRecordQuerySet)):
+    """Default manager: records that have not been soft-deleted."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
@@ -1,3 +1,4 @@
 from apps.records.selectors.records_selector import DataRecordSelector
+from apps.records.selectors.record_cache import RecordDetailCache
 
-__all__ = ['DataRecordSelector']
+__all__ = ['DataRecordSelector', 'RecordDetailCache']
@@ -0,0 +1,230 @@
+import asyncio
+import time
+import uuid
+from typing import Callable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.records.models.records_model import DataRecord
+from apps.records.selectors.records_selector import DataRecordSelector
+
+
+class RecordDetailCache:
+    """
+    Read-through cache of serialized record payloads.
+
+    ``records:detail:<id>`` points at the record's current version (its
+    ``updated_at`` in microseconds) and the payload lives under
+    ``records:detail:<id>:<version>``. Writers drop the pointer via invalidate(),
+    which also moves the record's generation. A reader sets the pointer only if
+    none is present, and drops it again if the generation moved while it loaded
+    the record, so a reader holding an older row cannot restore it after an
+    invalidation. On a miss only one caller rebuilds the entry; the others wait
+    briefly for it instead of all hitting the database at once.
+
+    The ``a``-prefixed methods are the async equivalents used by the async views.
+    """
+
+    POLL_INTERVAL = 0.025
+
+    @staticmethod
+    def _pointer_key(record_id) -> str:
+        return f'records:detail:{record_id}'
+
+    @staticmethod
+    def _payload_key(record_id, version) -> str:
+        return f'records:detail:{record_id}:{version}'
+
+    @staticmethod
+    def _lock_key(record_id) -> str:
+        return f'records:detail:{record_id}:lock'
+
+    @staticmethod
+    def _generation_key(record_id) -> str:
+        return f'records:detail:{record_id}:generation'
+
+    @staticmethod
+    def version_from(updated_at) -> int:
+        return int(updated_at.timestamp() * 1_000_000)
+
+    @classmethod
+    def get_version(cls, record: DataRecord) -> int:
+        return cls.version_from(record.updated_at)
+
+    @classmethod
+    def get_cached_version(cls, record_id: int) -> int | None:
+        return cache.get(cls._pointer_key(record_id))
+
+    @classmethod
+    def get_current_version(cls, record_id: int) -> int | None:
+        """Version of the record without loading it; None if it does not exist."""
+        version = cls.get_cached_version(record_id)
+        if version is not None:
+            return version
+        updated_at = DataRecordSelector.get_record_updated_at(record_id)
+        return None if updated_at is None else cls.version_from(updated_at)
+
+    @classmethod
+    async def aget_current_version(cls, record_id: int) -> int | None:
+        version = await cache.aget(cls._pointer_key(record_id))
+        if version is not None:
+            return version
+        updated_at = await DataRecordSelector.aget_record_updated_at(record_id)
+        return None if updated_at is None else cls.version_from(updated_at)
+
+    @classmethod
+    def get(cls, record_id: int) -> dict | None:
+        entry = cls._get_entry(record_id)
+        return None if entry is None else entry[1]
+
+    @classmethod
+    def _get_entry(cls, record_id: int) -> tuple[int, dict] | None:
+        version = cls.get_cached_version(record_id)
+        if version is None:
+            return None
+        payload = cache.get(cls._payload_key(record_id, version))
+        return None if payload is None else (version, payload)
+
+    @classmethod
+    async def _aget_entry(cls, record_id: int) -> tuple[int, dict] | None:
+        version = await cache.aget(cls._pointer_key(record_id))
+        if version is None:
+            return None
+        payload = await cache.aget(cls._payload_key(record_id, version))
+        return None if payload is None else (version, payload)
+
+    @classmethod
+    def get_generation(cls, record_id: int) -> str:
+        """Token that changes on every invalidate(); read it before loading the record."""
+        return cache.get(cls._generation_key(record_id), '')
+
+    @classmethod
+    async def aget_generation(cls, record_id: int) -> str:
+        return await cache.aget(cls._generation_key(record_id), '')
+
+    @classmethod
+    def set(cls, record: DataRecord, payload: dict, generation: str | None = None) -> None:
+        """
+        Cache ``payload`` for ``record``. ``generation`` is get_generation() from
+        before the record was loaded; if the record was invalidated since, the
+        pointer is dropped again.
+        """
+        version = cls.get_version(record)
+        timeout = settings.RECORDS_DETAIL_CACHE_TIMEOUT
+        cache.set(cls._payload_key(record.pk, version), payload, timeout=timeout)
+        cache.add(cls._pointer_key(record.pk), version, timeout=timeout)
+        if generation is not None and cls.get_generation(record.pk) != generation:
+            cache.delete(cls._pointer_key(record.pk))
+
+    @classmethod
+    async def aset(cls, record: DataRecord, payload: dict, generation: str | None = None) -> None:
+        version = cls.get_version(record)
+        timeout = settings.RECORDS_DETAIL_CACHE_TIMEOUT
+        await cache.aset(cls._payload_key(record.pk, version), payload, timeout=timeout)
+        await cache.aadd(cls._pointer_key(record.pk), version, timeout=timeout)
+        if generation is not None and await cls.aget_generation(record.pk) != generation:
+            await cache.adelete(cls._pointer_key(record.pk))
+
+    @classmethod
+    def invalidate(cls, record_ids) -> None:
+        record_ids = list(record_ids)
+        if not record_ids:
+            return
+        # The generation moves before the pointer goes: a reader that set the
+        # pointer after this delete sees the new generation and drops it again.
+        token = uuid.uuid4().hex
+        cache.set_many(
+            {cls._generation_key(record_id): token for record_id in record_ids},
+            timeout=settings.RECORDS_DETAIL_CACHE_TIMEOUT,
+        )
+        cache.delete_many([cls._pointer_key(record_id) for record_id in record_ids])
+
+    @classmethod
+    def get_or_build(cls, record_id: int, serialize: Callable[[DataRecord], dict]) -> dict | None:
+        entry = cls.get_or_build_entry(record_id, serialize)
+        return None if entry is None else entry[1]
+
+    @classmethod
+    def get_or_build_entry(
+        cls, record_id: int, serialize: Callable[[DataRecord], dict]
+    ) -> tuple[int, dict] | None:
+        """Return ``(version, payload)`` for the record, or None if it does not exist."""
+        entry = cls._get_entry(record_id)
+        if entry is not None:
+            return entry
+
+        lock_key = cls._lock_key(record_id)
+        token = uuid.uuid4().hex
+        if not cache.add(lock_key, token, timeout=settings.RECORDS_DETAIL_CACHE_LOCK_TIMEOUT):
+            entry = cls._wait_for(record_id)
+            if entry is not None:
+                return entry
+            # The rebuilding caller is slow or gone; serve this request directly.
+            token = None
+
+        try:
+            generation = cls.get_generation(record_id)
+            record = DataRecordSelector.get_record_by_id(record_id)
+            if record is None:
+                return None
+            payload = serialize(record)
+            cls.set(record, payload, generation)
+            return cls.get_version(record), payload
+        finally:
+            if token is not None and cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    @classmethod
+    async def aget_or_build_entry(
+        cls, record_id: int, serialize: Callable[[DataRecord], dict]
+    ) -> tuple[int, dict] | None:
+        """Async get_or_build_entry(). ``serialize`` is sync and runs in a worker thread."""
+        entry = await cls._aget_entry(record_id)
+        if entry is not None:
+            return entry
+
+        lock_key = cls._lock_key(record_id)
+        token = uuid.uuid4().hex
+        if not await cache.aadd(lock_key, token, timeout=settings.RECORDS_DETAIL_CACHE_LOCK_TIMEOUT):
+            entry = await cls._await_entry(record_id)
+            if entry is not None:
+                return entry
+            token = None
+
+        try:
+            generation = await cls.aget_generation(record_id)
+            record = await DataRecordSelector.aget_record_by_id(record_id)
+            if record is None:
+                return None
+            payload = await sync_to_async(serialize)(record)
+            await cls.aset(record, payload, generation)
+            return cls.get_version(record), payload
+        finally:
+            if token is not None and await cache.aget(lock_key) == token:
+                await cache.adelete(lock_key)
+
+    @classmethod
+    def _wait_for(cls, record_id: int) -> tuple[int, dict] | None:
+        deadline = time.monotonic() + settings.RECORDS_DETAIL_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(cls.POLL_INTERVAL)
+            entry = cls._get_entry(record_id)
+            if entry is not None:
+                return entry
+            if cache.get(cls._lock_key(record_id)) is None:
+                return None
+        return None
+
+    @classmethod
+    async def _await_entry(cls, record_id: int) -> tuple[int, dict] | None:
+        deadline = time.monotonic() + settings.RECORDS_DETAIL_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(cls.POLL_INTERVAL)
+            entry = await cls._aget_entry(record_id)
+            if entry is not None:
+                return entry
+            if await cache.aget(cls._lock_key(record_id)) is None:
+                return None
+        return None
@@ -1,4 +1,4 @@
-from django.db.models import QuerySet
+from django.db.models import Max, QuerySet
 from apps.records.models.records_model import DataRecord
 
 
@@ -23,13 +23,34 @@ class DataRecordSelector:
         except DataRecord.DoesNotExist:
             return None
 
+    @staticmethod
+    async def aget_record_by_id(record_id: int) -> DataRecord | None:
+        try:
+            return await DataRecord.objects.aget(id=record_id)
+        except DataRecord.DoesNotExist:
+            return None
+
+    @staticmethod
+    def get_record_updated_at(record_id: int):
+        return DataRecord.objects.filter(id=record_id).values_list('updated_at', flat=True).first()
+
+    @staticmethod
+    async def aget_record_updated_at(record_id: int):
+        return await DataRecord.objects.filter(id=record_id).values_list('updated_at', flat=True).afirst()
+
+    @staticmethod
+    def get_last_modified(queryset: QuerySet):
+        """Latest ``updated_at`` in a (filtered) queryset, served from the updated_at indexes."""
+        return queryset.order_by().aggregate(last_modified=Max('updated_at'))['last_modified']
+
+    @staticmethod
+    async def aget_last_modified(queryset: QuerySet):
+        result = await queryset.order_by().aaggregate(last_modified=Max('updated_at'))
+        return result['last_modified']
+
     @staticmethod
     def search_records(query: str) -> QuerySet:
-        return DataRecord.objects.filter(
-            title__icontains=query
-        ) | DataRecord.objects.filter(
-            description__icontains=query
-        )
+        return DataRecord.objects.search(query).order_by('-search_rank', '-created_at', '-id')
 
     @staticmethod
     def get_records_by_activity_status(is_active: bool) -> QuerySet:
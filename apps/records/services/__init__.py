@@ -1,3 +1,13 @@
-from apps.records.services.records_service import DataRecordService
+from apps.records.services.object_cleanup_service import ObjectCleanupService
+from apps.records.services.blob_service import FileBlobService
+from apps.records.services.records_service import (
+    DataRecordService, JobNotQueued, RecordNotFound, RecordVersionConflict, RECORD_COUNT_NAMESPACE,
+)
+from apps.records.services.upload_service import RecordUploadService
+from apps.records.services.bulk_service import RecordBulkService
+from apps.records.services.export_service import RecordExportService
+from apps.records.services.import_service import RecordImportService
+from apps.records.services.file_processing_service import RecordFileProcessingService
+from apps.records.services.purge_service import RecordPurgeService
 
-__all__ = ['DataRecordService']
+__all__ = ['DataRecordService', 'RecordUploadService', 'RecordBulkService', 'RecordExportService', 'RecordImportService', 'RecordFileProcessingService', 'RecordPurgeService', 'FileBlobService', 'ObjectCleanupService', 'JobNotQueued', 'RecordNotFound', 'RecordVersionConflict', 'RECORD_COUNT_NAMESPACE']
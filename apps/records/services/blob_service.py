@@ -0,0 +1,139 @@
+import logging
+from collections import Counter, defaultdict
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from apps.records.models import DataRecord, FileBlob
+from apps.records.services.object_cleanup_service import ObjectCleanupService
+from apps.utils.storage import StreamedUploadedFile
+from dms_system.celery import enqueue_on_commit
+
+logger = logging.getLogger(__name__)
+
+
+class FileBlobService:
+    """
+    Content-addressed record files.
+
+    ``FileBlob`` maps a SHA-256 to the one object holding that content and counts
+    the records pointing at it. Streamed uploads are hashed on the way in and
+    skip storage when the content is already there; direct uploads and files
+    saved before blobs existed are hashed by the file-processing task and adopted
+    then. Taking and dropping references happens in the transaction that writes
+    the record; blobs left without references are collected after commit.
+    """
+
+    @staticmethod
+    def find_key(sha256: str) -> str | None:
+        """Key of a referenced object with this content, if there is one."""
+        return FileBlob.objects.filter(pk=sha256, ref_count__gt=0).values_list('key', flat=True).first()
+
+    @staticmethod
+    def acquire(file):
+        """
+        Count a new reference to ``file`` and return what to assign to the
+        record's FileField: the shared key for content that is already stored.
+        """
+        if isinstance(file, StreamedUploadedFile):
+            if file.sha256:
+                return FileBlobService._acquire_content(file)
+            file = file.key
+        if isinstance(file, str) and file:
+            FileBlob.objects.filter(key=file).update(ref_count=F('ref_count') + 1)
+        return file
+
+    @staticmethod
+    def _acquire_content(file: StreamedUploadedFile) -> str:
+        blob, created = FileBlob.objects.get_or_create(
+            sha256=file.sha256, defaults={'key': file.key, 'size': file.size, 'ref_count': 1},
+        )
+        if created:
+            if file.deduplicated:
+                # The matched blob was collected before this transaction; nothing holds the content.
+                raise ValidationError("The uploaded file is no longer available; upload it again")
+            return file.key
+        if FileBlob.objects.filter(pk=blob.pk, key=blob.key).update(ref_count=F('ref_count') + 1):
+            if not file.deduplicated and blob.key != file.key:
+                # A concurrent upload stored the same content first; drop this copy.
+                ObjectCleanupService.schedule([file.key])
+            return blob.key
+
+        # The blob was collected after the upload matched it.
+        if file.deduplicated:
+            raise ValidationError("The uploaded file is no longer available; upload it again")
+        FileBlob.objects.create(sha256=file.sha256, key=file.key, size=file.size, ref_count=1)
+        return file.key
+
+    @staticmethod
+    def release(keys) -> None:
+        """
+        Drop one reference per key (repeat a key to drop several). Blobs left
+        unreferenced, and keys without a blob that no record uses, are collected
+        after commit.
+        """
+        counts = Counter(key for key in keys if key)
+        if not counts:
+            return
+        by_count = defaultdict(list)
+        for key, count in counts.items():
+            by_count[count].append(key)
+        for count, group in by_count.items():
+            FileBlob.objects.filter(key__in=group).update(ref_count=Greatest(F('ref_count') - count, 0))
+
+        from apps.records.tasks import collect_file_blobs
+
+        enqueue_on_commit(collect_file_blobs, list(counts))
+
+    @staticmethod
+    def collect(keys=None) -> int:
+        """
+        Drop unreferenced blobs (only those with ``keys``, if given) and queue their
+        objects for deletion. Given ``keys`` that have no blob, e.g. files replaced
+        before processing adopted them, are queued too unless a record uses them.
+        """
+        queryset = FileBlob.objects.filter(ref_count=0)
+        if keys is not None:
+            keys = list(dict.fromkeys(key for key in keys if key))
+            queryset = queryset.filter(key__in=keys)
+
+        with transaction.atomic():
+            # Rows being referenced right now are locked by that transaction; skip them.
+            blobs = list(queryset.select_for_update(skip_locked=True).values_list('key', flat=True))
+            candidates = set(blobs)
+            if keys is not None:
+                tracked = FileBlob.objects.filter(key__in=keys).values_list('key', flat=True)
+                candidates.update(set(keys).difference(tracked))
+            referenced = set(DataRecord.all_objects.filter(file__in=list(candidates)).values_list('file', flat=True))
+            if stale := referenced.intersection(blobs):
+                logger.warning("Not collecting %d blobs that records still point at", len(stale))
+            doomed = [key for key in candidates if key not in referenced]
+            FileBlob.objects.filter(key__in=doomed).delete()
+            ObjectCleanupService.schedule(doomed)
+        return len(doomed)
+
+    @staticmethod
+    def adopt(name: str, sha256: str, size: int) -> tuple[str, list[int]]:
+        """
+        Register an already stored file by its content. If another object has
+        the same content, every record on ``name`` moves to it and ``name`` is
+        deleted. Returns the key now in use and the IDs of the moved records.
+        """
+        with transaction.atomic():
+            blob = FileBlob.objects.select_for_update().filter(pk=sha256).first()
+            if blob is None:
+                if not FileBlob.objects.filter(key=name).exists():
+                    references = DataRecord.all_objects.filter(file=name).count()
+                    FileBlob.objects.create(sha256=sha256, key=name, size=size, ref_count=references)
+                return name, []
+            if blob.key == name:
+                return name, []
+
+            moved = list(DataRecord.all_objects.select_for_update().filter(file=name).values_list('pk', flat=True))
+            DataRecord.all_objects.filter(pk__in=moved).update(file=blob.key, updated_at=timezone.now())
+            FileBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + len(moved))
+            ObjectCleanupService.schedule([name])
+            return blob.key, moved
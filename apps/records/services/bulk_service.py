@@ -0,0 +1,166 @@
+import logging
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from apps.records.models.records_model import DataRecord
+from apps.records.services.records_service import _invalidate, _validate_title
+
+logger = logging.getLogger(__name__)
+
+BULK_UPDATE_FIELDS = ('title', 'description', 'is_active')
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _failed(index: int, message: str, record_id: int | None = None) -> dict:
+    result = {'index': index, 'status': 'error', 'message': message}
+    if record_id is not None:
+        result['id'] = record_id
+    return result
+
+
+class RecordBulkService:
+    """
+    Create, update and delete many records per call.
+
+    Items are written ``RECORDS_BULK_CHUNK_SIZE`` at a time, one transaction and
+    one ``bulk_create``/``bulk_update``/``DELETE`` per chunk. A chunk that fails
+    is rolled back and reported item by item while the other chunks still apply;
+    the database error is logged and its items get a generic message.
+    Every method returns one result per input item, in input order.
+    """
+
+    @staticmethod
+    def create_records(items: list[dict]) -> list[dict]:
+        results = [None] * len(items)
+        pending = []
+        for index, item in enumerate(items):
+            try:
+                _validate_title(item.get('title'))
+            except ValidationError as e:
+                results[index] = _failed(index, e.messages[0])
+                continue
+            description = item.get('description')
+            pending.append((index, DataRecord(
+                title=item['title'].strip(),
+                description=description.strip() if description else "",
+                is_active=item.get('is_active', True),
+            )))
+
+        created = False
+        for chunk in _chunks(pending, settings.RECORDS_BULK_CHUNK_SIZE):
+            try:
+                with transaction.atomic():
+                    DataRecord.objects.bulk_create([record for _, record in chunk])
+            except DatabaseError:
+                logger.exception("Bulk create of %d records failed", len(chunk))
+                for index, _ in chunk:
+                    results[index] = _failed(index, "Could not save record")
+                continue
+            created = True
+            for index, record in chunk:
+                results[index] = {'index': index, 'status': 'created', 'id': record.pk}
+
+        if created:
+            _invalidate()
+        return results
+
+    @staticmethod
+    def update_records(items: list[dict]) -> list[dict]:
+        """Apply partial updates; each item holds an ``id`` and the fields to change."""
+        results = [None] * len(items)
+        pending = []
+        seen = set()
+        for index, item in enumerate(items):
+            record_id = item['id']
+            if record_id in seen:
+                results[index] = _failed(index, "Duplicate record ID", record_id)
+                continue
+            seen.add(record_id)
+            changes = {field: item[field] for field in BULK_UPDATE_FIELDS if field in item}
+            try:
+                if 'title' in changes:
+                    _validate_title(changes['title'])
+                    changes['title'] = changes['title'].strip()
+            except ValidationError as e:
+                results[index] = _failed(index, e.messages[0], record_id)
+                continue
+            if 'description' in changes:
+                changes['description'] = changes['description'].strip() if changes['description'] else ""
+            pending.append((index, record_id, changes))
+
+        updated_ids = []
+        for chunk in _chunks(pending, settings.RECORDS_BULK_CHUNK_SIZE):
+            try:
+                with transaction.atomic():
+                    records = DataRecord.objects.select_for_update().in_bulk([record_id for _, record_id, _ in chunk])
+                    now = timezone.now()
+                    fields = {'updated_at'}
+                    changed = []
+                    for index, record_id, changes in chunk:
+                        record = records.get(record_id)
+                        if record is None:
+                            continue
+                        for field, value in changes.items():
+                            setattr(record, field, value)
+                        # bulk_update() skips auto_now; versions and ETags depend on it.
+                        record.updated_at = now
+                        fields.update(changes)
+                        changed.append(record)
+                    DataRecord.objects.bulk_update(changed, sorted(fields))
+            except DatabaseError:
+                logger.exception("Bulk update of %d records failed", len(chunk))
+                for index, record_id, _ in chunk:
+                    results[index] = _failed(index, "Could not save record", record_id)
+                continue
+            for index, record_id, _ in chunk:
+                if record_id in records:
+                    results[index] = {'index': index, 'status': 'updated', 'id': record_id}
+                    updated_ids.append(record_id)
+                else:
+                    results[index] = {'index': index, 'status': 'not_found', 'id': record_id}
+
+        if updated_ids:
+            _invalidate(updated_ids)
+        return results
+
+    @staticmethod
+    def delete_records(record_ids: list[int]) -> list[dict]:
+        results = [None] * len(record_ids)
+        pending = []
+        seen = set()
+        for index, record_id in enumerate(record_ids):
+            if record_id in seen:
+                results[index] = _failed(index, "Duplicate record ID", record_id)
+                continue
+            seen.add(record_id)
+            pending.append((index, record_id))
+
+        deleted_ids = []
+        for chunk in _chunks(pending, settings.RECORDS_BULK_CHUNK_SIZE):
+            ids = [record_id for _, record_id in chunk]
+            try:
+                with transaction.atomic():
+                    existing = set(
+                        DataRecord.objects.select_for_update().filter(id__in=ids).values_list('id', flat=True)
+                    )
+                    DataRecord.objects.filter(id__in=existing).soft_delete()
+            except DatabaseError:
+                logger.exception("Bulk delete of %d records failed", len(chunk))
+                for index, record_id in chunk:
+                    results[index] = _failed(index, "Could not delete record", record_id)
+                continue
+            for index, record_id in chunk:
+                status = 'deleted' if record_id in existing else 'not_found'
+                results[index] = {'index': index, 'status': status, 'id': record_id}
+            deleted_ids.extend(existing)
+
+        if deleted_ids:
+            _invalidate(deleted_ids)
+        return results
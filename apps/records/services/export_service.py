@@ -0,0 +1,165 @@
+import csv
+import io
+import json
+import logging
+import tempfile
+import uuid
+from itertools import islice
+from types import SimpleNamespace
+from typing import Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.http import QueryDict
+from django.utils import timezone
+
+from apps.records.api.serializers import DataRecordListSerializer
+from apps.records.models.records_model import DataRecord
+from apps.records.selectors.records_selector import DataRecordSelector
+from apps.records.services.records_service import JobNotQueued
+from apps.utils import DataRecordFilter
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def _encode_csv(rows: list[dict], header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(DataRecordListSerializer.fields)
+    writer.writerows(row.values() for row in rows)
+    return buffer.getvalue().encode()
+
+
+def _encode_ndjson(rows: list[dict], header: bool) -> bytes:
+    return ''.join(json.dumps(row, cls=DjangoJSONEncoder) + '\n' for row in rows).encode()
+
+
+_ENCODERS = {'csv': _encode_csv, 'ndjson': _encode_ndjson}
+
+EXPORT_FAILED = 'Export failed'
+EXPORT_NOT_QUEUED = 'Export could not be queued'
+
+
+class RecordExportService:
+    """
+    Export every record matching a DataRecordFilter query as CSV or NDJSON.
+
+    Rows are read through a server-side cursor ``RECORDS_EXPORT_CHUNK_SIZE`` at a
+    time and encoded chunk by chunk, so memory stays flat however many rows
+    match. Files are exported as their storage key, not as a presigned URL that
+    would expire. Large exports run as a background job that uploads the file
+    to object storage; the job's state lives in the cache.
+    """
+
+    @staticmethod
+    def filter_records(query_params) -> QuerySet:
+        """Records matching list-endpoint query params; raises ValidationError on bad filters."""
+        request = SimpleNamespace(query_params=query_params)
+        return DataRecordFilter().filter_queryset(request, DataRecordSelector.get_all_records(), None)
+
+    @staticmethod
+    def validate_format(export_format: str) -> str:
+        if export_format not in EXPORT_CONTENT_TYPES:
+            raise ValidationError(f"Unsupported export format '{export_format}'; use one of: {', '.join(EXPORT_CONTENT_TYPES)}")
+        return export_format
+
+    @staticmethod
+    def content_type(export_format: str) -> str:
+        return EXPORT_CONTENT_TYPES[export_format]
+
+    @staticmethod
+    def filename(export_format: str) -> str:
+        return f"records-{timezone.now():%Y%m%d-%H%M%S}.{export_format}"
+
+    @staticmethod
+    def iter_export(queryset: QuerySet, export_format: str) -> Iterator[bytes]:
+        chunk_size = settings.RECORDS_EXPORT_CHUNK_SIZE
+        encode = _ENCODERS[RecordExportService.validate_format(export_format)]
+        rows = DataRecordListSerializer.values(queryset).iterator(chunk_size=chunk_size)
+
+        header = True
+        while chunk := list(islice(rows, chunk_size)):
+            yield encode(DataRecordListSerializer(chunk, file_urls=False).data, header)
+            header = False
+        if header:
+            yield encode([], header)
+
+    # Background jobs
+
+    @staticmethod
+    def _job_key(job_id: str) -> str:
+        return f'records:export:{job_id}'
+
+    @staticmethod
+    def _storage():
+        return DataRecord._meta.get_field('file').storage
+
+    @staticmethod
+    def _set_job(job_id: str, **state) -> None:
+        cache.set(RecordExportService._job_key(job_id), state, timeout=settings.RECORDS_EXPORT_JOB_TIMEOUT)
+
+    @staticmethod
+    def start_job(user_id: int, query_string: str, export_format: str) -> str:
+        """Validate the filters and queue an export; return the job ID."""
+        from apps.records.tasks import export_records
+
+        RecordExportService.validate_format(export_format)
+        RecordExportService.filter_records(QueryDict(query_string))
+        job_id = uuid.uuid4().hex
+        RecordExportService._set_job(job_id, status='pending', user=user_id, format=export_format)
+        try:
+            export_records.delay(job_id, user_id, query_string, export_format)
+        except Exception as e:
+            logger.exception("Could not queue record export %s", job_id)
+            RecordExportService._set_job(
+                job_id, status='failed', user=user_id, format=export_format, error=EXPORT_NOT_QUEUED,
+            )
+            raise JobNotQueued(job_id) from e
+        return job_id
+
+    @staticmethod
+    def run_job(job_id: str, user_id: int, query_string: str, export_format: str) -> str:
+        """Write the export to object storage and return its key."""
+        RecordExportService._set_job(job_id, status='running', user=user_id, format=export_format)
+        try:
+            queryset = RecordExportService.filter_records(QueryDict(query_string))
+            with tempfile.TemporaryFile() as spool:
+                for chunk in RecordExportService.iter_export(queryset, export_format):
+                    spool.write(chunk)
+                spool.seek(0)
+                name = f"exports/{job_id}/{RecordExportService.filename(export_format)}"
+                key = RecordExportService._storage().save(name, File(spool, name=name))
+        except Exception:
+            logger.exception("Record export %s failed", job_id)
+            # The details stay in the log; the job status is shown to clients.
+            RecordExportService._set_job(
+                job_id, status='failed', user=user_id, format=export_format, error=EXPORT_FAILED,
+            )
+            raise
+        RecordExportService._set_job(job_id, status='completed', user=user_id, format=export_format, key=key)
+        return key
+
+    @staticmethod
+    def get_job(user_id: int, job_id: str) -> dict | None:
+        """State of one of the user's export jobs, with a download URL once it completed."""
+        state = cache.get(RecordExportService._job_key(job_id))
+        if state is None or state['user'] != user_id:
+            return None
+        job = {'id': job_id, 'status': state['status'], 'format': state['format']}
+        if state['status'] == 'completed':
+            storage = RecordExportService._storage()
+            sign = getattr(storage, 'presigned_url', storage.url)
+            job['download_url'] = sign(state['key'])
+        elif state['status'] == 'failed':
+            job['error'] = state['error']
+        return job
@@ -0,0 +1,199 @@
+import hashlib
+import io
+import logging
+import mimetypes
+import tempfile
+from contextlib import closing
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from apps.records.models.records_model import DataRecord
+from apps.records.services.blob_service import FileBlobService
+from apps.records.services.object_cleanup_service import ObjectCleanupService
+from apps.records.services.records_service import _invalidate
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 256 * 1024
+
+# Magic numbers checked before falling back to the file name.
+_SIGNATURES = (
+    (b'%PDF-', 'application/pdf'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'BM', 'image/bmp'),
+    (b'II*\x00', 'image/tiff'),
+    (b'MM\x00*', 'image/tiff'),
+    (b'\x1f\x8b', 'application/gzip'),
+)
+_TEXT_TYPES = {'application/json', 'application/xml', 'application/x-ndjson', 'application/csv'}
+_THUMBNAIL_TYPES = {'image/png', 'image/jpeg', 'image/gif', 'image/bmp', 'image/tiff', 'image/webp'}
+
+
+def _is_utf8(head: bytes) -> bool:
+    if b'\x00' in head:
+        return False
+    try:
+        head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the end of the sample is fine.
+        return e.start >= len(head) - 3
+    return True
+
+
+def _is_text(mime_type: str) -> bool:
+    return mime_type.startswith('text/') or mime_type in _TEXT_TYPES
+
+
+def detect_mime_type(head: bytes, name: str) -> str:
+    """MIME type from the first bytes of a file, falling back to its name."""
+    for signature, mime_type in _SIGNATURES:
+        if head.startswith(signature):
+            return mime_type
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+
+    guessed = mimetypes.guess_type(name)[0]
+    if head and _is_utf8(head):
+        return guessed if guessed and _is_text(guessed) else 'text/plain'
+    return guessed or 'application/octet-stream'
+
+
+def _make_thumbnail(spool) -> tuple[bytes, str] | None:
+    size = settings.RECORDS_THUMBNAIL_SIZE
+    try:
+        with Image.open(spool) as image:
+            image.draft('RGB', (size, size))
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((size, size))
+            has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+            out = io.BytesIO()
+            if has_alpha:
+                image.save(out, 'PNG', optimize=True)
+                return out.getvalue(), 'png'
+            image.save(out, 'JPEG', quality=85, optimize=True)
+            return out.getvalue(), 'jpg'
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError, ValueError):
+        logger.warning("Could not build a thumbnail", exc_info=True)
+        return None
+
+
+class RecordFileProcessingService:
+    """
+    Background metadata extraction for record files.
+
+    The file is read once as a stream: every chunk feeds the SHA-256 checksum and
+    the size, the first bytes decide the MIME type, and only what is needed after
+    that is kept: the first ``RECORDS_FILE_TEXT_MAX_BYTES`` of text files for
+    search, or a temporary copy of images up to ``RECORDS_THUMBNAIL_MAX_BYTES``
+    for the thumbnail. Results are written only if the record still points at
+    the same file.
+    """
+
+    @staticmethod
+    def _storage():
+        return DataRecord._meta.get_field('file').storage
+
+    @staticmethod
+    def _thumbnail_storage():
+        return DataRecord._meta.get_field('thumbnail').storage
+
+    @staticmethod
+    def _open(name: str):
+        storage = RecordFileProcessingService._storage()
+        if hasattr(storage, 'open_stream'):
+            return storage.open_stream(name)
+        return storage.open(name, 'rb')
+
+    @staticmethod
+    def process(record_id: int) -> DataRecord | None:
+        """Fill in the file metadata of a record; returns None if the record or its file changed."""
+        record = DataRecord.objects.filter(pk=record_id).only('id', 'file', 'thumbnail').first()
+        if record is None:
+            return None
+        name = record.file.name
+        old_thumbnail = record.thumbnail.name
+        if not name and not old_thumbnail:
+            return record
+
+        thumbnail_storage = RecordFileProcessingService._thumbnail_storage()
+        metadata = {'thumbnail': None}
+        if name:
+            try:
+                metadata = RecordFileProcessingService._extract(name)
+                if metadata['thumbnail'] is not None:
+                    content, extension = metadata['thumbnail']
+                    metadata['thumbnail'] = thumbnail_storage.save(
+                        f"thumbnails/{record_id}/{metadata['file_checksum'][:32]}.{extension}", ContentFile(content),
+                    )
+                metadata['file_status'] = DataRecord.FileStatus.COMPLETED
+            except Exception:
+                logger.exception("Processing file %s of record %s failed", name, record_id)
+                DataRecord.objects.filter(pk=record_id, file=name).update(file_status=DataRecord.FileStatus.FAILED)
+                raise
+
+        # The file may have been replaced while it was being read; the newer
+        # file's own task fills these fields in.
+        updated = DataRecord.objects.filter(pk=record_id, file=name).update(updated_at=timezone.now(), **metadata)
+        if not updated:
+            ObjectCleanupService.schedule([metadata['thumbnail']])
+            return None
+
+        if old_thumbnail != metadata['thumbnail']:
+            ObjectCleanupService.schedule([old_thumbnail])
+
+        moved = []
+        if name:
+            # Files that did not stream through the API are deduplicated here.
+            _, moved = FileBlobService.adopt(name, metadata['file_checksum'], metadata['file_size'])
+        _invalidate([record_id, *moved])
+        return DataRecord.objects.get(pk=record_id)
+
+    @staticmethod
+    def _extract(name: str) -> dict:
+        hasher = hashlib.sha256()
+        size = 0
+        mime_type = None
+        text = bytearray()
+        text_limit = settings.RECORDS_FILE_TEXT_MAX_BYTES
+        spool = None
+        try:
+            with closing(RecordFileProcessingService._open(name)) as stream:
+                while chunk := stream.read(_CHUNK_SIZE):
+                    if mime_type is None:
+                        mime_type = detect_mime_type(chunk[:4096], name)
+                        if mime_type in _THUMBNAIL_TYPES:
+                            spool = tempfile.TemporaryFile()
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    if spool is not None:
+                        if size > settings.RECORDS_THUMBNAIL_MAX_BYTES:
+                            spool.close()
+                            spool = None
+                        else:
+                            spool.write(chunk)
+                    if _is_text(mime_type) and len(text) < text_limit:
+                        text += chunk[:text_limit - len(text)]
+
+            thumbnail = None
+            if spool is not None:
+                spool.seek(0)
+                thumbnail = _make_thumbnail(spool)
+        finally:
+            if spool is not None:
+                spool.close()
+
+        return {
+            'file_size': size,
+            'file_checksum': hasher.hexdigest(),
+            'file_mime_type': mime_type or 'application/octet-stream',
+            # PostgreSQL text cannot hold NUL characters.
+            'file_text': text.decode('utf-8', errors='ignore').replace('\x00', ''),
+            'thumbnail': thumbnail,
+        }
@@ -0,0 +1,284 @@
+import codecs
+import csv
+import json
+import logging
+import os
+import uuid
+from contextlib import closing
+from itertools import islice
+from typing import Callable, Iterator
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+from apps.records.models import DataRecord, RecordImportJob
+from apps.records.services.bulk_service import RecordBulkService
+from apps.records.services.object_cleanup_service import ObjectCleanupService
+from apps.records.services.records_service import JobNotQueued
+
+logger = logging.getLogger(__name__)
+
+IMPORT_NOT_QUEUED = 'Import could not be queued; resume it to try again'
+
+_TRUE = {'1', 'true', 't', 'yes', 'y'}
+_FALSE = {'0', 'false', 'f', 'no', 'n'}
+_EXTENSIONS = {'.csv': 'csv', '.ndjson': 'ndjson', '.jsonl': 'ndjson'}
+
+
+_READ_SIZE = 64 * 1024
+
+
+def _iter_lines(stream) -> Iterator[bytes]:
+    """Lines of a binary stream with their endings, read in chunks."""
+    pending = b''
+    while chunk := stream.read(_READ_SIZE):
+        pending += chunk
+        start = 0
+        while (end := pending.find(b'\n', start)) != -1:
+            yield pending[start:end + 1]
+            start = end + 1
+        pending = pending[start:]
+    if pending:
+        yield pending
+
+
+class _DecodedLines:
+    """
+    UTF-8 lines of a stream, minus a leading BOM. A line that is not valid UTF-8
+    is decoded with replacement characters and sets ``invalid``, so the reader
+    can reject the row it belongs to instead of failing the whole job.
+    """
+
+    def __init__(self, stream):
+        self.invalid = False
+        self._lines = _iter_lines(stream)
+
+    def __iter__(self) -> Iterator[str]:
+        for index, line in enumerate(self._lines):
+            if index == 0:
+                line = line.removeprefix(codecs.BOM_UTF8)
+            try:
+                yield line.decode('utf-8')
+            except UnicodeDecodeError:
+                self.invalid = True
+                yield line.decode('utf-8', errors='replace')
+
+
+def _iter_csv(stream) -> Iterator:
+    # Rows are rejected one by one, and always at the same position, so resuming
+    # with islice skips exactly the rows already committed.
+    csv.field_size_limit(settings.RECORDS_IMPORT_MAX_FIELD_SIZE)
+    lines = _DecodedLines(stream)
+    reader = csv.DictReader(lines)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            row = ValidationError(f"Invalid CSV: {e}")
+        if lines.invalid:
+            lines.invalid = False
+            row = ValidationError("Row is not valid UTF-8")
+        yield row
+
+
+def _iter_ndjson(stream) -> Iterator:
+    lines = _DecodedLines(stream)
+    for line in lines:
+        if not line.strip():
+            continue
+        if lines.invalid:
+            lines.invalid = False
+            yield ValidationError("Row is not valid UTF-8")
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield ValidationError("Invalid JSON")
+
+
+_READERS = {'csv': _iter_csv, 'ndjson': _iter_ndjson}
+
+
+def _clean_row(row) -> dict:
+    if isinstance(row, ValidationError):
+        raise row
+    if not isinstance(row, dict):
+        raise ValidationError("Row must be an object")
+
+    title = row.get('title')
+    description = row.get('description')
+    is_active = row.get('is_active')
+    if isinstance(is_active, str) and is_active.strip().lower() in _TRUE | _FALSE:
+        is_active = is_active.strip().lower() in _TRUE
+    elif is_active in (None, ''):
+        is_active = True
+    elif not isinstance(is_active, bool):
+        raise ValidationError("is_active must be true or false")
+
+    return {
+        'title': title if title is None else str(title),
+        'description': '' if description is None else str(description),
+        'is_active': is_active,
+    }
+
+
+class RecordImportService:
+    """
+    Load large CSV or NDJSON datasets into DataRecord.
+
+    The source is read as a stream, ``RECORDS_IMPORT_BATCH_SIZE`` rows at a time.
+    Rows are checked with the same rules as ``DataRecordService.create_record`` and
+    the valid ones go through ``RecordBulkService.create_records``. Each batch and
+    the job's progress commit together, so a failed job can resume after the last
+    committed row. Rejected rows are counted and the first ones are kept for the report.
+    """
+
+    @staticmethod
+    def _storage():
+        return DataRecord._meta.get_field('file').storage
+
+    @staticmethod
+    def build_key(filename: str) -> str:
+        name = get_valid_filename(os.path.basename(filename or '')) or 'import'
+        return f"imports/{uuid.uuid4().hex}/{name[:100]}"
+
+    @staticmethod
+    def detect_format(filename: str, import_format: str | None = None) -> str:
+        import_format = import_format or _EXTENSIONS.get(os.path.splitext(filename or '')[1].lower())
+        if import_format not in RecordImportJob.Format.values:
+            raise ValidationError("Unknown import format; pass csv or ndjson")
+        return import_format
+
+    @staticmethod
+    def create_job(source: str, import_format: str, user_id: int | None = None, local: bool = False) -> RecordImportJob:
+        return RecordImportJob.objects.create(
+            source=source,
+            source_is_local=local,
+            format=RecordImportService.detect_format(source, import_format),
+            created_by_id=user_id,
+        )
+
+    @staticmethod
+    def _queue(job: RecordImportJob) -> None:
+        """
+        Send the import task once the job row commits. If the broker refuses it the
+        job is marked failed, so it can be resumed, and JobNotQueued is raised when
+        the commit has already happened (i.e. outside an outer transaction).
+        """
+        from apps.records.tasks import import_records
+
+        def send():
+            try:
+                import_records.delay(str(job.pk))
+            except Exception:
+                logger.exception("Could not queue record import %s", job.pk)
+                job.status = RecordImportJob.Status.FAILED
+                job.error = IMPORT_NOT_QUEUED
+                job.save(update_fields=['status', 'error', 'updated_at'])
+
+        transaction.on_commit(send)
+
+    @staticmethod
+    def start_job(source: str, import_format: str | None, user_id: int) -> RecordImportJob:
+        """Create a job for an object already in storage and queue it."""
+        job = RecordImportService.create_job(source, import_format, user_id=user_id)
+        RecordImportService._queue(job)
+        if job.status == RecordImportJob.Status.FAILED:
+            raise JobNotQueued(job.pk)
+        return job
+
+    @staticmethod
+    def resume_job(job: RecordImportJob) -> RecordImportJob:
+        """Queue a failed job again; it continues after its last committed row."""
+        if job.status != RecordImportJob.Status.FAILED:
+            raise ValidationError("Only failed imports can be resumed")
+        job.status = RecordImportJob.Status.PENDING
+        job.save(update_fields=['status', 'updated_at'])
+        RecordImportService._queue(job)
+        if job.status == RecordImportJob.Status.FAILED:
+            raise JobNotQueued(job.pk)
+        return job
+
+    @staticmethod
+    def get_job(user_id: int, job_id) -> RecordImportJob | None:
+        return RecordImportJob.objects.filter(pk=job_id, created_by_id=user_id).first()
+
+    @staticmethod
+    def _open_source(job: RecordImportJob):
+        if job.source_is_local:
+            return open(job.source, 'rb')
+        storage = RecordImportService._storage()
+        if hasattr(storage, 'open_stream'):
+            return storage.open_stream(job.source)
+        return storage.open(job.source, 'rb')
+
+    @staticmethod
+    def run(
+        job_id,
+        on_progress: Callable[[RecordImportJob], None] | None = None,
+        batch_size: int | None = None,
+    ) -> RecordImportJob:
+        """Import (or resume) a job; ``on_progress`` is called after every committed batch."""
+        batch_size = batch_size or settings.RECORDS_IMPORT_BATCH_SIZE
+        job = RecordImportJob.objects.get(pk=job_id)
+        if job.status == RecordImportJob.Status.COMPLETED:
+            return job
+
+        job.status = RecordImportJob.Status.RUNNING
+        job.error = ''
+        job.save(update_fields=['status', 'error', 'updated_at'])
+        try:
+            with closing(RecordImportService._open_source(job)) as stream:
+                rows = islice(_READERS[job.format](stream), job.rows_processed, None)
+                numbered = enumerate(rows, start=job.rows_processed + 1)
+                while batch := list(islice(numbered, batch_size)):
+                    RecordImportService._import_batch(job, batch)
+                    if on_progress is not None:
+                        on_progress(job)
+        except Exception as e:
+            logger.exception("Record import %s failed after %d rows", job.pk, job.rows_processed)
+            job.status = RecordImportJob.Status.FAILED
+            job.error = str(e)
+            job.save(update_fields=['status', 'error', 'updated_at'])
+            raise
+
+        with transaction.atomic():
+            job.status = RecordImportJob.Status.COMPLETED
+            job.finished_at = timezone.now()
+            job.save(update_fields=['status', 'finished_at', 'updated_at'])
+            # A completed job never reads its source again.
+            if not job.source_is_local:
+                ObjectCleanupService.schedule([job.source])
+        return job
+
+    @staticmethod
+    def _import_batch(job: RecordImportJob, batch: list[tuple[int, object]]) -> None:
+        items, numbers, rejected = [], [], []
+        for number, row in batch:
+            try:
+                items.append(_clean_row(row))
+                numbers.append(number)
+            except ValidationError as e:
+                rejected.append({'row': number, 'message': e.messages[0]})
+
+        created = 0
+        with transaction.atomic():
+            results = RecordBulkService.create_records(items) if items else []
+            for number, result in zip(numbers, results):
+                if result['status'] == 'created':
+                    created += 1
+                else:
+                    rejected.append({'row': number, 'message': result['message']})
+
+            rejected.sort(key=lambda entry: entry['row'])
+            room = settings.RECORDS_IMPORT_MAX_REPORTED_ERRORS - len(job.rejected)
+            job.rejected.extend(rejected[:max(room, 0)])
+            job.rows_processed += len(batch)
+            job.rows_created += created
+            job.rows_rejected += len(rejected)
+            job.save(update_fields=['rows_processed', 'rows_created', 'rows_rejected', 'rejected', 'updated_at'])
@@ -0,0 +1,190 @@
+import logging
+import os
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Callable, Iterator
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.records.models import DataRecord, FileBlob, RecordImportJob, StoredObjectDeletion
+from dms_system.celery import enqueue_on_commit
+
+logger = logging.getLogger(__name__)
+
+# Everything stored under these prefixes belongs to a record's file or thumbnail.
+RECORD_OBJECT_PREFIXES = ('records/', 'thumbnails/')
+# Files written by export jobs and import sources streamed in by the API.
+EXPORT_OBJECT_PREFIX = 'exports/'
+IMPORT_OBJECT_PREFIX = 'imports/'
+
+
+def _iter_objects(storage, prefix: str) -> Iterator[tuple[str, datetime]]:
+    if hasattr(storage, 'iter_objects'):
+        yield from storage.iter_objects(prefix)
+        return
+    try:
+        directories, files = storage.listdir(prefix)
+    except FileNotFoundError:
+        return
+    for name in files:
+        path = os.path.join(prefix, name)
+        yield path, storage.get_modified_time(path)
+    for directory in directories:
+        yield from _iter_objects(storage, f"{os.path.join(prefix, directory)}/")
+
+
+def _delete_objects(storage, keys: list[str]) -> dict:
+    if hasattr(storage, 'delete_many'):
+        return storage.delete_many(keys)
+    errors = {}
+    for key in keys:
+        try:
+            storage.delete(key)
+        except Exception as e:
+            errors[key] = str(e)
+    return errors
+
+
+class ObjectCleanupService:
+    """
+    Deferred deletion of stored record objects.
+
+    Writes that stop using a key (deleted records, replaced thumbnails, collected
+    blobs, duplicate copies) queue it with ``schedule`` in their own transaction.
+    After commit, ``delete_stored_objects`` drains the queue with one
+    ``DeleteObjects`` request per ``RECORDS_OBJECT_DELETE_BATCH_SIZE`` keys, and
+    skips any key that is in use again by then. ``reconcile`` finds objects
+    nothing ever queued, e.g. left behind by a crashed worker, and export and
+    import files past their age limit, by listing the bucket.
+    """
+
+    @staticmethod
+    def _storage():
+        return DataRecord._meta.get_field('file').storage
+
+    @staticmethod
+    def schedule(keys) -> None:
+        """Queue ``keys`` for deletion once the current transaction commits."""
+        keys = list(dict.fromkeys(key for key in keys if key))
+        if not keys:
+            return
+        StoredObjectDeletion.objects.bulk_create(
+            [StoredObjectDeletion(key=key) for key in keys], ignore_conflicts=True,
+        )
+
+        from apps.records.tasks import delete_stored_objects
+
+        enqueue_on_commit(delete_stored_objects)
+
+    @staticmethod
+    def _in_use(keys: list[str]) -> set[str]:
+        return {
+            *DataRecord.all_objects.filter(file__in=keys).values_list('file', flat=True),
+            *DataRecord.all_objects.filter(thumbnail__in=keys).values_list('thumbnail', flat=True),
+            *FileBlob.objects.filter(key__in=keys).values_list('key', flat=True),
+        }
+
+    @staticmethod
+    def purge(batch_size: int | None = None) -> int:
+        """Delete the queued objects; returns how many were deleted. Failed keys stay queued."""
+        batch_size = batch_size or settings.RECORDS_OBJECT_DELETE_BATCH_SIZE
+        storage = ObjectCleanupService._storage()
+        deleted = 0
+        last_pk = 0
+        while True:
+            with transaction.atomic():
+                # Another worker draining the queue has its batch locked; take the next one.
+                batch = dict(
+                    StoredObjectDeletion.objects.select_for_update(skip_locked=True)
+                    .filter(pk__gt=last_pk).order_by('pk').values_list('key', 'pk')[:batch_size]
+                )
+                if not batch:
+                    return deleted
+                last_pk = max(batch.values())
+
+                in_use = ObjectCleanupService._in_use(list(batch))
+                if in_use:
+                    logger.info("Not deleting %d queued objects that are in use again", len(in_use))
+                doomed = [key for key in batch if key not in in_use]
+                errors = _delete_objects(storage, doomed) if doomed else {}
+                for key, message in errors.items():
+                    StoredObjectDeletion.objects.filter(key=key).update(
+                        attempts=F('attempts') + 1, last_error=message[:1000],
+                    )
+                if errors:
+                    logger.warning("Could not delete %d of %d objects", len(errors), len(doomed))
+                StoredObjectDeletion.objects.filter(pk__in=[
+                    pk for key, pk in batch.items() if key not in errors
+                ]).delete()
+                deleted += len(doomed) - len(errors)
+
+    @staticmethod
+    def _old_unclaimed(
+        prefix: str, min_age: int, claimed: Callable[[list[str]], set[str]],
+    ) -> Iterator[list[str]]:
+        """Batches of keys under ``prefix`` older than ``min_age`` seconds that ``claimed`` or the queue do not hold."""
+        cutoff = timezone.now() - timedelta(seconds=min_age)
+        storage = ObjectCleanupService._storage()
+        old = (name for name, modified in _iter_objects(storage, prefix) if modified <= cutoff)
+        while batch := list(islice(old, settings.RECORDS_OBJECT_DELETE_BATCH_SIZE)):
+            known = claimed(batch)
+            known.update(StoredObjectDeletion.objects.filter(key__in=batch).values_list('key', flat=True))
+            unclaimed = [key for key in batch if key not in known]
+            if unclaimed:
+                yield unclaimed
+
+    @staticmethod
+    def find_strays(
+        prefixes=RECORD_OBJECT_PREFIXES, min_age: int | None = None,
+    ) -> Iterator[list[str]]:
+        """
+        Yield, in batches, the stored keys under ``prefixes`` that no record, blob
+        or queued deletion refers to. Objects younger than ``min_age`` seconds
+        (``RECORDS_ORPHAN_MIN_AGE``) are left alone: they may be uploads that
+        have not been committed to a record yet.
+        """
+        min_age = settings.RECORDS_ORPHAN_MIN_AGE if min_age is None else min_age
+        for prefix in prefixes:
+            yield from ObjectCleanupService._old_unclaimed(prefix, min_age, ObjectCleanupService._in_use)
+
+    @staticmethod
+    def find_expired_job_objects() -> Iterator[list[str]]:
+        """
+        Yield, in batches, export files older than ``RECORDS_EXPORT_JOB_TIMEOUT``,
+        whose job (and so its download link) has expired, and import sources older
+        than ``RECORDS_IMPORT_SOURCE_MAX_AGE`` that no pending or running import reads.
+        """
+        yield from ObjectCleanupService._old_unclaimed(
+            EXPORT_OBJECT_PREFIX, settings.RECORDS_EXPORT_JOB_TIMEOUT, lambda keys: set(),
+        )
+        yield from ObjectCleanupService._old_unclaimed(
+            IMPORT_OBJECT_PREFIX, settings.RECORDS_IMPORT_SOURCE_MAX_AGE, ObjectCleanupService._read_by_imports,
+        )
+
+    @staticmethod
+    def _read_by_imports(keys: list[str]) -> set[str]:
+        return set(
+            RecordImportJob.objects.filter(
+                source__in=keys, source_is_local=False,
+                status__in=[RecordImportJob.Status.PENDING, RecordImportJob.Status.RUNNING],
+            ).values_list('source', flat=True)
+        )
+
+    @staticmethod
+    def find_unused(min_age: int | None = None) -> Iterator[list[str]]:
+        """find_strays() followed by find_expired_job_objects()."""
+        yield from ObjectCleanupService.find_strays(min_age=min_age)
+        yield from ObjectCleanupService.find_expired_job_objects()
+
+    @staticmethod
+    def reconcile(min_age: int | None = None) -> int:
+        """Queue every stray record object and expired job object for deletion; returns how many were found."""
+        found = 0
+        for unused in ObjectCleanupService.find_unused(min_age=min_age):
+            with transaction.atomic():
+                ObjectCleanupService.schedule(unused)
+            found += len(unused)
+        return found
@@ -0,0 +1,63 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.records.models.records_model import DataRecord
+from apps.records.services.blob_service import FileBlobService
+from apps.records.services.object_cleanup_service import ObjectCleanupService
+
+logger = logging.getLogger(__name__)
+
+
+class RecordPurgeService:
+    """
+    Hard-deletes soft-deleted records.
+
+    Deletes only mark rows (``deleted_at``); this removes the ones deleted more
+    than ``RECORDS_PURGE_AFTER`` seconds ago, ``RECORDS_PURGE_BATCH_SIZE`` rows per
+    short transaction with ``RECORDS_PURGE_PAUSE`` seconds between batches, so
+    running it off-peak never holds many row locks or writes a burst of WAL. Each
+    batch releases its records' file references and queues their thumbnails.
+    """
+
+    @staticmethod
+    def purge(
+        older_than: int | None = None,
+        batch_size: int | None = None,
+        pause: float | None = None,
+        time_limit: float | None = None,
+    ) -> int:
+        """Purge in batches until none are left or ``time_limit`` seconds passed; returns the rows purged."""
+        older_than = settings.RECORDS_PURGE_AFTER if older_than is None else older_than
+        batch_size = batch_size or settings.RECORDS_PURGE_BATCH_SIZE
+        pause = settings.RECORDS_PURGE_PAUSE if pause is None else pause
+        cutoff = timezone.now() - timedelta(seconds=older_than)
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+
+        purged = 0
+        while True:
+            with transaction.atomic():
+                # Rows another purger holds are skipped rather than waited for.
+                rows = list(
+                    DataRecord.all_objects.select_for_update(skip_locked=True)
+                    .filter(deleted_at__lte=cutoff).order_by('deleted_at')
+                    .values_list('pk', 'file', 'thumbnail')[:batch_size]
+                )
+                if not rows:
+                    break
+                DataRecord.all_objects.filter(pk__in=[pk for pk, _, _ in rows]).delete()
+                FileBlobService.release(file for _, file, _ in rows)
+                ObjectCleanupService.schedule(thumbnail for _, _, thumbnail in rows)
+            purged += len(rows)
+
+            if len(rows) < batch_size or (deadline is not None and time.monotonic() >= deadline):
+                break
+            time.sleep(pause)
+
+        if purged:
+            logger.info("Purged %d deleted records", purged)
+        return purged
@@ -1,5 +1,131 @@
+import os
+from collections.abc import Collection
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.utils import timezone
 from apps.records.models.records_model import DataRecord
+from apps.records.selectors.record_cache import RecordDetailCache
+from apps.records.services.blob_service import FileBlobService
+from apps.utils.pagination import invalidate_cached_counts
+from apps.utils.storage import StreamedUploadedFile
+from dms_system.celery import enqueue_on_commit
+
+RECORD_COUNT_NAMESPACE = 'records'
+
+
+class RecordNotFound(ValidationError):
+    """No live record has the given ID."""
+
+    def __init__(self, record_id: int):
+        super().__init__(f"Record with ID {record_id} not found")
+
+
+class JobNotQueued(Exception):
+    """A background job was saved but its task could not be sent to the broker."""
+
+
+class RecordVersionConflict(ValidationError):
+    """The record changed since the version the caller based its write on."""
+
+    def __init__(self, record_id: int):
+        super().__init__(f"Record with ID {record_id} has been modified")
+
+
+def _validate_title(title: str) -> None:
+    if not title or not title.strip():
+        raise ValidationError("Title cannot be empty")
+    if len(title) > 200:
+        raise ValidationError("Title cannot exceed 200 characters")
+
+
+def _invalidate(record_ids=()) -> None:
+    """
+    Drop cached counts and record details now, and again right after commit: a
+    reader that cached the old row before the commit would otherwise keep serving
+    it. With ``RECORDS_CACHE_REINVALIDATE_DELAY`` set, the light queue drops them
+    once more that many seconds later.
+    """
+    from apps.records.tasks import invalidate_record_caches
+
+    record_ids = list(record_ids)
+    _drop_caches(record_ids)
+    # robust: the write has committed, so a cache error must not fail the request.
+    transaction.on_commit(lambda: _drop_caches(record_ids), robust=True)
+    if delay := settings.RECORDS_CACHE_REINVALIDATE_DELAY:
+        enqueue_on_commit(invalidate_record_caches.s(record_ids).set(countdown=delay))
+
+
+def _drop_caches(record_ids: list[int]) -> None:
+    invalidate_cached_counts(RECORD_COUNT_NAMESPACE)
+    RecordDetailCache.invalidate(record_ids)
+
+
+def _file_name(file) -> str:
+    if isinstance(file, StreamedUploadedFile):
+        return file.original_name
+    name = file if isinstance(file, str) else getattr(file, 'name', '')
+    return os.path.basename(name or '')
+
+
+# Columns ``_set_file`` writes.
+_FILE_FIELDS = ('file', 'file_name', 'file_status', 'file_size', 'file_checksum', 'file_mime_type', 'file_text')
+
+
+def _set_file(record: DataRecord, file) -> None:
+    """
+    Point ``record`` at ``file``, moving its blob reference from the old file to the
+    new one, and reset the metadata the background task fills in. Call inside the
+    transaction that saves the record.
+    """
+    old_key = record.file.name if record.pk else None
+    # Files streamed into storage during parsing are already saved; keep only their key.
+    record.file = FileBlobService.acquire(file) if file else file
+    record.file_name = _file_name(file) if file else ''
+    if old_key:
+        FileBlobService.release([old_key])
+    record.file_status = DataRecord.FileStatus.PENDING if record.file else DataRecord.FileStatus.NONE
+    record.file_size = None
+    record.file_checksum = ''
+    record.file_mime_type = ''
+    record.file_text = ''
+
+
+def _process_file(record_id: int) -> None:
+    """Extract the record's file metadata on the heavy queue once the write commits."""
+    from apps.records.tasks import process_record_file
+
+    enqueue_on_commit(process_record_file, record_id)
+
+
+# The version a conditional write must find, or several it may find (an If-Match list).
+ExpectedVersion = int | Collection[int] | None
+
+
+def _get_for_write(record_id: int, expected_version: ExpectedVersion, lock: bool = False) -> DataRecord:
+    queryset = DataRecord.objects.all()
+    if lock or expected_version is not None:
+        queryset = queryset.select_for_update()
+    try:
+        record = queryset.get(id=record_id)
+    except DataRecord.DoesNotExist:
+        raise RecordNotFound(record_id)
+    if expected_version is not None:
+        expected = {expected_version} if isinstance(expected_version, int) else set(expected_version)
+        if RecordDetailCache.get_version(record) not in expected:
+            raise RecordVersionConflict(record_id)
+    return record
+
+
+def _update_returning(record_id: int, **values) -> DataRecord:
+    """Write ``values`` (and ``updated_at``) in one ``UPDATE ... RETURNING``, without reading the row first."""
+    records = DataRecord.objects.filter(pk=record_id).update_returning(updated_at=timezone.now(), **values)
+    if not records:
+        raise RecordNotFound(record_id)
+    return records[0]
 
 
 class DataRecordService:
@@ -11,88 +137,137 @@ class DataRecordService:
         file = None,
         is_active: bool = True
     ) -> DataRecord:
-        if not title or not title.strip():
-            raise ValidationError("Title cannot be empty")
+        _validate_title(title)
+
+        record = DataRecord(
+            title=title.strip(),
+            description=description.strip() if description else "",
+            is_active=is_active
+        )
+        if file:
+            with transaction.atomic():
+                _set_file(record, file)
+                record.save(force_insert=True)
+                _process_file(record.pk)
+        else:
+            record.save(force_insert=True)
+        _invalidate()
+        return record
 
-        if len(title) > 200:
-            raise ValidationError("Title cannot exceed 200 characters")
+    @staticmethod
+    async def acreate_record(
+        title: str,
+        description: str = "",
+        file = None,
+        is_active: bool = True
+    ) -> DataRecord:
+        if file:
+            # Taking the file's blob reference needs a transaction.
+            return await sync_to_async(DataRecordService.create_record)(title, description, file, is_active)
+        _validate_title(title)
 
-        record = DataRecord.objects.create(
+        record = await DataRecord.objects.acreate(
             title=title.strip(),
             description=description.strip() if description else "",
-            file=file,
             is_active=is_active
         )
+        await sync_to_async(_invalidate)()
         return record
 
     @staticmethod
+    @transaction.atomic
     def update_record(
         record_id: int,
+        expected_version: ExpectedVersion = None,
         **kwargs
     ) -> DataRecord:
-        try:
-            record = DataRecord.objects.get(id=record_id)
-        except DataRecord.DoesNotExist:
-            raise ValidationError(f"Record with ID {record_id} not found")
-
+        values = {}
         if 'title' in kwargs:
-            title = kwargs['title']
-            if not title or not title.strip():
-                raise ValidationError("Title cannot be empty")
-            if len(title) > 200:
-                raise ValidationError("Title cannot exceed 200 characters")
-            record.title = title.strip()
+            _validate_title(kwargs['title'])
+            values['title'] = kwargs['title'].strip()
 
         if 'description' in kwargs:
-            record.description = kwargs['description'].strip() if kwargs['description'] else ""
-
-        if 'file' in kwargs:
-            record.file = kwargs['file']
+            values['description'] = kwargs['description'].strip() if kwargs['description'] else ""
 
         if 'is_active' in kwargs:
-            record.is_active = kwargs['is_active']
+            values['is_active'] = kwargs['is_active']
+
+        if 'file' not in kwargs and expected_version is None:
+            record = _update_returning(record_id, **values)
+            _invalidate([record.pk])
+            return record
+
+        # Replacing the file moves a blob reference and If-Match compares the current
+        # version, so both read the row under a lock before writing it.
+        record = _get_for_write(record_id, expected_version, lock=True)
+        for name, value in values.items():
+            setattr(record, name, value)
+        update_fields = [*values, 'updated_at']
+        if 'file' in kwargs:
+            _set_file(record, kwargs['file'])
+            update_fields.extend(_FILE_FIELDS)
 
-        record.save()
+        record.save(update_fields=update_fields)
+        _invalidate([record.pk])
+        if 'file' in kwargs:
+            _process_file(record.pk)
         return record
 
     @staticmethod
-    def delete_record(record_id: int) -> bool:
-        try:
-            record = DataRecord.objects.get(id=record_id)
-            record.delete()
-            return True
-        except DataRecord.DoesNotExist:
-            raise ValidationError(f"Record with ID {record_id} not found")
+    @transaction.atomic
+    def delete_record(record_id: int, expected_version: ExpectedVersion = None) -> bool:
+        if expected_version is not None:
+            _get_for_write(record_id, expected_version)
+        # Soft delete: the row and its files go when RecordPurgeService purges it.
+        if not DataRecord.objects.filter(pk=record_id).soft_delete():
+            raise RecordNotFound(record_id)
+        _invalidate([record_id])
+        return True
+
+    # Async code cannot hold a transaction (or the row lock If-Match writes rely
+    # on), so the async writes run the atomic sync versions in a worker thread.
 
     @staticmethod
-    def toggle_record_active_status(record_id: int) -> DataRecord:
-        try:
-            record = DataRecord.objects.get(id=record_id)
-        except DataRecord.DoesNotExist:
-            raise ValidationError(f"Record with ID {record_id} not found")
+    async def aupdate_record(
+        record_id: int,
+        expected_version: ExpectedVersion = None,
+        **kwargs
+    ) -> DataRecord:
+        return await sync_to_async(DataRecordService.update_record)(record_id, expected_version, **kwargs)
+
+    @staticmethod
+    async def adelete_record(record_id: int, expected_version: ExpectedVersion = None) -> bool:
+        return await sync_to_async(DataRecordService.delete_record)(record_id, expected_version)
 
-        record.is_active = not record.is_active
-        record.save()
+    @staticmethod
+    def toggle_record_active_status(record_id: int) -> DataRecord:
+        # Flipped in the database, so concurrent toggles never overwrite each other.
+        record = _update_returning(
+            record_id, is_active=ExpressionWrapper(~Q(is_active=True), output_field=BooleanField()),
+        )
+        _invalidate([record.pk])
         return record
 
     @staticmethod
     def bulk_update_active_status(record_ids: list[int], is_active: bool) -> int:
+        """Set ``is_active`` on the records through RecordBulkService; returns how many were updated."""
+        from apps.records.services.bulk_service import RecordBulkService
+
         if not record_ids:
             raise ValidationError("No record IDs provided")
 
-        updated_count = DataRecord.objects.filter(
-            id__in=record_ids
-        ).update(is_active=is_active)
-
-        return updated_count
+        results = RecordBulkService.update_records(
+            [{'id': record_id, 'is_active': is_active} for record_id in dict.fromkeys(record_ids)]
+        )
+        return sum(result['status'] == 'updated' for result in results)
 
     @staticmethod
     def bulk_delete_records(record_ids: list[int]) -> int:
+        """Soft-delete the records through RecordBulkService; returns how many were deleted."""
+        from apps.records.services.bulk_service import RecordBulkService
+
         if not record_ids:
             raise ValidationError("No record IDs provided")
 
-        deleted_count, _ = DataRecord.objects.filter(
-            id__in=record_ids
-        ).delete()
-
-        return deleted_count
+        results = RecordBulkService.delete_records(list(dict.fromkeys(record_ids)))
+        return sum(result['status'] == 'deleted' for result in results)
@@ -0,0 +1,100 @@
+import os
+import uuid
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.utils.text import get_valid_filename
+
+from apps.records.models.records_model import DataRecord
+from apps.records.services.records_service import DataRecordService
+
+UPLOAD_TOKEN_SALT = 'apps.records.uploads'
+
+
+class RecordUploadService:
+    """
+    Two-step upload: clients POST the file straight to object storage using a
+    presigned policy, then commit the uploaded key to a record.
+
+    The upload token handed out in step one is signed and names the key, the
+    declared size and the requesting user, so a client can only commit objects it
+    was allowed to upload.
+    """
+
+    @staticmethod
+    def _storage():
+        return DataRecord._meta.get_field('file').storage
+
+    @staticmethod
+    def build_key(filename: str) -> str:
+        field = DataRecord._meta.get_field('file')
+        prefix = f"{field.upload_to.rstrip('/')}/{uuid.uuid4().hex}/"
+        name = get_valid_filename(os.path.basename(filename or ''))
+        if not name:
+            raise ValidationError("Filename is invalid")
+        root, ext = os.path.splitext(name)
+        available = field.max_length - len(prefix)
+        if len(ext) >= available:
+            raise ValidationError("Filename is too long")
+        return prefix + root[:available - len(ext)] + ext
+
+    @staticmethod
+    def create_upload(user_id: int, filename: str, size: int, content_type: str = "") -> dict:
+        if size < 1:
+            raise ValidationError("File cannot be empty")
+        if size > settings.RECORDS_UPLOAD_MAX_SIZE:
+            raise ValidationError(f"File cannot exceed {settings.RECORDS_UPLOAD_MAX_SIZE} bytes")
+
+        key = RecordUploadService.build_key(filename)
+        post = RecordUploadService._storage().presigned_post(
+            key,
+            max_size=size,
+            expire=settings.RECORDS_UPLOAD_URL_EXPIRE,
+            content_type=content_type or None,
+        )
+        token = signing.dumps({'k': key, 's': size, 'u': user_id}, salt=UPLOAD_TOKEN_SALT)
+        return {
+            'key': key,
+            'url': post['url'],
+            'fields': post['fields'],
+            'expires_in': settings.RECORDS_UPLOAD_URL_EXPIRE,
+            'upload_token': token,
+        }
+
+    @staticmethod
+    def verify_upload(user_id: int, upload_token: str) -> str:
+        """Check the token and the uploaded object; return the object key."""
+        try:
+            payload = signing.loads(
+                upload_token, salt=UPLOAD_TOKEN_SALT, max_age=settings.RECORDS_UPLOAD_TOKEN_MAX_AGE,
+            )
+        except signing.SignatureExpired:
+            raise ValidationError("Upload token has expired")
+        except signing.BadSignature:
+            raise ValidationError("Upload token is invalid")
+        if payload['u'] != user_id:
+            raise ValidationError("Upload token is invalid")
+
+        key = payload['k']
+        stat = RecordUploadService._storage().head(key)
+        if stat is None:
+            raise ValidationError("Uploaded file not found")
+        if stat['size'] != payload['s']:
+            raise ValidationError(f"Uploaded file is {stat['size']} bytes, expected {payload['s']}")
+        if DataRecord.all_objects.filter(file=key).exists():
+            raise ValidationError("Upload has already been committed")
+        return key
+
+    @staticmethod
+    def commit_upload(
+        user_id: int,
+        upload_token: str,
+        record_id: int | None = None,
+        **fields
+    ) -> DataRecord:
+        """Attach a verified upload to ``record_id``, or create a record for it."""
+        key = RecordUploadService.verify_upload(user_id, upload_token)
+        if record_id is not None:
+            return DataRecordService.update_record(record_id, file=key, **fields)
+        return DataRecordService.create_record(title=fields.pop('title', ''), file=key, **fields)
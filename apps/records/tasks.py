@@ -0,0 +1,62 @@
+from celery import shared_task
+from django.conf import settings
+
+from apps.records.selectors.record_cache import RecordDetailCache
+from apps.records.services import (
+    FileBlobService,
+    ObjectCleanupService,
+    RecordExportService,
+    RecordFileProcessingService,
+    RecordImportService,
+    RecordPurgeService,
+)
+from apps.records.services.records_service import RECORD_COUNT_NAMESPACE
+from apps.utils.pagination import invalidate_cached_counts
+from dms_system.celery import RETRY_POLICY
+
+
+# Heavy queue (see CELERY_TASK_ROUTES). Retrying is safe: an export is rewritten
+# from scratch and an import resumes after its last committed batch.
+
+@shared_task(max_retries=3, **RETRY_POLICY)
+def export_records(job_id: str, user_id: int, query_string: str, export_format: str) -> str:
+    return RecordExportService.run_job(job_id, user_id, query_string, export_format)
+
+
+@shared_task(max_retries=3, **RETRY_POLICY)
+def import_records(job_id: str) -> int:
+    return RecordImportService.run(job_id).rows_created
+
+
+# Files queue.
+
+@shared_task(max_retries=3, **RETRY_POLICY)
+def process_record_file(record_id: int) -> None:
+    RecordFileProcessingService.process(record_id)
+
+
+@shared_task(max_retries=3, **RETRY_POLICY)
+def purge_deleted_records() -> int:
+    """Hard-delete soft-deleted records in throttled batches; schedule it off-peak."""
+    return RecordPurgeService.purge(time_limit=settings.RECORDS_PURGE_TIME_LIMIT)
+
+
+# Light queue.
+
+@shared_task(max_retries=5, ignore_result=True, **RETRY_POLICY)
+def invalidate_record_caches(record_ids: list[int]) -> None:
+    """Delayed extra pass over the caches a write dropped; see RECORDS_CACHE_REINVALIDATE_DELAY."""
+    invalidate_cached_counts(RECORD_COUNT_NAMESPACE)
+    RecordDetailCache.invalidate(record_ids)
+
+
+@shared_task(max_retries=5, **RETRY_POLICY)
+def collect_file_blobs(keys: list[str] | None = None) -> int:
+    """Delete blobs no record points at any more; all of them when ``keys`` is None."""
+    return FileBlobService.collect(keys)
+
+
+@shared_task(max_retries=5, **RETRY_POLICY)
+def delete_stored_objects() -> int:
+    """Delete the objects queued by ObjectCleanupService.schedule."""
+    return ObjectCleanupService.purge()
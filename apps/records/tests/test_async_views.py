@@ -0,0 +1,159 @@
+from django.test import override_settings
+from django.urls import include, path
+
+from apps.records.api import urls as record_urls
+from apps.records.api.views import (
+    AsyncRecordListView,
+    AsyncRecordCreateView,
+    AsyncRecordRetrieveView,
+    AsyncRecordUpdateView,
+    AsyncRecordDeleteView,
+)
+from apps.records.models.records_model import DataRecord
+from apps.records.selectors import DataRecordSelector, RecordDetailCache
+from apps.records.services import DataRecordService, RecordVersionConflict
+from apps.records.tests.test_views import (
+    CREATE_URL,
+    LIST_URL,
+    RecordViewTestBase,
+    delete_url,
+    detail_url,
+    update_url,
+)
+
+_ASYNC_VIEWS = {
+    'record-list': AsyncRecordListView,
+    'record-create': AsyncRecordCreateView,
+    'record-detail': AsyncRecordRetrieveView,
+    'record-update': AsyncRecordUpdateView,
+    'record-delete': AsyncRecordDeleteView,
+}
+
+# The records endpoints as routed with RECORDS_ASYNC_VIEWS enabled.
+urlpatterns = [
+    path('api/', include([
+        path(str(pattern.pattern), _ASYNC_VIEWS[pattern.name].as_view(), name=pattern.name)
+        if pattern.name in _ASYNC_VIEWS else pattern
+        for pattern in record_urls.urlpatterns
+    ])),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncRecordViewTests(RecordViewTestBase):
+    def test_list_returns_paginated_results(self):
+        response = self.viewer_client.get(LIST_URL)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["results"][0]["id"], self.record.pk)
+        self.assertIn("ETag", response)
+
+    def test_list_returns_304_until_records_change(self):
+        etag = self.viewer_client.get(LIST_URL)["ETag"]
+        self.assertEqual(self.viewer_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        DataRecord.objects.create(title="New")
+        self.assertEqual(self.viewer_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_list_cursor_mode_pages_with_async_iteration(self):
+        DataRecord.objects.create(title="Second", is_active=True)
+        data = self.viewer_client.get(LIST_URL, {"cursor": "", "page_size": 1}).json()["data"]
+        self.assertEqual(len(data["results"]), 1)
+
+        response = self.viewer_client.get(data["next"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["data"]["results"]), 1)
+        self.assertNotEqual(response.json()["data"]["results"][0]["id"], data["results"][0]["id"])
+
+    def test_list_invalid_cursor_returns_404(self):
+        self.assertEqual(self.viewer_client.get(LIST_URL, {"cursor": "garbage"}).status_code, 404)
+
+    def test_list_invalid_filter_returns_validation_error(self):
+        response = self.viewer_client.get(LIST_URL, {"created_at_after": "not-a-date"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_requires_role(self):
+        self.assertEqual(self.no_role_client.get(LIST_URL).status_code, 403)
+        self.assertEqual(self.anon_client.get(LIST_URL).status_code, 401)
+
+    def test_create(self):
+        response = self.editor_client.post(CREATE_URL, {"title": " Async ", "description": "d"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["data"]["title"], "Async")
+        self.assertTrue(DataRecord.objects.filter(title="Async").exists())
+
+    def test_create_validates(self):
+        self.assertEqual(self.editor_client.post(CREATE_URL, {"description": "x"}).status_code, 400)
+        self.assertEqual(self.viewer_client.post(CREATE_URL, {"title": "x"}).status_code, 403)
+
+    def test_retrieve_and_revalidate(self):
+        response = self.viewer_client.get(detail_url(self.record.pk))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["id"], self.record.pk)
+
+        etag = response["ETag"]
+        self.assertEqual(
+            self.viewer_client.get(detail_url(self.record.pk), HTTP_IF_NONE_MATCH=etag).status_code, 304,
+        )
+        self.assertEqual(RecordDetailCache.get(self.record.pk)["id"], self.record.pk)
+
+    def test_retrieve_not_found(self):
+        self.assertEqual(self.viewer_client.get(detail_url(9999)).status_code, 404)
+        self.assertEqual(self.viewer_client.get(detail_url(9999), HTTP_IF_NONE_MATCH='"1"').status_code, 404)
+
+    def test_update_with_current_if_match(self):
+        etag = self.editor_client.get(detail_url(self.record.pk))["ETag"]
+        response = self.editor_client.patch(update_url(self.record.pk), {"title": "Changed"}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.viewer_client.get(detail_url(self.record.pk)).json()["data"]["title"], "Changed")
+
+    def test_update_with_stale_if_match_returns_412(self):
+        response = self.editor_client.patch(update_url(self.record.pk), {"title": "x"}, HTTP_IF_MATCH='"0"')
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.editor_client.patch(update_url(9999), {"title": "x"}).status_code, 404)
+
+    def test_delete(self):
+        self.assertEqual(self.editor_client.delete(delete_url(self.record.pk)).status_code, 403)
+        self.assertEqual(self.admin_client.delete(delete_url(self.record.pk), HTTP_IF_MATCH='"0"').status_code, 412)
+        self.assertEqual(self.admin_client.delete(delete_url(self.record.pk)).status_code, 204)
+        self.assertFalse(DataRecord.objects.filter(pk=self.record.pk).exists())
+        self.assertEqual(self.admin_client.delete(delete_url(self.record.pk)).status_code, 404)
+
+
+class AsyncSelectorServiceTests(RecordViewTestBase):
+    async def test_selectors(self):
+        record = await DataRecordSelector.aget_record_by_id(self.record.pk)
+        self.assertEqual(record, self.record)
+        self.assertIsNone(await DataRecordSelector.aget_record_by_id(9999))
+        self.assertEqual(await DataRecordSelector.aget_record_updated_at(self.record.pk), self.record.updated_at)
+        last_modified = await DataRecordSelector.aget_last_modified(DataRecordSelector.get_all_records())
+        self.assertEqual(last_modified, self.record.updated_at)
+
+    async def test_detail_cache_builds_once(self):
+        calls = []
+
+        def serialize(record):
+            calls.append(record.pk)
+            return {"id": record.pk}
+
+        entry = await RecordDetailCache.aget_or_build_entry(self.record.pk, serialize)
+        self.assertEqual(entry, (RecordDetailCache.get_version(self.record), {"id": self.record.pk}))
+        self.assertEqual(await RecordDetailCache.aget_or_build_entry(self.record.pk, serialize), entry)
+        self.assertEqual(calls, [self.record.pk])
+        self.assertEqual(await RecordDetailCache.aget_current_version(self.record.pk), entry[0])
+
+    async def test_services(self):
+        record = await DataRecordService.acreate_record(title=" Made async ")
+        self.assertEqual(record.title, "Made async")
+
+        with self.assertRaises(RecordVersionConflict):
+            await DataRecordService.aupdate_record(record.pk, expected_version=0, title="x")
+        updated = await DataRecordService.aupdate_record(
+            record.pk, expected_version=RecordDetailCache.get_version(record), title="Renamed",
+        )
+        self.assertEqual(updated.title, "Renamed")
+
+        self.assertTrue(await DataRecordService.adelete_record(record.pk))
+        self.assertFalse(await DataRecord.objects.filter(pk=record.pk).aexists())
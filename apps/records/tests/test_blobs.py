@@ -0,0 +1,169 @@
+import hashlib
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from apps.records.models import DataRecord, FileBlob
+from apps.records.services import (
+    DataRecordService,
+    FileBlobService,
+    ObjectCleanupService,
+    RecordBulkService,
+    RecordFileProcessingService,
+    RecordPurgeService,
+)
+from apps.records.tasks import collect_file_blobs, delete_stored_objects, process_record_file
+from apps.records.tests.test_views import RecordViewTestBase
+from apps.utils.storage import MinIOStorage, StreamedUploadedFile
+from apps.utils.tests.test_storage import FakeMultipartClient
+
+CREATE_URL = "/api/records/create/"
+
+
+def _sha(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class FileBlobServiceTests(TestCase):
+
+    def setUp(self):
+        self.storage = InMemoryStorage()
+        for target, name in ((ObjectCleanupService, "_storage"), (RecordFileProcessingService, "_storage"),
+                             (RecordFileProcessingService, "_thumbnail_storage")):
+            patcher = mock.patch.object(target, name, return_value=self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # Run the collection and deletion the on-commit hooks queue, skip file processing.
+        for target, side_effect in (
+            (collect_file_blobs, self._collect),
+            (delete_stored_objects, lambda *_: ObjectCleanupService.purge()),
+            (process_record_file, None),
+        ):
+            patcher = mock.patch.object(target, "apply_async", side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _streamed(self, key, content, deduplicated=False):
+        if not deduplicated:
+            self.storage.save(key, ContentFile(content))
+        return StreamedUploadedFile(
+            key=key, storage=self.storage, size=len(content), sha256=_sha(content),
+            original_name=key.rsplit("/", 1)[-1], deduplicated=deduplicated,
+        )
+
+    def _create(self, file, title="Doc"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return DataRecordService.create_record(title=title, file=file)
+
+    def _collect(self, args, kwargs):
+        FileBlobService.collect(*args)
+
+    def _blob(self, content) -> FileBlob:
+        return FileBlob.objects.get(pk=_sha(content))
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self._create(self._streamed("records/a/report.pdf", b"same bytes"))
+        second = self._create(self._streamed("records/a/report.pdf", b"same bytes", deduplicated=True))
+        self.assertEqual(second.file.name, first.file.name)
+        self.assertEqual(self._blob(b"same bytes").ref_count, 2)
+
+    def test_concurrent_duplicate_upload_is_dropped(self):
+        first = self._create(self._streamed("records/a/one.pdf", b"same bytes"))
+        second = self._create(self._streamed("records/b/two.pdf", b"same bytes"))
+
+        self.assertEqual(second.file.name, "records/a/one.pdf")
+        self.assertEqual(second.file_name, "two.pdf")
+        self.assertEqual(self._blob(b"same bytes").ref_count, 2)
+        self.assertFalse(self.storage.exists("records/b/two.pdf"))
+        self.assertTrue(self.storage.exists(first.file.name))
+
+    def test_deleting_the_last_reference_collects_the_blob(self):
+        first = self._create(self._streamed("records/a/one.pdf", b"shared"))
+        second = self._create(self._streamed("records/a/one.pdf", b"shared", deduplicated=True))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            DataRecordService.delete_record(first.pk)
+            DataRecordService.bulk_delete_records([second.pk])
+            # Soft-deleted records keep their references until they are purged.
+            self.assertEqual(self._blob(b"shared").ref_count, 2)
+            RecordPurgeService.purge(older_than=0, batch_size=1, pause=0)
+        self.assertFalse(FileBlob.objects.exists())
+        self.assertFalse(self.storage.exists("records/a/one.pdf"))
+
+    def test_replacing_a_file_moves_the_reference(self):
+        record = self._create(self._streamed("records/a/old.pdf", b"old"))
+        with self.captureOnCommitCallbacks(execute=True):
+            DataRecordService.update_record(record.pk, file=self._streamed("records/b/new.pdf", b"new"))
+
+        self.assertEqual(list(FileBlob.objects.values_list("key", "ref_count")), [("records/b/new.pdf", 1)])
+        self.assertFalse(self.storage.exists("records/a/old.pdf"))
+
+    def test_bulk_delete_releases_repeated_keys(self):
+        records = [
+            self._create(self._streamed("records/a/one.pdf", b"x", deduplicated=i > 0)) for i in range(3)
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            RecordBulkService.delete_records([records[0].pk, records[1].pk])
+            RecordPurgeService.purge(older_than=0)
+            self.assertEqual(self._blob(b"x").ref_count, 1)
+            RecordBulkService.delete_records([records[2].pk])
+            RecordPurgeService.purge(older_than=0)
+        self.assertFalse(FileBlob.objects.exists())
+
+    def test_matched_blob_collected_before_commit(self):
+        self.storage.save("records/a/one.pdf", ContentFile(b"gone"))
+        FileBlob.objects.create(sha256=_sha(b"gone"), key="records/a/one.pdf", size=4, ref_count=0)
+        self.assertIsNone(FileBlobService.find_key(_sha(b"gone")))
+        FileBlobService.collect()
+
+        with self.assertRaises(ValidationError):
+            DataRecordService.create_record(
+                title="Late", file=self._streamed("records/a/one.pdf", b"gone", deduplicated=True),
+            )
+        self.assertFalse(DataRecord.objects.exists())
+
+    def test_processing_adopts_direct_uploads(self):
+        self.storage.save("records/a/first.txt", ContentFile(b"direct"))
+        self.storage.save("records/b/second.txt", ContentFile(b"direct"))
+        first = self._create("records/a/first.txt")
+        second = self._create("records/b/second.txt")
+        self.assertFalse(FileBlob.objects.exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RecordFileProcessingService.process(first.pk)
+            processed = RecordFileProcessingService.process(second.pk)
+
+        self.assertEqual(processed.file.name, "records/a/first.txt")
+        self.assertEqual(processed.file_name, "second.txt")
+        self.assertEqual(self._blob(b"direct").ref_count, 2)
+        self.assertFalse(self.storage.exists("records/b/second.txt"))
+
+
+class StreamedUploadDedupViewTests(RecordViewTestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.s3 = FakeMultipartClient()
+        patcher = mock.patch.object(MinIOStorage, "client", new_callable=mock.PropertyMock, return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_second_identical_upload_is_not_stored(self):
+        responses = [
+            self.editor_client.post(
+                CREATE_URL, {"title": name, "file": SimpleUploadedFile(name, b"%PDF-same")}, format="multipart",
+            )
+            for name in ("a.pdf", "b.pdf")
+        ]
+        self.assertEqual([r.status_code for r in responses], [201, 201])
+
+        records = DataRecord.objects.filter(pk__in=[r.data["data"]["id"] for r in responses]).order_by("pk")
+        self.assertEqual(len(self.s3.completed), 1)
+        self.assertEqual(len(self.s3.aborted), 1)
+        self.assertEqual({r.file.name for r in records}, set(self.s3.completed))
+        self.assertEqual([r.file_name for r in records], ["a.pdf", "b.pdf"])
+        self.assertEqual(FileBlob.objects.get().ref_count, 2)
@@ -0,0 +1,154 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.db.models.query import QuerySet
+from django.test import TestCase, override_settings
+
+from apps.records.models.records_model import DataRecord
+from apps.records.selectors import RecordDetailCache
+from apps.records.services import RecordBulkService
+from apps.records.tests.test_views import RecordViewTestBase
+
+BULK_CREATE_URL = "/api/records/bulk/create/"
+BULK_UPDATE_URL = "/api/records/bulk/update/"
+BULK_DELETE_URL = "/api/records/bulk/delete/"
+
+
+@override_settings(RECORDS_BULK_CHUNK_SIZE=2)
+class RecordBulkServiceTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_create_records_in_chunks(self):
+        items = [{"title": f" Record {i} ", "description": " d "} for i in range(5)]
+        # Per chunk: SAVEPOINT, one INSERT ... RETURNING, RELEASE.
+        with self.assertNumQueries(3 * 3):
+            results = RecordBulkService.create_records(items)
+
+        self.assertEqual([r["status"] for r in results], ["created"] * 5)
+        self.assertEqual([r["index"] for r in results], list(range(5)))
+        titles = dict(DataRecord.objects.values_list("id", "title"))
+        self.assertEqual([titles[r["id"]] for r in results], [f"Record {i}" for i in range(5)])
+        self.assertEqual(DataRecord.objects.get(pk=results[0]["id"]).description, "d")
+
+    def test_create_reports_invalid_titles_and_failed_chunks(self):
+        original = QuerySet.bulk_create
+        calls = []
+
+        def flaky_bulk_create(queryset, objs, *args, **kwargs):
+            calls.append(len(objs))
+            if len(calls) == 2:
+                raise DatabaseError("boom")
+            return original(queryset, objs, *args, **kwargs)
+
+        items = [{"title": "a"}, {"title": "  "}, {"title": "b"}, {"title": "c"}, {"title": "d"}]
+        with mock.patch.object(QuerySet, "bulk_create", flaky_bulk_create), \
+                self.assertLogs("apps.records.services.bulk_service", "ERROR"):
+            results = RecordBulkService.create_records(items)
+
+        self.assertEqual(
+            [r["status"] for r in results], ["created", "error", "created", "error", "error"],
+        )
+        self.assertEqual(results[1]["message"], "Title cannot be empty")
+        # The database error is logged, not returned to the client.
+        self.assertEqual(results[3]["message"], "Could not save record")
+        self.assertEqual(DataRecord.objects.count(), 2)
+
+    def test_update_records(self):
+        first = DataRecord.objects.create(title="First", is_active=True)
+        second = DataRecord.objects.create(title="Second", is_active=True)
+        RecordDetailCache.set(first, {"id": first.pk})
+        version = RecordDetailCache.get_version(first)
+
+        results = RecordBulkService.update_records([
+            {"id": first.pk, "title": " Renamed "},
+            {"id": 9999, "is_active": False},
+            {"id": second.pk, "is_active": False},
+            {"id": first.pk, "description": "again"},
+        ])
+
+        self.assertEqual([r["status"] for r in results], ["updated", "not_found", "updated", "error"])
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.title, "Renamed")
+        self.assertTrue(first.is_active)
+        self.assertEqual(first.description, "")
+        self.assertFalse(second.is_active)
+        self.assertEqual(second.title, "Second")
+        self.assertGreater(RecordDetailCache.get_version(first), version)
+        self.assertIsNone(RecordDetailCache.get(first.pk))
+
+    def test_update_rejects_empty_title(self):
+        record = DataRecord.objects.create(title="Keep")
+        results = RecordBulkService.update_records([{"id": record.pk, "title": " "}])
+        self.assertEqual(results[0]["status"], "error")
+        record.refresh_from_db()
+        self.assertEqual(record.title, "Keep")
+
+    def test_delete_records(self):
+        records = [DataRecord.objects.create(title=str(i)) for i in range(3)]
+        ids = [r.pk for r in records]
+
+        results = RecordBulkService.delete_records([ids[0], 9999, ids[1], ids[0], ids[2]])
+
+        self.assertEqual(
+            [r["status"] for r in results], ["deleted", "not_found", "deleted", "error", "deleted"],
+        )
+        self.assertFalse(DataRecord.objects.exists())
+
+
+class RecordBulkViewTests(RecordViewTestBase):
+
+    def test_bulk_create(self):
+        response = self.editor_client.post(
+            BULK_CREATE_URL, [{"title": "One"}, {"title": "Two", "is_active": False}], format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual((data["succeeded"], data["failed"]), (2, 0))
+        self.assertFalse(DataRecord.objects.get(pk=data["results"][1]["id"]).is_active)
+
+    def test_bulk_create_validates_every_item_before_writing(self):
+        response = self.editor_client.post(
+            BULK_CREATE_URL, [{"title": "Fine"}, {"description": "no title"}, {"title": "x" * 201}], format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["errors"]), {"1", "2"})
+        self.assertFalse(DataRecord.objects.filter(title="Fine").exists())
+
+    @override_settings(RECORDS_BULK_MAX_ITEMS=2)
+    def test_bulk_create_limits_items(self):
+        response = self.editor_client.post(BULK_CREATE_URL, [{"title": "a"}] * 3, format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.editor_client.post(BULK_CREATE_URL, {"title": "a"}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_update(self):
+        response = self.editor_client.patch(
+            BULK_UPDATE_URL, [{"id": self.record.pk, "title": "Bulk"}, {"id": 9999, "title": "Ghost"}], format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual((data["succeeded"], data["failed"]), (1, 1))
+        self.assertEqual(data["results"][1]["status"], "not_found")
+        self.record.refresh_from_db()
+        self.assertEqual(self.record.title, "Bulk")
+
+    def test_bulk_update_requires_a_field(self):
+        response = self.editor_client.patch(BULK_UPDATE_URL, [{"id": self.record.pk}], format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_delete(self):
+        response = self.admin_client.post(BULK_DELETE_URL, {"ids": [self.record.pk, 9999]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        statuses = [r["status"] for r in response.json()["data"]["results"]]
+        self.assertEqual(statuses, ["deleted", "not_found"])
+        self.assertFalse(DataRecord.objects.filter(pk=self.record.pk).exists())
+
+    def test_permissions(self):
+        self.assertEqual(self.viewer_client.post(BULK_CREATE_URL, [{"title": "a"}], format="json").status_code, 403)
+        self.assertEqual(self.viewer_client.patch(BULK_UPDATE_URL, [], format="json").status_code, 403)
+        self.assertEqual(self.editor_client.post(BULK_DELETE_URL, {"ids": [1]}, format="json").status_code, 403)
+        self.assertEqual(self.anon_client.post(BULK_DELETE_URL, {"ids": [1]}, format="json").status_code, 401)
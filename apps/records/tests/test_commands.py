@@ -0,0 +1,109 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+from apps.records.models.records_model import DataRecord
+from apps.records.selectors.records_selector import DataRecordSelector
+from apps.records.services import RecordFileProcessingService
+
+
+class RebuildSearchVectorsCommandTests(TestCase):
+
+    def setUp(self):
+        self.records = [DataRecord.objects.create(title=f"Ledger {i}") for i in range(5)]
+        DataRecord.objects.update(search_vector=None)
+
+    def test_backfills_missing_vectors_in_batches(self):
+        self.assertEqual(DataRecordSelector.search_records("ledger").count(), 0)
+
+        out = StringIO()
+        call_command("rebuild_search_vectors", batch_size=2, stdout=out)
+
+        self.assertEqual(DataRecordSelector.search_records("ledger").count(), 5)
+        self.assertIn("rebuilt for 5 records", out.getvalue())
+        self.assertEqual(out.getvalue().count("Indexed"), 3)
+
+
+class CheckRecordQueryPlansCommandTests(TestCase):
+
+    def setUp(self):
+        # The list indexes are partial, and on an empty table the planner walks one
+        # of them end to end instead of using the index that fits; plan against
+        # analyzed rows, some of them soft-deleted.
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO records_datarecord (
+                    title, description, file_name, created_at, updated_at, is_active,
+                    file_status, file_checksum, file_mime_type, file_text, deleted_at
+                )
+                SELECT CASE WHEN i % 100 = 0 THEN 'Annual report ' || i ELSE 'Ledger ' || i END, '', '',
+                    now() - i * interval '1 minute', now() - i * interval '1 minute', i % 3 > 0,
+                    '', '', '', '', CASE WHEN i % 10 = 0 THEN now() END
+                FROM generate_series(1, 5000) AS i
+            """)
+            cursor.execute("ANALYZE records_datarecord")
+
+    def test_passes_with_filter_indexes(self):
+        out = StringIO()
+        call_command("check_record_query_plans", stdout=out)
+        self.assertIn("served by an index", out.getvalue())
+        self.assertNotIn("SEQ SCAN", out.getvalue())
+
+    def test_fails_when_an_ordering_index_is_missing(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DROP INDEX records_title_live_idx")
+            cursor.execute("DROP INDEX records_act_title_live_idx")
+
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("check_record_query_plans", stdout=out)
+        self.assertIn("SEQ SCAN  ordering=title", out.getvalue())
+
+
+class BenchmarkRecordSerializersCommandTests(TestCase):
+
+    def test_reports_both_paths_and_rolls_back_generated_rows(self):
+        out = StringIO()
+        call_command("benchmark_record_serializers", page_sizes=[2, 5], iterations=1, stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(sum(line.split()[1] == "values" for line in lines[1:]), 2)
+        self.assertEqual(sum("speedup" in line for line in lines), 2)
+        self.assertFalse(DataRecord.objects.exists())
+
+
+class BenchmarkPresignedUrlsCommandTests(TestCase):
+
+    def test_reports_each_path_and_drops_its_cache_entries(self):
+        out = StringIO()
+        with mock.patch("apps.records.management.commands.benchmark_presigned_urls.cache.delete_many") as delete_many:
+            call_command("benchmark_presigned_urls", page_sizes=[3], iterations=2, stdout=out)
+        for label in ("per-record", "batch cold", "batch warm"):
+            self.assertIn(label, out.getvalue())
+        self.assertEqual(len(delete_many.call_args.args[0]), 6)
+
+
+class ProcessRecordFilesCommandTests(TestCase):
+
+    def test_processes_unprocessed_files(self):
+        storage = InMemoryStorage()
+        storage.save("records/a/notes.txt", ContentFile(b"hello"))
+        done = DataRecord.objects.create(title="Done", file="records/a/done.txt", file_status="completed")
+        todo = DataRecord.objects.create(title="Todo", file="records/a/notes.txt")
+        DataRecord.objects.create(title="No file")
+
+        out = StringIO()
+        with mock.patch.object(RecordFileProcessingService, "_storage", return_value=storage), \
+                mock.patch.object(RecordFileProcessingService, "_thumbnail_storage", return_value=storage):
+            call_command("process_record_files", stdout=out)
+
+        self.assertIn("Processed 1 files (0 failed).", out.getvalue())
+        todo.refresh_from_db()
+        done.refresh_from_db()
+        self.assertEqual((todo.file_status, todo.file_size), ("completed", 5))
+        self.assertIsNone(done.file_size)
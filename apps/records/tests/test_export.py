@@ -0,0 +1,156 @@
+import csv
+import io
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.storage import InMemoryStorage
+from django.http import QueryDict
+from django.test import TestCase, override_settings
+
+from apps.records.models.records_model import DataRecord
+from apps.records.services import RecordExportService
+from apps.records.tests.test_views import RecordViewTestBase
+
+EXPORT_URL = "/api/records/export/"
+EXPORT_JOBS_URL = "/api/records/export/jobs/"
+
+
+def _content(response) -> str:
+    return b"".join(response.streaming_content).decode()
+
+
+@override_settings(RECORDS_EXPORT_CHUNK_SIZE=2)
+class RecordExportServiceTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.records = [
+            DataRecord.objects.create(title=f"Record {i}", description="a, \"quoted\"\nline", is_active=i % 2 == 0)
+            for i in range(5)
+        ]
+        self.records[0].file = "records/abc/report.pdf"
+        self.records[0].save()
+
+    def _export(self, export_format, params=""):
+        queryset = RecordExportService.filter_records(QueryDict(params))
+        return b"".join(RecordExportService.iter_export(queryset, export_format)).decode()
+
+    def test_csv_export_streams_every_matching_row(self):
+        chunks = list(RecordExportService.iter_export(
+            RecordExportService.filter_records(QueryDict("ordering=title")), "csv",
+        ))
+        self.assertEqual(len(chunks), 3)
+
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        self.assertEqual(rows[0], [
+            "id", "title", "description", "file", "file_name", "created_at", "updated_at", "is_active",
+            "file_status", "file_size", "file_checksum", "file_mime_type", "thumbnail",
+        ])
+        self.assertEqual([row[1] for row in rows[1:]], [f"Record {i}" for i in range(5)])
+        self.assertEqual(rows[1][2], "a, \"quoted\"\nline")
+        self.assertEqual(rows[1][3], "records/abc/report.pdf")
+
+    def test_ndjson_export_applies_filters(self):
+        lines = self._export("ndjson", "is_active=true&ordering=title").splitlines()
+        items = [json.loads(line) for line in lines]
+        self.assertEqual([item["title"] for item in items], ["Record 0", "Record 2", "Record 4"])
+        self.assertEqual(items[0]["file"], "records/abc/report.pdf")
+        self.assertIsNone(items[1]["file"])
+
+    def test_empty_csv_export_has_header(self):
+        self.assertEqual(self._export("csv", "search=nothingmatches").splitlines(), [
+            "id,title,description,file,file_name,created_at,updated_at,is_active,"
+            "file_status,file_size,file_checksum,file_mime_type,thumbnail",
+        ])
+
+    def test_run_job_uploads_export_and_links_it(self):
+        storage = InMemoryStorage()
+        with mock.patch.object(RecordExportService, "_storage", return_value=storage):
+            key = RecordExportService.run_job("job1", 7, "is_active=false", "ndjson")
+            job = RecordExportService.get_job(7, "job1")
+
+        self.assertTrue(key.startswith("exports/job1/records-"))
+        with storage.open(key) as f:
+            self.assertEqual(len(f.read().splitlines()), 2)
+        self.assertEqual(job["status"], "completed")
+        self.assertIn(key, job["download_url"])
+        self.assertIsNone(RecordExportService.get_job(8, "job1"))
+
+    def test_failed_job_is_reported(self):
+        storage = mock.Mock(save=mock.Mock(side_effect=OSError("bucket gone")))
+        with mock.patch.object(RecordExportService, "_storage", return_value=storage), \
+                self.assertLogs("apps.records.services.export_service", "ERROR") as logs, \
+                self.assertRaises(OSError):
+            RecordExportService.run_job("job2", 7, "", "csv")
+
+        job = RecordExportService.get_job(7, "job2")
+        # The storage error is logged, not shown to the client.
+        self.assertEqual((job["status"], job["error"]), ("failed", "Export failed"))
+        self.assertIn("bucket gone", "\n".join(logs.output))
+
+
+class RecordExportViewTests(RecordViewTestBase):
+
+    def test_stream_csv(self):
+        response = self.viewer_client.get(EXPORT_URL, {"search": "Test"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn('attachment; filename="records-', response["Content-Disposition"])
+        rows = list(csv.reader(io.StringIO(_content(response))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][1], "Test Record")
+
+    async def test_stream_under_asgi_is_not_collected_first(self):
+        authorization = self.viewer_client._credentials["HTTP_AUTHORIZATION"]
+        response = await self.async_client.get(EXPORT_URL, headers={"Authorization": authorization})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response.streaming_content]).decode()
+        self.assertEqual(len(list(csv.reader(io.StringIO(content)))), 2)
+
+    def test_stream_ndjson(self):
+        response = self.viewer_client.get(EXPORT_URL, {"export_format": "ndjson"})
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(json.loads(_content(response))["id"], self.record.pk)
+
+    def test_rejects_bad_format_and_filters(self):
+        response = self.viewer_client.get(EXPORT_URL, {"export_format": "xlsx"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("export_format", response.json()["errors"])
+        response = self.viewer_client.get(EXPORT_URL, {"created_at_after": "nope"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("created_at_after", response.json()["errors"])
+
+    def test_requires_role(self):
+        self.assertEqual(self.no_role_client.get(EXPORT_URL).status_code, 403)
+        self.assertEqual(self.anon_client.post(EXPORT_JOBS_URL).status_code, 401)
+
+    def test_background_export(self):
+        with mock.patch("apps.records.tasks.export_records.delay") as delay:
+            response = self.viewer_client.post(f"{EXPORT_JOBS_URL}?is_active=true&export_format=ndjson")
+
+        self.assertEqual(response.status_code, 202)
+        job = response.json()["data"]
+        self.assertEqual((job["status"], job["format"]), ("pending", "ndjson"))
+        job_id, user_id, query_string, export_format = delay.call_args.args
+        self.assertEqual((job_id, user_id, export_format), (job["id"], self.viewer.pk, "ndjson"))
+        self.assertEqual(QueryDict(query_string)["is_active"], "true")
+
+        response = self.viewer_client.get(f"{EXPORT_JOBS_URL}{job_id}/")
+        self.assertEqual(response.json()["data"]["status"], "pending")
+        self.assertEqual(self.editor_client.get(f"{EXPORT_JOBS_URL}{job_id}/").status_code, 404)
+
+    def test_background_export_reports_broker_outage(self):
+        with mock.patch("apps.records.tasks.export_records.delay", side_effect=OSError("broker down")), \
+                self.assertLogs("apps.records.services.export_service", "ERROR"):
+            response = self.viewer_client.post(EXPORT_JOBS_URL)
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(response.json()["success"])
+        self.assertNotIn("broker down", response.content.decode())
+
+    def test_background_export_validates_before_queueing(self):
+        with mock.patch("apps.records.tasks.export_records.delay") as delay:
+            response = self.viewer_client.post(f"{EXPORT_JOBS_URL}?tz=Mars/Base")
+        self.assertEqual(response.status_code, 400)
+        delay.assert_not_called()
@@ -0,0 +1,154 @@
+import io
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
+
+from botocore.exceptions import ClientError, EndpointConnectionError
+from botocore.response import StreamingBody
+from django.test import override_settings
+from django.utils.http import http_date
+
+from apps.records.tests.test_views import RecordViewTestBase
+from apps.utils.storage import MinIOStorage
+
+CONTENT = bytes(range(256)) * 40
+ETAG = '"5d41402abc4b2a76b9719d911017c592"'
+LAST_MODIFIED = datetime(2025, 5, 1, 12, 0, tzinfo=dt_timezone.utc)
+
+
+def file_url(pk):
+    return f"/api/records/{pk}/file/"
+
+
+class FakeObjectClient:
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.ranges = []
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {
+            "ContentLength": len(self.objects[Key]),
+            "ContentType": "application/pdf",
+            "ETag": ETAG,
+            "LastModified": LAST_MODIFIED,
+        }
+
+    def get_object(self, Bucket, Key, Range=None):
+        data = self.objects[Key]
+        self.ranges.append(Range)
+        if Range:
+            start, end = Range.removeprefix("bytes=").split("-")
+            data = data[int(start):int(end) + 1 if end else None]
+        return {"Body": StreamingBody(io.BytesIO(data), len(data))}
+
+
+@override_settings(RECORDS_FILE_STREAM_CHUNK_SIZE=1000)
+class RecordFileViewTests(RecordViewTestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.record.file = "records/abc/report.pdf"
+        self.record.save()
+        self.s3 = FakeObjectClient({"records/abc/report.pdf": CONTENT})
+        patcher = mock.patch.object(MinIOStorage, "client", new_callable=mock.PropertyMock, return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_streams_whole_file_in_chunks(self):
+        response = self.viewer_client.get(file_url(self.record.pk))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        chunks = list(response.streaming_content)
+        self.assertEqual(b"".join(chunks), CONTENT)
+        self.assertEqual(max(len(chunk) for chunk in chunks), 1000)
+        self.assertEqual(response["Content-Length"], str(len(CONTENT)))
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["ETag"], ETAG)
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn('filename="report.pdf"', response["Content-Disposition"])
+
+    def test_range_returns_partial_content(self):
+        response = self.viewer_client.get(file_url(self.record.pk), HTTP_RANGE="bytes=100-199")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), CONTENT[100:200])
+        self.assertEqual(response["Content-Range"], f"bytes 100-199/{len(CONTENT)}")
+        self.assertEqual(response["Content-Length"], "100")
+        self.assertEqual(self.s3.ranges, ["bytes=100-199"])
+
+    def test_suffix_range(self):
+        response = self.viewer_client.get(file_url(self.record.pk), HTTP_RANGE="bytes=-10")
+        self.assertEqual(b"".join(response.streaming_content), CONTENT[-10:])
+
+    def test_unsatisfiable_range(self):
+        response = self.viewer_client.get(file_url(self.record.pk), HTTP_RANGE=f"bytes={len(CONTENT)}-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{len(CONTENT)}")
+
+    def test_stale_if_range_serves_whole_file(self):
+        response = self.viewer_client.get(
+            file_url(self.record.pk), HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"other"',
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.viewer_client.get(
+            file_url(self.record.pk), HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE=ETAG,
+        )
+        self.assertEqual(response.status_code, 206)
+
+    def test_conditional_headers(self):
+        response = self.viewer_client.get(file_url(self.record.pk), HTTP_IF_NONE_MATCH=ETAG)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], ETAG)
+        response = self.viewer_client.get(
+            file_url(self.record.pk), HTTP_IF_MODIFIED_SINCE=http_date(LAST_MODIFIED.timestamp()),
+        )
+        self.assertEqual(response.status_code, 304)
+        response = self.viewer_client.get(file_url(self.record.pk), HTTP_IF_MATCH='"other"')
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.s3.ranges, [])
+
+    def test_redirect_to_presigned_url(self):
+        with mock.patch.object(MinIOStorage, "presigned_url", return_value="https://minio.test/signed") as presign:
+            response = self.viewer_client.get(file_url(self.record.pk), {"redirect": "true"})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], "https://minio.test/signed")
+        presign.assert_called_once_with("records/abc/report.pdf")
+
+    @override_settings(RECORDS_FILE_REDIRECT=True)
+    def test_redirect_default_can_be_overridden(self):
+        response = self.viewer_client.get(file_url(self.record.pk), {"redirect": "false"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_record_without_file_or_object(self):
+        self.record.file = None
+        self.record.save()
+        self.assertEqual(self.viewer_client.get(file_url(self.record.pk)).status_code, 404)
+        self.record.file = "records/missing.pdf"
+        self.record.save()
+        self.assertEqual(self.viewer_client.get(file_url(self.record.pk)).status_code, 404)
+
+    def test_object_deleted_after_head(self):
+        # Removed between the HEAD and the GET: still a 404, not a 500.
+        missing = ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        with mock.patch.object(self.s3, "get_object", side_effect=missing):
+            response = self.viewer_client.get(file_url(self.record.pk))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["message"], "File not found in storage")
+
+    def test_storage_errors(self):
+        denied = ClientError({"Error": {"Code": "AccessDenied", "Message": "secret"}}, "HeadObject")
+        with mock.patch.object(self.s3, "head_object", side_effect=denied), \
+                self.assertLogs("apps.records.api.views.file_views", "ERROR"):
+            response = self.viewer_client.get(file_url(self.record.pk))
+        self.assertEqual(response.status_code, 502)
+        self.assertNotIn("secret", response.content.decode())
+
+        down = EndpointConnectionError(endpoint_url="http://minio:9000")
+        with mock.patch.object(MinIOStorage, "presigned_url", side_effect=down), \
+                self.assertLogs("apps.records.api.views.file_views", "ERROR"):
+            response = self.viewer_client.get(file_url(self.record.pk), {"redirect": "true"})
+        self.assertEqual(response.status_code, 503)
+
+    def test_no_role_denied(self):
+        self.assertEqual(self.no_role_client.get(file_url(self.record.pk)).status_code, 403)
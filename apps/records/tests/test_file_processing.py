@@ -0,0 +1,138 @@
+import hashlib
+import io
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
+from django.test import TestCase
+from PIL import Image
+
+from apps.records.models import DataRecord
+from apps.records.selectors import RecordDetailCache
+from apps.records.selectors.records_selector import DataRecordSelector
+from apps.records.services import DataRecordService, ObjectCleanupService, RecordFileProcessingService
+from apps.records.services.file_processing_service import detect_mime_type
+from apps.records.tasks import process_record_file
+
+
+def _png(width, height, mode="RGB") -> bytes:
+    out = io.BytesIO()
+    Image.new(mode, (width, height), "red").save(out, "PNG")
+    return out.getvalue()
+
+
+class DetectMimeTypeTests(TestCase):
+
+    def test_signatures_win_over_names(self):
+        self.assertEqual(detect_mime_type(b"%PDF-1.7\n", "scan.txt"), "application/pdf")
+        self.assertEqual(detect_mime_type(_png(1, 1), "a.bin"), "image/png")
+
+    def test_text_and_binary(self):
+        self.assertEqual(detect_mime_type(b"a,b\n1,2\n", "data.csv"), "text/csv")
+        self.assertEqual(detect_mime_type("naïve".encode()[:3], "notes"), "text/plain")
+        self.assertEqual(detect_mime_type(b"\x00\x01\x02", "blob"), "application/octet-stream")
+
+
+class RecordFileProcessingServiceTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.storage = InMemoryStorage()
+        for target, name in ((RecordFileProcessingService, "_storage"), (RecordFileProcessingService, "_thumbnail_storage"),
+                             (ObjectCleanupService, "_storage")):
+            patcher = mock.patch.object(target, name, return_value=self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _record(self, name, content):
+        key = self.storage.save(name, ContentFile(content))
+        return DataRecordService.create_record(title="Upload", file=key)
+
+    def test_text_file_is_indexed_for_search(self):
+        content = b"Quarterly ledger reconciliation notes\n"
+        record = self._record("records/a/notes.txt", content)
+        self.assertEqual(record.file_status, "pending")
+        RecordDetailCache.set(record, {"id": record.pk})
+
+        processed = RecordFileProcessingService.process(record.pk)
+
+        self.assertEqual(processed.file_status, "completed")
+        self.assertEqual(processed.file_size, len(content))
+        self.assertEqual(processed.file_checksum, hashlib.sha256(content).hexdigest())
+        self.assertEqual(processed.file_mime_type, "text/plain")
+        self.assertEqual(processed.file_text, content.decode())
+        self.assertFalse(processed.thumbnail)
+        self.assertGreater(processed.updated_at, record.updated_at)
+        self.assertIsNone(RecordDetailCache.get(record.pk))
+        self.assertEqual(list(DataRecordSelector.search_records("reconcil")), [processed])
+
+    def test_image_gets_a_thumbnail(self):
+        record = self._record("records/a/photo.png", _png(600, 300, "RGBA"))
+
+        processed = RecordFileProcessingService.process(record.pk)
+
+        self.assertEqual(processed.file_mime_type, "image/png")
+        self.assertEqual(processed.file_text, "")
+        self.assertTrue(processed.thumbnail.name.startswith(f"thumbnails/{record.pk}/"))
+        with self.storage.open(processed.thumbnail.name) as f, Image.open(f) as thumbnail:
+            self.assertEqual(thumbnail.size, (256, 128))
+
+    def test_replacing_and_clearing_the_file_replaces_the_thumbnail(self):
+        record = self._record("records/a/one.png", _png(10, 10))
+        first = RecordFileProcessingService.process(record.pk).thumbnail.name
+
+        key = self.storage.save("records/b/two.png", ContentFile(_png(20, 20)))
+        record = DataRecordService.update_record(record.pk, file=key)
+        self.assertEqual((record.file_status, record.file_checksum, record.file_size), ("pending", "", None))
+        second = RecordFileProcessingService.process(record.pk).thumbnail.name
+        self.assertNotEqual(first, second)
+        self.assertTrue(self.storage.exists(first))
+        ObjectCleanupService.purge()
+        self.assertFalse(self.storage.exists(first))
+
+        DataRecordService.update_record(record.pk, file=None)
+        record = RecordFileProcessingService.process(record.pk)
+        self.assertEqual(record.file_status, "")
+        self.assertFalse(record.thumbnail)
+        ObjectCleanupService.purge()
+        self.assertFalse(self.storage.exists(second))
+
+    def test_results_for_a_replaced_file_are_dropped(self):
+        record = self._record("records/a/one.png", _png(10, 10))
+        extract = RecordFileProcessingService._extract
+
+        def replace_while_reading(name):
+            DataRecord.objects.filter(pk=record.pk).update(file="records/b/newer.png")
+            return extract(name)
+
+        with mock.patch.object(RecordFileProcessingService, "_extract", side_effect=replace_while_reading):
+            self.assertIsNone(RecordFileProcessingService.process(record.pk))
+
+        record.refresh_from_db()
+        self.assertEqual((record.file_status, record.file_checksum), ("pending", ""))
+        ObjectCleanupService.purge()
+        self.assertEqual(self.storage.listdir(f"thumbnails/{record.pk}")[1], [])
+
+    def test_failure_is_recorded(self):
+        record = DataRecordService.create_record(title="Missing", file="records/a/gone.pdf")
+        with self.assertLogs("apps.records.services.file_processing_service", "ERROR"), \
+                self.assertRaises(FileNotFoundError):
+            RecordFileProcessingService.process(record.pk)
+        record.refresh_from_db()
+        self.assertEqual(record.file_status, "failed")
+
+
+class FileProcessingSchedulingTests(TestCase):
+
+    def test_file_changes_queue_processing_after_commit(self):
+        with mock.patch.object(process_record_file, "apply_async") as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                record = DataRecordService.create_record(title="A", file="records/a/x.pdf")
+                DataRecordService.create_record(title="No file")
+                DataRecordService.update_record(record.pk, title="Renamed")
+            apply_async.assert_called_once_with((record.pk,), {})
+
+            with self.captureOnCommitCallbacks(execute=True):
+                DataRecordService.update_record(record.pk, file="records/b/y.pdf")
+            self.assertEqual(apply_async.call_count, 2)
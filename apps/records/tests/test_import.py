@@ -0,0 +1,280 @@
+import json
+import os
+import tempfile
+import uuid
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from rest_framework.test import APITransactionTestCase
+
+from apps.records.models import DataRecord, RecordImportJob
+from apps.records.services import RecordBulkService, RecordImportService
+from apps.records.tests.test_views import RecordViewTestBase, auth_client, make_user
+from apps.utils.storage import MinIOStorage
+from apps.utils.tests.test_storage import FakeMultipartClient
+
+IMPORTS_URL = "/api/records/imports/"
+
+CSV = (
+    "\ufefftitle,description,is_active\n"
+    "First,one,true\n"
+    ",no title,true\n"
+    "Second,\"two, quoted\",no\n"
+    "Third,,maybe\n"
+    "Fourth,,\n"
+)
+
+
+def _write(test, content, suffix):
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, "wb") as f:
+        f.write(content if isinstance(content, bytes) else content.encode("utf-8"))
+    test.addCleanup(os.remove, path)
+    return path
+
+
+@override_settings(RECORDS_IMPORT_BATCH_SIZE=2)
+class RecordImportServiceTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def _run(self, content, suffix):
+        job = RecordImportService.create_job(_write(self, content, suffix), None, local=True)
+        return RecordImportService.run(job.pk)
+
+    def test_csv_import_reports_rejected_rows(self):
+        job = self._run(CSV, ".csv")
+
+        self.assertEqual(job.status, RecordImportJob.Status.COMPLETED)
+        self.assertEqual((job.rows_processed, job.rows_created, job.rows_rejected), (5, 3, 2))
+        self.assertEqual(job.rejected, [
+            {"row": 2, "message": "Title cannot be empty"},
+            {"row": 4, "message": "is_active must be true or false"},
+        ])
+        self.assertEqual(
+            list(DataRecord.objects.order_by("pk").values_list("title", "description", "is_active")),
+            [("First", "one", True), ("Second", "two, quoted", False), ("Fourth", "", True)],
+        )
+        self.assertIsNotNone(job.finished_at)
+
+    def test_ndjson_import(self):
+        lines = [json.dumps({"title": "A", "is_active": False}), "", "{broken", json.dumps(["list"]), json.dumps({"title": "B"})]
+        job = self._run("\n".join(lines) + "\n", ".ndjson")
+
+        self.assertEqual((job.rows_processed, job.rows_created, job.rows_rejected), (4, 2, 2))
+        self.assertEqual([r["message"] for r in job.rejected], ["Invalid JSON", "Row must be an object"])
+        self.assertFalse(DataRecord.objects.get(title="A").is_active)
+
+    def test_invalid_utf8_rejects_only_its_row(self):
+        job = self._run(b"title,description\nA,ok\nB,bad \xff byte\nC,\"multi\nline\"\n", ".csv")
+        self.assertEqual((job.status, job.rows_processed, job.rows_created), ("completed", 3, 2))
+        self.assertEqual(job.rejected, [{"row": 2, "message": "Row is not valid UTF-8"}])
+        self.assertEqual(DataRecord.objects.get(title="C").description, "multi\nline")
+
+        job = self._run(b'{"title": "A"}\n{"title": "\xff"}\n{"title": "B"}\n', ".ndjson")
+        self.assertEqual((job.rows_processed, job.rows_created), (3, 2))
+        self.assertEqual(job.rejected, [{"row": 2, "message": "Row is not valid UTF-8"}])
+
+    @override_settings(RECORDS_IMPORT_MAX_FIELD_SIZE=20)
+    def test_oversized_csv_field_rejects_only_its_row(self):
+        job = self._run("title,description\nA,short\nB," + "x" * 21 + "\nC,short\n", ".csv")
+        self.assertEqual((job.status, job.rows_processed, job.rows_created), ("completed", 3, 2))
+        self.assertEqual(job.rejected[0]["row"], 2)
+        self.assertIn("field larger than field limit", job.rejected[0]["message"])
+
+    def test_resume_skips_past_rejected_rows(self):
+        content = b"title\nA\n\xff\nB\nC\n"
+        job = RecordImportService.create_job(_write(self, content, ".csv"), None, local=True)
+        RecordImportJob.objects.filter(pk=job.pk).update(status=RecordImportJob.Status.FAILED, rows_processed=2)
+        job = RecordImportService.run(job.pk)
+        self.assertEqual((job.status, job.rows_processed, job.rows_created), ("completed", 4, 2))
+        self.assertEqual(sorted(DataRecord.objects.values_list("title", flat=True)), ["B", "C"])
+
+    @override_settings(RECORDS_IMPORT_MAX_REPORTED_ERRORS=1)
+    def test_reported_rejections_are_capped(self):
+        job = self._run("title\n\n \n\"\"\n\"\"\n", ".csv")
+        self.assertEqual(job.rows_rejected, 3)
+        self.assertEqual(job.rejected, [{"row": 1, "message": "Title cannot be empty"}])
+
+    def test_failed_job_resumes_after_last_committed_batch(self):
+        content = "title\n" + "".join(f"Row {i}\n" for i in range(5))
+        job = RecordImportService.create_job(_write(self, content, ".csv"), None, local=True)
+        original = RecordBulkService.create_records
+        calls = []
+
+        def flaky(items):
+            calls.append(len(items))
+            if len(calls) == 2:
+                raise OSError("connection lost")
+            return original(items)
+
+        with mock.patch.object(RecordBulkService, "create_records", side_effect=flaky), \
+                self.assertLogs("apps.records.services.import_service", "ERROR"), \
+                self.assertRaises(OSError):
+            RecordImportService.run(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.rows_processed, job.error), ("failed", 2, "connection lost"))
+        self.assertEqual(DataRecord.objects.count(), 2)
+
+        job = RecordImportService.run(job.pk)
+        self.assertEqual((job.status, job.rows_processed, job.rows_created), ("completed", 5, 5))
+        self.assertEqual(
+            sorted(DataRecord.objects.values_list("title", flat=True)), [f"Row {i}" for i in range(5)],
+        )
+
+    def test_reads_source_from_storage(self):
+        storage = InMemoryStorage()
+        key = storage.save("imports/abc/data.csv", ContentFile(b"title\nStored\n"))
+        with mock.patch.object(RecordImportService, "_storage", return_value=storage):
+            job = RecordImportService.run(RecordImportService.create_job(key, None).pk)
+        self.assertEqual(job.rows_created, 1)
+        self.assertTrue(DataRecord.objects.filter(title="Stored").exists())
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValidationError):
+            RecordImportService.create_job("data.xlsx", None)
+        self.assertEqual(RecordImportService.create_job("data.txt", "ndjson").format, "ndjson")
+
+
+class ImportRecordsCommandTests(TestCase):
+
+    def test_imports_file_and_prints_rejections(self):
+        out = StringIO()
+        call_command("import_records", _write(self, CSV, ".csv"), batch_size=2, stdout=out)
+
+        output = out.getvalue()
+        self.assertEqual(output.count("Processed"), 3)
+        self.assertIn("Row 4: is_active must be true or false", output)
+        self.assertIn("Imported 3 of 5 rows (2 rejected).", output)
+        self.assertEqual(DataRecord.objects.count(), 3)
+
+    def test_resume(self):
+        path = _write(self, "title\nOnly\n", ".csv")
+        job = RecordImportService.create_job(path, None, local=True)
+        job.status = RecordImportJob.Status.FAILED
+        job.save()
+
+        call_command("import_records", resume=str(job.pk), stdout=StringIO())
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.rows_created), ("completed", 1))
+
+    def test_bad_arguments(self):
+        with self.assertRaises(CommandError):
+            call_command("import_records", "/does/not/exist.csv", stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command("import_records", resume=str(uuid.uuid4()), stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command("import_records", _write(self, "", ".txt"), stdout=StringIO())
+
+
+class RecordImportViewTests(RecordViewTestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.s3 = FakeMultipartClient()
+        patcher = mock.patch.object(MinIOStorage, "client", new_callable=mock.PropertyMock, return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_upload_queues_job(self):
+        upload = SimpleUploadedFile("records.csv", b"title\nA\n")
+        with mock.patch("apps.records.tasks.import_records.delay") as delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.editor_client.post(IMPORTS_URL, {"file": upload}, format="multipart")
+
+        self.assertEqual(response.status_code, 202)
+        data = response.json()["data"]
+        self.assertEqual((data["status"], data["format"]), ("pending", "csv"))
+        delay.assert_called_once_with(data["id"])
+
+        job = RecordImportJob.objects.get(pk=data["id"])
+        self.assertRegex(job.source, r"^imports/[0-9a-f]{32}/records\.csv$")
+        self.assertEqual(self.s3.completed[job.source], b"title\nA\n")
+
+        response = self.editor_client.get(f"{IMPORTS_URL}{job.pk}/")
+        self.assertEqual(response.json()["data"]["id"], data["id"])
+        self.assertEqual(self.admin_client.get(f"{IMPORTS_URL}{job.pk}/").status_code, 404)
+
+    def test_unknown_format_discards_upload(self):
+        upload = SimpleUploadedFile("records.xlsx", b"data")
+        with mock.patch("apps.records.tasks.import_records.delay") as delay, \
+                mock.patch.object(MinIOStorage, "delete") as delete:
+            response = self.editor_client.post(IMPORTS_URL, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 400)
+        delay.assert_not_called()
+        delete.assert_called_once_with(next(iter(self.s3.completed)))
+
+    def test_resume_only_failed_jobs(self):
+        job = RecordImportService.create_job("imports/x/a.csv", None, user_id=self.editor.pk)
+        url = f"{IMPORTS_URL}{job.pk}/resume/"
+        with mock.patch("apps.records.tasks.import_records.delay") as delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.editor_client.post(url).status_code, 400)
+            job.status = RecordImportJob.Status.FAILED
+            job.save()
+            response = self.editor_client.post(url)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["data"]["status"], "pending")
+        delay.assert_called_once_with(str(job.pk))
+
+    def test_unqueued_job_can_be_resumed(self):
+        job = RecordImportService.create_job("imports/x/a.csv", None, user_id=self.editor.pk)
+        job.status = RecordImportJob.Status.FAILED
+        job.save()
+        url = f"{IMPORTS_URL}{job.pk}/resume/"
+        with mock.patch("apps.records.tasks.import_records.delay", side_effect=OSError("broker down")), \
+                self.assertLogs("apps.records.services.import_service", "ERROR"), \
+                self.captureOnCommitCallbacks(execute=True):
+            self.editor_client.post(url)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, RecordImportJob.Status.FAILED)
+        self.assertNotIn("broker down", job.error)
+
+        with mock.patch("apps.records.tasks.import_records.delay") as delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.editor_client.post(url).status_code, 202)
+        delay.assert_called_once_with(str(job.pk))
+
+    def test_permissions(self):
+        self.assertEqual(self.viewer_client.post(IMPORTS_URL, {}, format="multipart").status_code, 403)
+        self.assertEqual(self.anon_client.get(f"{IMPORTS_URL}{uuid.uuid4()}/").status_code, 401)
+
+
+class RecordImportQueueFailureTests(APITransactionTestCase):
+    """Outside a test transaction the task is sent when the job commits, before the response."""
+
+    def setUp(self):
+        self.editor = make_user("editor_user", "editor")
+        self.client = auth_client(self.editor)
+        patcher = mock.patch.object(
+            MinIOStorage, "client", new_callable=mock.PropertyMock, return_value=FakeMultipartClient(),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_broker_outage_returns_503_and_fails_job(self):
+        upload = SimpleUploadedFile("records.csv", b"title\nA\n")
+        with mock.patch("apps.records.tasks.import_records.delay", side_effect=OSError("broker down")), \
+                self.assertLogs("apps.records.services.import_service", "ERROR"):
+            response = self.client.post(IMPORTS_URL, {"file": upload}, format="multipart")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertNotIn("broker down", response.content.decode())
+        job = RecordImportJob.objects.get(pk=response.json()["errors"]["id"])
+        self.assertEqual(job.status, RecordImportJob.Status.FAILED)
+
+        with mock.patch("apps.records.tasks.import_records.delay") as delay:
+            response = self.client.post(f"{IMPORTS_URL}{job.pk}/resume/")
+        self.assertEqual(response.status_code, 202)
+        delay.assert_called_once_with(str(job.pk))
@@ -0,0 +1,153 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from apps.records.models import DataRecord, FileBlob, RecordImportJob, StoredObjectDeletion
+from apps.records.services import (
+    DataRecordService, ObjectCleanupService, RecordBulkService, RecordImportService, RecordPurgeService,
+)
+from apps.records.tasks import collect_file_blobs, delete_stored_objects, process_record_file
+
+
+class ObjectCleanupServiceTests(TestCase):
+
+    def setUp(self):
+        self.storage = InMemoryStorage()
+        patcher = mock.patch.object(ObjectCleanupService, "_storage", return_value=self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(process_record_file, "apply_async")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _record(self, title="Doc", thumbnail=None):
+        key = self.storage.save(f"records/{title}.pdf", ContentFile(b"content"))
+        record = DataRecordService.create_record(title=title, file=key)
+        if thumbnail:
+            record.thumbnail = self.storage.save(thumbnail, ContentFile(b"thumb"))
+            record.save(update_fields=["thumbnail"])
+        return record
+
+    def _collect(self, args, kwargs):
+        collect_file_blobs.run(*args)
+
+    def _queued(self) -> set[str]:
+        return set(StoredObjectDeletion.objects.values_list("key", flat=True))
+
+    def test_deleted_record_objects_are_deleted_after_commit(self):
+        record = self._record(thumbnail="thumbnails/1/a.jpg")
+
+        collect = mock.patch.object(collect_file_blobs, "apply_async", side_effect=self._collect)
+        with collect, mock.patch.object(delete_stored_objects, "apply_async") as apply_async, \
+                self.captureOnCommitCallbacks(execute=True):
+            DataRecordService.delete_record(record.pk)
+            self.assertEqual(self._queued(), set())
+            RecordPurgeService.purge(older_than=0)
+            self.assertEqual(self._queued(), {"thumbnails/1/a.jpg"})
+            apply_async.assert_not_called()
+
+        self.assertEqual(self._queued(), {"records/Doc.pdf", "thumbnails/1/a.jpg"})
+        apply_async.assert_called()
+        self.assertEqual(ObjectCleanupService.purge(), 2)
+        self.assertEqual(self.storage.listdir("records")[1], [])
+        self.assertFalse(StoredObjectDeletion.objects.exists())
+
+    def test_rolled_back_purge_queues_nothing(self):
+        record = self._record(thumbnail="thumbnails/1/a.jpg")
+        DataRecordService.bulk_delete_records([record.pk])
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            RecordPurgeService.purge(older_than=0)
+            raise RuntimeError
+        self.assertFalse(StoredObjectDeletion.objects.exists())
+        self.assertTrue(DataRecord.all_objects.filter(pk=record.pk).exists())
+
+    def test_bulk_delete_queues_thumbnails_on_purge(self):
+        records = [self._record(f"Doc{i}", thumbnail=f"thumbnails/{i}/t.jpg") for i in range(3)]
+        RecordBulkService.delete_records([r.pk for r in records[:2]])
+        RecordPurgeService.purge(older_than=0)
+        self.assertEqual(self._queued(), {"thumbnails/0/t.jpg", "thumbnails/1/t.jpg"})
+
+    def test_keys_in_use_again_are_kept(self):
+        record = self._record()
+        FileBlob.objects.create(sha256="a" * 64, key="records/blob.pdf", size=1, ref_count=1)
+        self.storage.save("records/blob.pdf", ContentFile(b"x"))
+        self.storage.save("records/gone.pdf", ContentFile(b"x"))
+        ObjectCleanupService.schedule([record.file.name, "records/blob.pdf", "records/gone.pdf"])
+
+        self.assertEqual(ObjectCleanupService.purge(batch_size=2), 1)
+        self.assertEqual(sorted(self.storage.listdir("records")[1]), ["Doc.pdf", "blob.pdf"])
+        self.assertFalse(StoredObjectDeletion.objects.exists())
+
+    def test_failed_deletions_stay_queued(self):
+        self.storage.save("records/a.pdf", ContentFile(b"x"))
+        ObjectCleanupService.schedule(["records/a.pdf", "records/b.pdf"])
+        with mock.patch.object(self.storage, "delete", side_effect=[OSError("denied"), None]), \
+                self.assertLogs("apps.records.services.object_cleanup_service", "WARNING"):
+            self.assertEqual(ObjectCleanupService.purge(), 1)
+
+        pending = StoredObjectDeletion.objects.get()
+        self.assertEqual((pending.key, pending.attempts, pending.last_error), ("records/a.pdf", 1, "denied"))
+
+    def test_reconcile_queues_only_old_unreferenced_objects(self):
+        record = self._record(thumbnail="thumbnails/1/a.jpg")
+        self.storage.save("records/x/stray.pdf", ContentFile(b"x"))
+        self.storage.save("thumbnails/9/stray.jpg", ContentFile(b"x"))
+        self.storage.save("exports/job/records.csv", ContentFile(b"x"))
+
+        self.assertEqual(ObjectCleanupService.reconcile(min_age=3600), 0)
+        self.assertEqual(ObjectCleanupService.reconcile(min_age=0), 2)
+        self.assertEqual(self._queued(), {"records/x/stray.pdf", "thumbnails/9/stray.jpg"})
+        # Already queued keys are not reported twice.
+        self.assertEqual(ObjectCleanupService.reconcile(min_age=0), 0)
+
+        ObjectCleanupService.purge()
+        self.assertTrue(self.storage.exists(record.file.name))
+        self.assertTrue(self.storage.exists(record.thumbnail.name))
+        self.assertTrue(self.storage.exists("exports/job/records.csv"))
+        self.assertFalse(self.storage.exists("records/x/stray.pdf"))
+
+    @override_settings(RECORDS_EXPORT_JOB_TIMEOUT=0, RECORDS_IMPORT_SOURCE_MAX_AGE=0)
+    def test_reconcile_queues_expired_job_objects(self):
+        self.storage.save("exports/job/records.csv", ContentFile(b"x"))
+        self.storage.save("imports/a/failed.csv", ContentFile(b"x"))
+        running = self.storage.save("imports/b/running.csv", ContentFile(b"x"))
+        job = RecordImportService.create_job(running, None)
+        RecordImportJob.objects.filter(pk=job.pk).update(status=RecordImportJob.Status.RUNNING)
+
+        self.assertEqual(ObjectCleanupService.reconcile(min_age=0), 2)
+        self.assertEqual(self._queued(), {"exports/job/records.csv", "imports/a/failed.csv"})
+
+    def test_job_objects_are_kept_until_they_expire(self):
+        self.storage.save("exports/job/records.csv", ContentFile(b"x"))
+        self.storage.save("imports/a/data.csv", ContentFile(b"x"))
+        self.assertEqual(ObjectCleanupService.reconcile(min_age=0), 0)
+
+    def test_completed_import_deletes_its_source(self):
+        key = self.storage.save("imports/a/data.csv", ContentFile(b"title\nImported\n"))
+        job = RecordImportService.create_job(key, None)
+        with mock.patch.object(RecordImportService, "_storage", return_value=self.storage), \
+                mock.patch.object(delete_stored_objects, "apply_async") as apply_async, \
+                self.captureOnCommitCallbacks(execute=True):
+            RecordImportService.run(job.pk)
+        apply_async.assert_called()
+        self.assertEqual(self._queued(), {key})
+        ObjectCleanupService.purge()
+        self.assertFalse(self.storage.exists(key))
+
+    def test_reconcile_command(self):
+        self.storage.save("records/x/stray.pdf", ContentFile(b"x"))
+
+        out = StringIO()
+        call_command("reconcile_record_files", dry_run=True, min_age=0, stdout=out)
+        self.assertIn("records/x/stray.pdf", out.getvalue())
+        self.assertTrue(self.storage.exists("records/x/stray.pdf"))
+
+        out = StringIO()
+        call_command("reconcile_record_files", min_age=0, stdout=out)
+        self.assertIn("Found 1 stray objects; deleted 1 queued objects.", out.getvalue())
+        self.assertFalse(self.storage.exists("records/x/stray.pdf"))
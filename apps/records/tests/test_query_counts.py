@@ -0,0 +1,176 @@
+"""
+Pinned query counts for every endpoint in ``apps/records/api/urls.py``.
+
+A change that adds a query to a request path, e.g. loading a record the service
+loads again, fails here. Clients carry the role claims real logins get, so auth
+and permission checks cost no queries once the caches are warm. Counts include the
+SAVEPOINT/RELEASE pairs test transactions add around ``atomic`` blocks.
+"""
+import uuid
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import resolve
+
+from apps.records.api.views import AsyncRecordListView, AsyncRecordUpdateView
+from apps.records.models import RecordImportJob
+from apps.records.selectors import RecordDetailCache
+from apps.records.services import RecordImportService
+from apps.records.tests.test_file_download import FakeObjectClient, file_url
+from apps.records.tests.test_uploads import COMMIT_URL, UPLOAD_URL, stored
+from apps.records.tests.test_views import CREATE_URL, LIST_URL, RecordViewTestBase, delete_url, detail_url, update_url
+from apps.user.tokens import RoleRefreshToken
+from apps.utils import make_etag
+from apps.utils.storage import MinIOStorage
+from apps.utils.tests.test_storage import FakeMultipartClient
+
+BULK_CREATE_URL = "/api/records/bulk/create/"
+BULK_UPDATE_URL = "/api/records/bulk/update/"
+BULK_DELETE_URL = "/api/records/bulk/delete/"
+EXPORT_URL = "/api/records/export/"
+EXPORT_JOBS_URL = "/api/records/export/jobs/"
+IMPORTS_URL = "/api/records/imports/"
+
+
+class RecordEndpointQueryCountTests(RecordViewTestBase):
+
+    def setUp(self):
+        super().setUp()
+        for user, client in ((self.admin, self.admin_client), (self.editor, self.editor_client),
+                             (self.viewer, self.viewer_client)):
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {RoleRefreshToken.for_user(user).access_token}")
+            # Caches the token generation, so the counts below are the request's own.
+            client.get(f"{EXPORT_JOBS_URL}warm-up/")
+
+    def assertQueries(self, count, method, *args, **kwargs):
+        with self.assertNumQueries(count):
+            response = method(*args, **kwargs)
+        return response
+
+    def test_list(self):
+        response = self.assertQueries(4, self.viewer_client.get, LIST_URL)
+        self.assertEqual(response.status_code, 200)
+
+    def test_create(self):
+        response = self.assertQueries(1, self.editor_client.post, CREATE_URL, {"title": "New"}, format="json")
+        self.assertEqual(response.status_code, 201)
+
+    def test_retrieve(self):
+        response = self.assertQueries(1, self.viewer_client.get, detail_url(self.record.pk))
+        self.assertEqual(response.status_code, 200)
+        # Served from the cache now.
+        self.assertQueries(0, self.viewer_client.get, detail_url(self.record.pk))
+
+    def test_update(self):
+        response = self.assertQueries(
+            3, self.editor_client.patch, update_url(self.record.pk), {"title": "Renamed"}, format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_conditional_update_reads_once(self):
+        etag = make_etag(RecordDetailCache.get_version(self.record))
+        response = self.assertQueries(
+            4, self.editor_client.patch, update_url(self.record.pk), {"title": "Renamed"},
+            format="json", HTTP_IF_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_update_missing_record(self):
+        response = self.assertQueries(4, self.editor_client.patch, update_url(9999), {"title": "X"}, format="json")
+        self.assertEqual(response.status_code, 404)
+
+    def test_delete(self):
+        response = self.assertQueries(3, self.admin_client.delete, delete_url(self.record.pk))
+        self.assertEqual(response.status_code, 204)
+
+    def test_conditional_delete_reads_once(self):
+        etag = make_etag(RecordDetailCache.get_version(self.record))
+        response = self.assertQueries(4, self.admin_client.delete, delete_url(self.record.pk), HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 204)
+
+    def test_bulk_create(self):
+        response = self.assertQueries(
+            3, self.editor_client.post, BULK_CREATE_URL, [{"title": "a"}, {"title": "b"}], format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_bulk_update(self):
+        response = self.assertQueries(
+            4, self.editor_client.patch, BULK_UPDATE_URL, [{"id": self.record.pk, "title": "b"}], format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_bulk_delete(self):
+        response = self.assertQueries(
+            4, self.admin_client.post, BULK_DELETE_URL, {"ids": [self.record.pk]}, format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_export(self):
+        response = self.viewer_client.get(EXPORT_URL)
+        with self.assertNumQueries(1):
+            b"".join(response.streaming_content)
+
+    def test_export_jobs(self):
+        with mock.patch("apps.records.tasks.export_records.delay"):
+            response = self.assertQueries(0, self.viewer_client.post, EXPORT_JOBS_URL)
+        self.assertEqual(response.status_code, 202)
+
+        job_id = response.json()["data"]["id"]
+        self.assertQueries(0, self.viewer_client.get, f"{EXPORT_JOBS_URL}{job_id}/")
+
+    def test_file(self):
+        self.record.file = "records/abc/report.pdf"
+        self.record.save()
+        s3 = FakeObjectClient({"records/abc/report.pdf": b"data"})
+        with mock.patch.object(MinIOStorage, "client", new_callable=mock.PropertyMock, return_value=s3):
+            response = self.assertQueries(1, self.viewer_client.get, file_url(self.record.pk))
+        self.assertEqual(response.status_code, 200)
+
+    def test_import(self):
+        upload = SimpleUploadedFile("records.csv", b"title\nA\n")
+        with mock.patch.object(MinIOStorage, "client", new_callable=mock.PropertyMock,
+                               return_value=FakeMultipartClient()), \
+                mock.patch("apps.records.tasks.import_records.delay"):
+            response = self.assertQueries(
+                1, self.editor_client.post, IMPORTS_URL, {"file": upload}, format="multipart",
+            )
+        self.assertEqual(response.status_code, 202)
+
+    def test_import_job(self):
+        job = RecordImportService.create_job("imports/x/a.csv", None, user_id=self.editor.pk)
+        response = self.assertQueries(1, self.editor_client.get, f"{IMPORTS_URL}{job.pk}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertQueries(1, self.editor_client.get, f"{IMPORTS_URL}{uuid.uuid4()}/")
+
+    def test_import_resume(self):
+        job = RecordImportService.create_job("imports/x/a.csv", None, user_id=self.editor.pk)
+        RecordImportJob.objects.filter(pk=job.pk).update(status=RecordImportJob.Status.FAILED)
+        with mock.patch("apps.records.tasks.import_records.delay"):
+            response = self.assertQueries(2, self.editor_client.post, f"{IMPORTS_URL}{job.pk}/resume/")
+        self.assertEqual(response.status_code, 202)
+
+    def test_upload(self):
+        response = self.assertQueries(
+            0, self.editor_client.post, UPLOAD_URL, {"filename": "a.pdf", "size": 10}, format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+    def test_upload_commit(self):
+        ticket = self.editor_client.post(UPLOAD_URL, {"filename": "a.pdf", "size": 10}, format="json").data["data"]
+        with stored(10):
+            response = self.assertQueries(
+                5, self.editor_client.post, COMMIT_URL,
+                {"upload_token": ticket["upload_token"], "title": "Uploaded"}, format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+
+
+@override_settings(RECORDS_ASYNC_VIEWS=True, ROOT_URLCONF="apps.records.tests.test_async_views")
+class AsyncRecordEndpointQueryCountTests(RecordEndpointQueryCountTests):
+    """The same counts with the async list, create, retrieve, update and delete views routed."""
+
+    def test_routes_the_async_views(self):
+        self.assertIs(resolve(LIST_URL).func.view_class, AsyncRecordListView)
+        self.assertIs(resolve(update_url(1)).func.view_class, AsyncRecordUpdateView)
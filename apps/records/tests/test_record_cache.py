@@ -0,0 +1,105 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.records.models.records_model import DataRecord
+from apps.records.selectors.record_cache import RecordDetailCache
+from apps.records.services.records_service import DataRecordService
+
+
+def serialize(record):
+    return {"id": record.id, "title": record.title, "is_active": record.is_active}
+
+
+class RecordDetailCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.record = DataRecord.objects.create(title="Report")
+
+    def test_hit_needs_no_query(self):
+        RecordDetailCache.get_or_build(self.record.id, serialize)
+        with self.assertNumQueries(0):
+            payload = RecordDetailCache.get_or_build(self.record.id, serialize)
+        self.assertEqual(payload["title"], "Report")
+
+    def test_missing_record_is_not_cached(self):
+        self.assertIsNone(RecordDetailCache.get_or_build(9999, serialize))
+        self.assertIsNone(RecordDetailCache.get_cached_version(9999))
+
+    def test_update_invalidates(self):
+        RecordDetailCache.get_or_build(self.record.id, serialize)
+        DataRecordService.update_record(self.record.id, title="Updated")
+        self.assertIsNone(RecordDetailCache.get(self.record.id))
+        self.assertEqual(RecordDetailCache.get_or_build(self.record.id, serialize)["title"], "Updated")
+
+    def test_toggle_invalidates(self):
+        RecordDetailCache.get_or_build(self.record.id, serialize)
+        DataRecordService.toggle_record_active_status(self.record.id)
+        self.assertFalse(RecordDetailCache.get_or_build(self.record.id, serialize)["is_active"])
+
+    def test_delete_invalidates(self):
+        RecordDetailCache.get_or_build(self.record.id, serialize)
+        DataRecordService.delete_record(self.record.id)
+        self.assertIsNone(RecordDetailCache.get_or_build(self.record.id, serialize))
+
+    def test_bulk_operations_invalidate(self):
+        other = DataRecord.objects.create(title="Other")
+        for record in (self.record, other):
+            RecordDetailCache.get_or_build(record.id, serialize)
+
+        DataRecordService.bulk_update_active_status([self.record.id, other.id], False)
+        self.assertIsNone(RecordDetailCache.get(self.record.id))
+        self.assertIsNone(RecordDetailCache.get(other.id))
+
+        RecordDetailCache.get_or_build(other.id, serialize)
+        DataRecordService.bulk_delete_records([other.id])
+        self.assertIsNone(RecordDetailCache.get_or_build(other.id, serialize))
+
+    def test_reader_with_older_row_cannot_restore_it_after_invalidation(self):
+        generation = RecordDetailCache.get_generation(self.record.id)
+        stale = DataRecord.objects.get(pk=self.record.id)
+        DataRecordService.update_record(self.record.id, title="Updated")
+        RecordDetailCache.set(stale, serialize(stale), generation)
+
+        self.assertIsNone(RecordDetailCache.get(self.record.id))
+        self.assertEqual(RecordDetailCache.get_or_build(self.record.id, serialize)["title"], "Updated")
+
+    def test_set_keeps_the_pointer_another_reader_set(self):
+        current = DataRecord.objects.get(pk=self.record.id)
+        RecordDetailCache.set(current, serialize(current))
+        older = DataRecord.objects.get(pk=self.record.id)
+        older.updated_at -= timedelta(seconds=1)
+        older.title = "Older"
+        RecordDetailCache.set(older, serialize(older))
+
+        self.assertEqual(RecordDetailCache.get(self.record.id)["title"], "Report")
+
+    @override_settings(RECORDS_DETAIL_CACHE_LOCK_WAIT=2)
+    def test_concurrent_miss_waits_for_rebuilding_caller(self):
+        cache.add(RecordDetailCache._lock_key(self.record.id), "other-caller")
+
+        def rebuild():
+            time.sleep(0.1)
+            RecordDetailCache.set(self.record, serialize(self.record))
+
+        worker = threading.Thread(target=rebuild)
+        worker.start()
+        try:
+            with self.assertNumQueries(0):
+                payload = RecordDetailCache.get_or_build(self.record.id, serialize)
+        finally:
+            worker.join()
+        self.assertEqual(payload["id"], self.record.id)
+
+    @override_settings(RECORDS_DETAIL_CACHE_LOCK_WAIT=0.05)
+    def test_abandoned_lock_falls_back_to_database(self):
+        lock_key = RecordDetailCache._lock_key(self.record.id)
+        cache.add(lock_key, "other-caller")
+        with self.assertNumQueries(1):
+            payload = RecordDetailCache.get_or_build(self.record.id, serialize)
+        self.assertEqual(payload["title"], "Report")
+        self.assertEqual(cache.get(lock_key), "other-caller")
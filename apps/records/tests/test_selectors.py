@@ -39,3 +39,16 @@ class DataRecordSelectorTests(TestCase):
     def test_search_by_description(self):
         qs = DataRecordSelector.search_records("inactive")
         self.assertIn(self.inactive, qs)
+
+    def test_search_matches_word_prefix(self):
+        qs = DataRecordSelector.search_records("Rep")
+        self.assertIn(self.active, qs)
+
+    def test_search_ranks_title_matches_first(self):
+        in_description = DataRecord.objects.create(title="Misc", description="quarterly budget")
+        in_title = DataRecord.objects.create(title="Budget", description="misc")
+        results = list(DataRecordSelector.search_records("budget"))
+        self.assertEqual(results, [in_title, in_description])
+
+    def test_search_without_words_returns_nothing(self):
+        self.assertEqual(DataRecordSelector.search_records("!!!").count(), 0)
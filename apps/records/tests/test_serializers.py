@@ -0,0 +1,44 @@
+from datetime import datetime, timezone as dt_timezone
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.records.api.serializers import DataRecordListSerializer, DataRecordSerializer
+from apps.records.models.records_model import DataRecord
+
+
+class DataRecordListSerializerTests(TestCase):
+
+    def setUp(self):
+        # Presigned URLs are cached, so both serializers embed the same signature.
+        cache.clear()
+        DataRecord.objects.create(title="No file", description="")
+        DataRecord.objects.create(title="With file", description="ünïcode", file="records/report.pdf", is_active=False)
+        record = DataRecord.objects.create(title="Microseconds")
+        DataRecord.objects.filter(pk=record.pk).update(
+            created_at=datetime(2025, 3, 9, 7, 30, 0, 123456, tzinfo=dt_timezone.utc),
+        )
+
+    def assertSameOutput(self, queryset):
+        expected = DataRecordSerializer(queryset, many=True).data
+        actual = DataRecordListSerializer(DataRecordListSerializer.values(queryset)).data
+        self.assertEqual(actual, expected)
+        self.assertEqual(JSONRenderer().render(actual), JSONRenderer().render(expected))
+
+    def test_matches_model_serializer(self):
+        self.assertSameOutput(DataRecord.objects.order_by("id"))
+
+    def test_matches_model_serializer_in_other_time_zone(self):
+        with timezone.override("America/New_York"):
+            self.assertSameOutput(DataRecord.objects.order_by("id"))
+
+    @override_settings(REST_FRAMEWORK={"DATETIME_FORMAT": "%Y-%m-%d %H:%M"})
+    def test_matches_model_serializer_with_custom_datetime_format(self):
+        self.assertSameOutput(DataRecord.objects.order_by("id"))
+
+    def test_values_keep_annotations(self):
+        DataRecord.objects.filter(title="With file").update(description="quarterly report")
+        rows = list(DataRecordListSerializer.values(DataRecord.objects.search("report")))
+        self.assertIn("search_rank", rows[0])
+        self.assertNotIn("search_rank", DataRecordListSerializer(rows).data[0])
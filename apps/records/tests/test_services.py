@@ -1,8 +1,12 @@
+import threading
+
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
 
 from apps.records.models.records_model import DataRecord
-from apps.records.services.records_service import DataRecordService
+from apps.records.selectors.record_cache import RecordDetailCache
+from apps.records.services.records_service import DataRecordService, RecordVersionConflict
 
 
 class CreateRecordTests(TestCase):
@@ -59,6 +63,22 @@ class UpdateRecordTests(TestCase):
         with self.assertRaises(ValidationError):
             DataRecordService.update_record(self.record.id, title="")
 
+    def test_update_is_one_statement(self):
+        # SAVEPOINT, UPDATE ... RETURNING, RELEASE SAVEPOINT.
+        with self.assertNumQueries(3) as ctx:
+            updated = DataRecordService.update_record(self.record.id, title="Updated")
+        self.assertIn("RETURNING", ctx.captured_queries[1]["sql"])
+        self.assertEqual(updated.description, "desc")
+        self.assertGreater(updated.updated_at, self.record.updated_at)
+
+    def test_locked_update_writes_only_changed_columns(self):
+        version = RecordDetailCache.get_version(self.record)
+        with self.assertNumQueries(4) as ctx:
+            DataRecordService.update_record(self.record.id, expected_version=version, title="Updated")
+        update = ctx.captured_queries[2]["sql"]
+        self.assertIn('"title"', update)
+        self.assertNotIn('"description"', update)
+
 
 class DeleteRecordTests(TestCase):
 
@@ -86,6 +106,60 @@ class ToggleActiveTests(TestCase):
         result = DataRecordService.toggle_record_active_status(record.id)
         self.assertTrue(result.is_active)
 
+    def test_toggle_is_one_statement(self):
+        record = DataRecord.objects.create(title="T", is_active=True)
+        with self.assertNumQueries(1):
+            result = DataRecordService.toggle_record_active_status(record.id)
+        self.assertEqual(result.title, "T")
+        self.assertGreater(result.updated_at, record.updated_at)
+
+    def test_toggle_raises_for_nonexistent_record(self):
+        with self.assertRaises(ValidationError):
+            DataRecordService.toggle_record_active_status(9999)
+
+
+class ConcurrentWriteTests(TransactionTestCase):
+    """Writes from several connections at once; none of them may be lost."""
+
+    def _run_concurrently(self, *targets):
+        barrier = threading.Barrier(len(targets))
+        errors = []
+
+        def run(target):
+            try:
+                barrier.wait()
+                target()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run, args=(target,)) for target in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_concurrent_toggles_are_not_lost(self):
+        record = DataRecord.objects.create(title="T", is_active=True)
+        toggle = lambda: DataRecordService.toggle_record_active_status(record.pk)  # noqa: E731
+        self._run_concurrently(*[toggle] * 7)
+        record.refresh_from_db()
+        self.assertFalse(record.is_active)
+
+    def test_concurrent_updates_of_different_fields_are_not_lost(self):
+        record = DataRecord.objects.create(title="T", description="old")
+        self._run_concurrently(
+            lambda: DataRecordService.update_record(record.pk, title="New title"),
+            lambda: DataRecordService.update_record(record.pk, description="New description"),
+            lambda: DataRecordService.toggle_record_active_status(record.pk),
+        )
+        record.refresh_from_db()
+        self.assertEqual(
+            (record.title, record.description, record.is_active), ("New title", "New description", False),
+        )
+
 
 class BulkOperationTests(TestCase):
 
@@ -102,3 +176,27 @@ class BulkOperationTests(TestCase):
         DataRecordService.bulk_update_active_status([self.r1.id, self.r2.id], False)
         self.assertFalse(DataRecord.objects.get(id=self.r1.id).is_active)
         self.assertFalse(DataRecord.objects.get(id=self.r2.id).is_active)
+        self.assertGreater(DataRecord.objects.get(id=self.r1.id).updated_at, self.r1.updated_at)
+
+
+class ExpectedVersionTests(TestCase):
+
+    def setUp(self):
+        self.record = DataRecord.objects.create(title="Original")
+        self.version = RecordDetailCache.get_version(self.record)
+
+    def test_update_with_current_version(self):
+        updated = DataRecordService.update_record(self.record.id, expected_version=self.version, title="New")
+        self.assertEqual(updated.title, "New")
+
+    def test_update_with_stale_version_raises(self):
+        DataRecordService.update_record(self.record.id, title="Concurrent")
+        with self.assertRaises(RecordVersionConflict):
+            DataRecordService.update_record(self.record.id, expected_version=self.version, title="Mine")
+        self.record.refresh_from_db()
+        self.assertEqual(self.record.title, "Concurrent")
+
+    def test_delete_with_stale_version_raises(self):
+        with self.assertRaises(RecordVersionConflict):
+            DataRecordService.delete_record(self.record.id, expected_version=self.version - 1)
+        self.assertTrue(DataRecord.objects.filter(pk=self.record.pk).exists())
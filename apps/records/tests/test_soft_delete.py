@@ -0,0 +1,97 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.records.models import DataRecord, FileBlob
+from apps.records.selectors.records_selector import DataRecordSelector
+from apps.records.services import DataRecordService, RecordBulkService, RecordPurgeService
+from apps.records.tests.test_views import LIST_URL, RecordViewTestBase, delete_url, detail_url
+
+
+class SoftDeleteServiceTests(TestCase):
+
+    def setUp(self):
+        self.records = [DataRecord.objects.create(title=f"Ledger {i}") for i in range(4)]
+
+    def test_deletes_only_mark_rows(self):
+        DataRecordService.delete_record(self.records[0].pk)
+        self.assertEqual(DataRecordService.bulk_delete_records([r.pk for r in self.records[:3]]), 2)
+
+        self.assertEqual(list(DataRecord.objects.values_list("pk", flat=True)), [self.records[3].pk])
+        self.assertEqual(DataRecord.all_objects.count(), 4)
+        self.assertTrue(all(
+            deleted_at is not None for deleted_at in
+            DataRecord.all_objects.filter(pk__in=[r.pk for r in self.records[:3]]).values_list("deleted_at", flat=True)
+        ))
+
+    def test_deleted_records_cannot_be_read_or_written(self):
+        record = self.records[0]
+        DataRecordService.delete_record(record.pk)
+
+        self.assertIsNone(DataRecordSelector.get_record_by_id(record.pk))
+        self.assertEqual(DataRecordSelector.search_records("ledger").count(), 3)
+        for write in (
+            lambda: DataRecordService.delete_record(record.pk),
+            lambda: DataRecordService.update_record(record.pk, title="Back"),
+            lambda: DataRecordService.toggle_record_active_status(record.pk),
+        ):
+            with self.assertRaises(ValidationError):
+                write()
+        results = RecordBulkService.delete_records([record.pk])
+        self.assertEqual(results[0]["status"], "not_found")
+
+    def test_purge_removes_old_deletions_in_batches(self):
+        DataRecordService.bulk_delete_records([r.pk for r in self.records[:3]])
+        DataRecord.all_objects.filter(pk=self.records[2].pk).update(deleted_at=timezone.now() + timedelta(days=1))
+
+        with mock.patch("apps.records.services.purge_service.time.sleep") as sleep:
+            self.assertEqual(RecordPurgeService.purge(older_than=0, batch_size=1, pause=0.25), 2)
+
+        self.assertEqual(sleep.call_args_list, [mock.call(0.25)] * 2)
+        self.assertEqual(
+            set(DataRecord.all_objects.values_list("pk", flat=True)), {self.records[2].pk, self.records[3].pk},
+        )
+
+    def test_purge_keeps_recent_deletions_and_stops_at_time_limit(self):
+        DataRecordService.bulk_delete_records([r.pk for r in self.records[:3]])
+        self.assertEqual(RecordPurgeService.purge(), 0)
+
+        with mock.patch("apps.records.services.purge_service.time.sleep"):
+            self.assertEqual(RecordPurgeService.purge(older_than=0, batch_size=1, time_limit=0), 1)
+
+    def test_purge_releases_file_references(self):
+        FileBlob.objects.create(sha256="a" * 64, key="records/a/doc.pdf", size=1, ref_count=2)
+        DataRecord.objects.filter(pk__in=[r.pk for r in self.records[:2]]).update(file="records/a/doc.pdf")
+        DataRecordService.delete_record(self.records[0].pk)
+        self.assertEqual(FileBlob.objects.get().ref_count, 2)
+
+        RecordPurgeService.purge(older_than=0)
+        self.assertEqual(FileBlob.objects.get().ref_count, 1)
+
+    def test_purge_command(self):
+        DataRecordService.delete_record(self.records[0].pk)
+        out = StringIO()
+        call_command("purge_deleted_records", older_than=0, pause=0, stdout=out)
+        self.assertIn("Purged 1 deleted records.", out.getvalue())
+        self.assertEqual(DataRecord.all_objects.count(), 3)
+
+
+class SoftDeleteViewTests(RecordViewTestBase):
+
+    def test_deleted_record_disappears_from_the_api(self):
+        DataRecord.objects.create(title="Other", is_active=False)
+        self.assertEqual(self.admin_client.get(LIST_URL).json()["data"]["count"], 2)
+
+        self.assertEqual(self.admin_client.delete(delete_url(self.record.pk)).status_code, 204)
+
+        self.assertEqual(self.admin_client.get(detail_url(self.record.pk)).status_code, 404)
+        self.assertEqual(self.admin_client.delete(delete_url(self.record.pk)).status_code, 404)
+        for params in ({}, {"search": "Test"}, {"is_active": "true"}, {"cursor": ""}):
+            titles = [r["title"] for r in self.admin_client.get(LIST_URL, params).json()["data"]["results"]]
+            self.assertNotIn("Test Record", titles, params)
+        self.assertEqual(self.admin_client.get(LIST_URL).json()["data"]["count"], 1)
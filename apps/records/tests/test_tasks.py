@@ -0,0 +1,111 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+
+from apps.records.models import DataRecord, RecordImportJob
+from apps.records.selectors import RecordDetailCache
+from apps.records.services import DataRecordService, RecordImportService
+from apps.records.tasks import export_records, import_records, invalidate_record_caches, process_record_file
+from dms_system.celery import app, enqueue_on_commit
+
+
+def _queue(task) -> str:
+    return app.amqp.router.route({}, task.name)["queue"].name
+
+
+class TaskRoutingTests(TestCase):
+
+    def test_heavy_and_light_queues(self):
+        self.assertEqual(_queue(export_records), "heavy")
+        self.assertEqual(_queue(import_records), "heavy")
+        self.assertEqual(_queue(invalidate_record_caches), "light")
+
+    def test_file_processing_does_not_wait_behind_heavy_jobs(self):
+        self.assertEqual(_queue(process_record_file), "files")
+        self.assertEqual(process_record_file.soft_time_limit, export_records.soft_time_limit)
+
+    def test_heavy_tasks_get_longer_time_limits(self):
+        self.assertGreater(export_records.soft_time_limit, app.conf.task_soft_time_limit)
+        self.assertGreater(import_records.time_limit, export_records.soft_time_limit)
+        self.assertIsNone(invalidate_record_caches.soft_time_limit)
+
+
+class TaskExecutionTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_import_runs_eagerly_and_retries_transient_errors(self):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w") as f:
+            f.write("title\nA\nB\n")
+        self.addCleanup(os.remove, path)
+        job = RecordImportService.create_job(path, None, local=True)
+
+        original = RecordImportService.run
+        calls = []
+
+        def flaky(job_id):
+            calls.append(job_id)
+            if len(calls) == 1:
+                raise OperationalError("server closed the connection")
+            return original(job_id)
+
+        with mock.patch.object(RecordImportService, "run", side_effect=flaky):
+            result = import_records.apply(args=[str(job.pk)], throw=False)
+
+        self.assertEqual(result.get(), 2)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(RecordImportJob.objects.get(pk=job.pk).status, "completed")
+
+    def test_other_errors_are_not_retried(self):
+        with mock.patch.object(RecordImportService, "run", side_effect=ValueError("bad")) as run, \
+                self.assertRaises(ValueError):
+            import_records.apply(args=["x"])
+        self.assertEqual(run.call_count, 1)
+
+    def test_invalidate_record_caches(self):
+        record = DataRecord.objects.create(title="Cached")
+        RecordDetailCache.set(record, {"id": record.pk})
+        invalidate_record_caches.apply(args=[[record.pk]])
+        self.assertIsNone(RecordDetailCache.get(record.pk))
+
+
+class EnqueueOnCommitTests(TestCase):
+
+    def test_writes_invalidate_again_after_commit(self):
+        record = DataRecord.objects.create(title="Before")
+        with mock.patch.object(invalidate_record_caches, "apply_async") as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                DataRecordService.update_record(record.pk, title="After")
+                # A reader caches the old row before the write commits.
+                RecordDetailCache.set(DataRecord(pk=record.pk, title="Before", updated_at=record.updated_at), {})
+            self.assertIsNone(RecordDetailCache.get(record.pk))
+        apply_async.assert_not_called()
+
+    @override_settings(RECORDS_CACHE_REINVALIDATE_DELAY=5)
+    def test_delayed_pass_is_queued_when_configured(self):
+        record = DataRecord.objects.create(title="Before")
+        with mock.patch.object(invalidate_record_caches, "apply_async") as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                DataRecordService.update_record(record.pk, title="After")
+        apply_async.assert_called_once_with(([record.pk],), {}, countdown=5)
+
+    def test_cache_errors_after_commit_do_not_fail_the_write(self):
+        record = DataRecord.objects.create(title="Before")
+        # The inline drop succeeds; the one after commit hits a cache outage.
+        with mock.patch.object(RecordDetailCache, "invalidate", side_effect=[None, OSError("cache down")]), \
+                self.captureOnCommitCallbacks(execute=True):
+            DataRecordService.update_record(record.pk, title="After")
+        record.refresh_from_db()
+        self.assertEqual(record.title, "After")
+
+    def test_publish_errors_are_logged(self):
+        with mock.patch.object(invalidate_record_caches, "apply_async", side_effect=OSError("broker down")), \
+                self.assertLogs("dms_system.celery", "ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                enqueue_on_commit(invalidate_record_caches, [1])
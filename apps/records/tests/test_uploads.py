@@ -0,0 +1,149 @@
+from unittest import mock
+
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from apps.records.models.records_model import DataRecord
+from apps.records.services.upload_service import RecordUploadService
+from apps.records.tests.test_views import CREATE_URL, RecordViewTestBase, update_url
+from apps.utils.storage import MinIOStorage
+from apps.utils.tests.test_storage import FakeMultipartClient
+
+UPLOAD_URL = "/api/records/uploads/"
+COMMIT_URL = "/api/records/uploads/commit/"
+
+
+def stored(size):
+    return mock.patch.object(MinIOStorage, "head", return_value={"size": size, "content_type": None, "etag": '"x"'})
+
+
+class RecordUploadServiceTests(TestCase):
+
+    def test_key_is_unique_under_upload_to_and_fits_the_field(self):
+        first = RecordUploadService.build_key("../../etc/Quarterly report.pdf")
+        second = RecordUploadService.build_key("../../etc/Quarterly report.pdf")
+        self.assertNotEqual(first, second)
+        self.assertRegex(first, r"^records/[0-9a-f]{32}/Quarterly_report\.pdf$")
+
+        long_key = RecordUploadService.build_key("x" * 300 + ".pdf")
+        self.assertEqual(len(long_key), DataRecord._meta.get_field("file").max_length)
+        self.assertTrue(long_key.endswith(".pdf"))
+
+    @override_settings(RECORDS_UPLOAD_MAX_SIZE=100)
+    def test_rejects_oversized_upload(self):
+        with self.assertRaises(ValidationError):
+            RecordUploadService.create_upload(1, "a.pdf", 101)
+
+    def test_presigned_post_pins_key_and_size(self):
+        ticket = RecordUploadService.create_upload(1, "a.pdf", 42, content_type="application/pdf")
+        self.assertEqual(ticket["fields"]["key"], ticket["key"])
+        self.assertEqual(ticket["fields"]["Content-Type"], "application/pdf")
+        policy = signing.b64_decode(ticket["fields"]["policy"].encode()).decode()
+        self.assertIn('["content-length-range", 1, 42]', policy)
+
+    def test_commit_creates_record_for_verified_upload(self):
+        ticket = RecordUploadService.create_upload(1, "a.pdf", 42)
+        with stored(42):
+            record = RecordUploadService.commit_upload(1, ticket["upload_token"], title="Report")
+        self.assertEqual(record.file.name, ticket["key"])
+
+    def test_commit_rejects_missing_or_mismatched_object(self):
+        ticket = RecordUploadService.create_upload(1, "a.pdf", 42)
+        with mock.patch.object(MinIOStorage, "head", return_value=None), self.assertRaises(ValidationError):
+            RecordUploadService.commit_upload(1, ticket["upload_token"], title="Report")
+        with stored(41), self.assertRaises(ValidationError):
+            RecordUploadService.commit_upload(1, ticket["upload_token"], title="Report")
+        self.assertFalse(DataRecord.objects.exists())
+
+    def test_token_is_bound_to_user_and_single_use(self):
+        ticket = RecordUploadService.create_upload(1, "a.pdf", 42)
+        with stored(42):
+            with self.assertRaises(ValidationError):
+                RecordUploadService.commit_upload(2, ticket["upload_token"], title="Report")
+            RecordUploadService.commit_upload(1, ticket["upload_token"], title="Report")
+            with self.assertRaises(ValidationError):
+                RecordUploadService.commit_upload(1, ticket["upload_token"], title="Again")
+
+    def test_forged_token_rejected(self):
+        token = signing.dumps({"k": "records/other.pdf", "s": 1, "u": 1}, salt="other")
+        with self.assertRaises(ValidationError):
+            RecordUploadService.verify_upload(1, token)
+
+
+class RecordUploadViewTests(RecordViewTestBase):
+
+    def test_editor_gets_upload_ticket(self):
+        response = self.editor_client.post(UPLOAD_URL, {"filename": "a.pdf", "size": 10}, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertIn("upload_token", response.data["data"])
+        self.assertIn("policy", response.data["data"]["fields"])
+
+    def test_viewer_denied(self):
+        response = self.viewer_client.post(UPLOAD_URL, {"filename": "a.pdf", "size": 10}, format="json")
+        self.assertEqual(response.status_code, 403)
+
+    def test_invalid_size_returns_400(self):
+        response = self.editor_client.post(UPLOAD_URL, {"filename": "a.pdf", "size": 0}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_commit_creates_record(self):
+        ticket = self.editor_client.post(UPLOAD_URL, {"filename": "a.pdf", "size": 10}, format="json").data["data"]
+        with stored(10):
+            response = self.editor_client.post(
+                COMMIT_URL, {"upload_token": ticket["upload_token"], "title": "Uploaded"}, format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(DataRecord.objects.get(pk=response.data["data"]["id"]).file.name, ticket["key"])
+
+    def test_commit_attaches_to_existing_record(self):
+        ticket = self.editor_client.post(UPLOAD_URL, {"filename": "a.pdf", "size": 10}, format="json").data["data"]
+        with stored(10):
+            response = self.editor_client.post(
+                COMMIT_URL, {"upload_token": ticket["upload_token"], "record": self.record.pk}, format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+        self.record.refresh_from_db()
+        self.assertEqual(self.record.file.name, ticket["key"])
+
+    def test_commit_with_token_of_other_user_fails(self):
+        ticket = self.editor_client.post(UPLOAD_URL, {"filename": "a.pdf", "size": 10}, format="json").data["data"]
+        with stored(10):
+            response = self.admin_client.post(
+                COMMIT_URL, {"upload_token": ticket["upload_token"], "title": "Stolen"}, format="json",
+            )
+        self.assertEqual(response.status_code, 400)
+
+
+class StreamedUploadViewTests(RecordViewTestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.s3 = FakeMultipartClient()
+        patcher = mock.patch.object(MinIOStorage, "client", new_callable=mock.PropertyMock, return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_multipart_create_stores_streamed_key(self):
+        upload = SimpleUploadedFile("scan.pdf", b"%PDF-" + b"x" * 100)
+        response = self.editor_client.post(CREATE_URL, {"title": "Scan", "file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 201)
+
+        record = DataRecord.objects.get(pk=response.data["data"]["id"])
+        self.assertRegex(record.file.name, r"^records/[0-9a-f]{32}/scan\.pdf$")
+        self.assertEqual(self.s3.completed[record.file.name], b"%PDF-" + b"x" * 100)
+
+    def test_multipart_update_replaces_file(self):
+        upload = SimpleUploadedFile("v2.pdf", b"second")
+        response = self.editor_client.patch(update_url(self.record.pk), {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 200)
+        self.record.refresh_from_db()
+        self.assertEqual(self.s3.completed[self.record.file.name], b"second")
+
+    def test_invalid_request_discards_streamed_object(self):
+        upload = SimpleUploadedFile("scan.pdf", b"data")
+        with mock.patch.object(MinIOStorage, "delete") as delete:
+            response = self.editor_client.post(CREATE_URL, {"title": "", "file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 400)
+        delete.assert_called_once_with(next(iter(self.s3.completed)))
@@ -1,5 +1,8 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from rest_framework.test import APITestCase, APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -40,6 +43,7 @@ def auth_client(user):
 
 class RecordViewTestBase(APITestCase):
     def setUp(self):
+        cache.clear()
         self.admin = make_user("admin_user", "admin")
         self.editor = make_user("editor_user", "editor")
         self.viewer = make_user("viewer_user", "viewer")
@@ -80,6 +84,7 @@ class RecordListViewTests(RecordViewTestBase):
         data = response.json()["data"]
         self.assertIn("results", data)
         self.assertIn("count", data)
+        self.assertTrue(data["count_exact"])
 
     def test_search_filter(self):
         DataRecord.objects.create(title="Unique Title XYZ", is_active=True)
@@ -88,6 +93,32 @@ class RecordListViewTests(RecordViewTestBase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["title"], "Unique Title XYZ")
 
+    def test_invalid_date_filter_returns_validation_error(self):
+        response = self.admin_client.get(LIST_URL, {"created_at_after": "not-a-date"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("created_at_after", response.json()["errors"])
+
+    def test_cursor_mode_returns_keyset_envelope(self):
+        DataRecord.objects.create(title="Second", is_active=True)
+        response = self.admin_client.get(LIST_URL, {"cursor": "", "page_size": 1})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertNotIn("count", data)
+        self.assertEqual(len(data["results"]), 1)
+        self.assertIsNone(data["previous"])
+
+        response = self.admin_client.get(data["next"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["data"]["results"]), 1)
+
+    def test_cursor_mode_rejects_invalid_cursor(self):
+        response = self.admin_client.get(LIST_URL, {"cursor": "garbage"})
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.json()["success"])
+
+    def test_page_out_of_range_returns_404(self):
+        self.assertEqual(self.admin_client.get(LIST_URL, {"page": 99}).status_code, 404)
+
 
 class RecordCreateViewTests(RecordViewTestBase):
     def _payload(self, title="New Record"):
@@ -197,3 +228,95 @@ class RecordDeleteViewTests(RecordViewTestBase):
     def test_not_found(self):
         response = self.admin_client.delete(delete_url(9999))
         self.assertEqual(response.status_code, 404)
+
+
+class ConditionalRequestTests(RecordViewTestBase):
+    def test_detail_returns_etag_and_304_when_current(self):
+        etag = self.viewer_client.get(detail_url(self.record.pk))["ETag"]
+        response = self.viewer_client.get(detail_url(self.record.pk), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse(response.content)
+
+    def test_detail_revalidates_after_update(self):
+        etag = self.viewer_client.get(detail_url(self.record.pk))["ETag"]
+        self.editor_client.patch(update_url(self.record.pk), {"title": "Changed"})
+        response = self.viewer_client.get(detail_url(self.record.pk), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["data"]["title"], "Changed")
+
+    def test_detail_accepts_weak_if_none_match(self):
+        etag = self.viewer_client.get(detail_url(self.record.pk))["ETag"]
+        response = self.viewer_client.get(detail_url(self.record.pk), HTTP_IF_NONE_MATCH=f"W/{etag}")
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_returns_304_until_records_change(self):
+        etag = self.viewer_client.get(LIST_URL)["ETag"]
+        self.assertEqual(self.viewer_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        DataRecord.objects.create(title="New")
+        self.assertEqual(self.viewer_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_list_etag_changes_on_delete(self):
+        other = DataRecord.objects.create(title="Old")
+        etag = self.viewer_client.get(LIST_URL)["ETag"]
+        self.admin_client.delete(delete_url(other.pk))
+        self.assertEqual(self.viewer_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_list_etag_depends_on_query(self):
+        etag = self.viewer_client.get(LIST_URL)["ETag"]
+        response = self.viewer_client.get(LIST_URL, {"ordering": "title"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_etags_change_when_presigned_urls_are_re_signed(self):
+        with mock.patch("apps.records.api.views.records_views.time.time", return_value=1_000_000):
+            detail_etag = self.viewer_client.get(detail_url(self.record.pk))["ETag"]
+            list_etag = self.viewer_client.get(LIST_URL)["ETag"]
+        with mock.patch("apps.records.api.views.records_views.time.time", return_value=1_000_300):
+            response = self.viewer_client.get(detail_url(self.record.pk), HTTP_IF_NONE_MATCH=detail_etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(self.viewer_client.get(LIST_URL, HTTP_IF_NONE_MATCH=list_etag).status_code, 200)
+
+    def test_if_match_ignores_the_url_window(self):
+        with mock.patch("apps.records.api.views.records_views.time.time", return_value=1_000_000):
+            etag = self.editor_client.get(detail_url(self.record.pk))["ETag"]
+        with mock.patch("apps.records.api.views.records_views.time.time", return_value=1_000_300):
+            response = self.editor_client.patch(update_url(self.record.pk), {"title": "Changed"}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_patch_with_current_if_match_succeeds(self):
+        etag = self.editor_client.get(detail_url(self.record.pk))["ETag"]
+        response = self.editor_client.patch(update_url(self.record.pk), {"title": "Changed"}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_patch_with_stale_if_match_returns_412(self):
+        etag = self.editor_client.get(detail_url(self.record.pk))["ETag"]
+        self.editor_client.patch(update_url(self.record.pk), {"title": "First"})
+        response = self.editor_client.patch(update_url(self.record.pk), {"title": "Second"}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 412)
+        self.record.refresh_from_db()
+        self.assertEqual(self.record.title, "First")
+
+    def test_patch_if_match_accepts_any_listed_etag(self):
+        etag = self.editor_client.get(detail_url(self.record.pk))["ETag"]
+        response = self.editor_client.patch(
+            update_url(self.record.pk), {"title": "Changed"}, HTTP_IF_MATCH=f'"0", {etag}',
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.editor_client.patch(update_url(self.record.pk), {"title": "Again"}, HTTP_IF_MATCH=f"W/{etag}")
+        self.assertEqual(response.status_code, 412)
+
+    def test_if_match_on_missing_record_returns_404(self):
+        self.assertEqual(self.editor_client.patch(update_url(9999), {"title": "x"}, HTTP_IF_MATCH='"1"').status_code, 404)
+        self.assertEqual(self.admin_client.delete(delete_url(9999), HTTP_IF_MATCH="*").status_code, 404)
+
+    def test_delete_with_stale_if_match_returns_412(self):
+        response = self.admin_client.delete(delete_url(self.record.pk), HTTP_IF_MATCH='"0"')
+        self.assertEqual(response.status_code, 412)
+        self.assertTrue(DataRecord.objects.filter(pk=self.record.pk).exists())
+
+    def test_delete_with_wildcard_if_match_succeeds(self):
+        response = self.admin_client.delete(delete_url(self.record.pk), HTTP_IF_MATCH="*")
+        self.assertEqual(response.status_code, 204)
@@ -2,10 +2,10 @@ from django.contrib.auth import authenticate
 from rest_framework import serializers
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from drf_spectacular.utils import extend_schema, inline_serializer
 from apps.utils import BaseResponse
+from apps.user.tokens import RoleRefreshToken
 from apps.user.api.serializers import LoginSerializer, RefreshTokenSerializer, LogoutSerializer
 
 
@@ -58,7 +58,7 @@ class LoginView(APIView):
         if not user.is_active:
             return BaseResponse.error("This account has been disabled.", status_code=401)
 
-        refresh = RefreshToken.for_user(user)
+        refresh = RoleRefreshToken.for_user(user)
 
         return BaseResponse.success(data={
             "access": str(refresh.access_token),
@@ -98,7 +98,7 @@ class RefreshTokenView(APIView):
             return BaseResponse.bad_request("'refresh' token is required.")
 
         try:
-            refresh = RefreshToken(refresh_token)
+            refresh = RoleRefreshToken(refresh_token)
             return BaseResponse.success(data={"access": str(refresh.access_token)})
         except TokenError as e:
             return BaseResponse.error(str(e), status_code=401)
@@ -126,7 +126,7 @@ class LogoutView(APIView):
             return BaseResponse.bad_request("'refresh' token is required.")
 
         try:
-            token = RefreshToken(refresh_token)
+            token = RoleRefreshToken(refresh_token)
             token.blacklist()
             return BaseResponse.success(message="Successfully logged out.")
         except TokenError as e:
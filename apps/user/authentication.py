@@ -0,0 +1,93 @@
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.user.tokens import GENERATION_CLAIM, USERNAME_CLAIM, get_token_generation
+
+
+class ClaimsUser(TokenUser):
+    """
+    Request user built from access token claims.
+
+    Attributes not carried by the token (email, date_joined, ...) are read from
+    the full ``User`` row, which is loaded on first access only. That includes the
+    staff and superuser flags, groups and permissions, which ``TokenUser`` would
+    otherwise answer with empty defaults.
+    """
+
+    @cached_property
+    def id(self) -> int:
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def username(self) -> str:
+        return self.token.get(USERNAME_CLAIM, "")
+
+    @cached_property
+    def instance(self):
+        from apps.user.models import User
+
+        return User.objects.get(pk=self.id)
+
+    @cached_property
+    def is_staff(self) -> bool:
+        return self.token["is_staff"] if "is_staff" in self.token else self.instance.is_staff
+
+    @cached_property
+    def is_superuser(self) -> bool:
+        return self.token["is_superuser"] if "is_superuser" in self.token else self.instance.is_superuser
+
+    @property
+    def groups(self):
+        return self.instance.groups
+
+    @property
+    def user_permissions(self):
+        return self.instance.user_permissions
+
+    def get_group_permissions(self, obj=None) -> set:
+        return self.instance.get_group_permissions(obj)
+
+    def get_all_permissions(self, obj=None) -> set:
+        return self.instance.get_all_permissions(obj)
+
+    def has_perm(self, perm, obj=None) -> bool:
+        return self.instance.has_perm(perm, obj)
+
+    def has_perms(self, perm_list, obj=None) -> bool:
+        return self.instance.has_perms(perm_list, obj)
+
+    def has_module_perms(self, module) -> bool:
+        return self.instance.has_module_perms(module)
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        if attr in self.token:
+            return self.token[attr]
+        return getattr(self.instance, attr)
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    Authenticates access tokens without loading the user row.
+
+    The token's generation claim is checked against the user's current generation,
+    which is cached and bumped on deactivation or password change. Tokens issued
+    before generations existed go through the regular database lookup.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        if GENERATION_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        generation = get_token_generation(validated_token[api_settings.USER_ID_CLAIM])
+        if validated_token[GENERATION_CLAIM] != generation:
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+
+        return ClaimsUser(validated_token)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="token_generation",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
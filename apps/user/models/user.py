@@ -4,6 +4,9 @@ from django.db import models
 
 class User(AbstractUser):
     email = models.EmailField(unique=True)
+    # Embedded in issued tokens and bumped when the account is deactivated or its
+    # password changes, which revokes every token issued before.
+    token_generation = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         verbose_name = "User"
@@ -1,8 +1,15 @@
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import post_migrate
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
+from apps.user.tokens import REVOKED_GENERATION, cache_token_generation
+from apps.utils.permissions import invalidate_user_roles
+
+User = get_user_model()
+
 
 GROUP_PERMISSIONS = {
     "admin":  ["add_datarecord", "change_datarecord", "delete_datarecord", "view_datarecord"],
@@ -26,3 +33,61 @@ def create_role_groups(sender, **kwargs):
             codename__in=codenames,
         )
         group.permissions.set(perms)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_roles_on_membership_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # group.user_set changed: pk_set holds user ids, except on clear.
+        if action == "pre_clear":
+            invalidate_user_roles(instance.user_set.values_list("pk", flat=True))
+        elif action in ("post_add", "post_remove"):
+            invalidate_user_roles(pk_set)
+    elif action in ("post_add", "post_remove", "post_clear"):
+        invalidate_user_roles([instance.pk])
+
+
+@receiver(post_save, sender=Group)
+def invalidate_roles_on_group_rename(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_user_roles(instance.user_set.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=Group)
+def invalidate_roles_on_group_delete(sender, instance, **kwargs):
+    invalidate_user_roles(instance.user_set.values_list("pk", flat=True))
+
+
+@receiver(pre_save, sender=User)
+def detect_token_revocation(sender, instance, update_fields=None, **kwargs):
+    instance._revoke_tokens = False
+    if instance._state.adding:
+        return
+    if update_fields is not None and not {"is_active", "password"} & set(update_fields):
+        return
+
+    previous = sender.objects.filter(pk=instance.pk).values("is_active", "password").first()
+    if previous is not None:
+        instance._revoke_tokens = (
+            (previous["is_active"] and not instance.is_active)
+            or previous["password"] != instance.password
+        )
+
+
+@receiver(post_save, sender=User)
+def bump_token_generation(sender, instance, created, **kwargs):
+    if getattr(instance, "_revoke_tokens", False):
+        # An UPDATE of its own so it also applies to save(update_fields=[...]).
+        sender.objects.filter(pk=instance.pk).update(token_generation=F("token_generation") + 1)
+        instance.refresh_from_db(fields=["token_generation"])
+        instance._revoke_tokens = False
+
+    if not created:
+        cache_token_generation(
+            instance.pk, instance.token_generation if instance.is_active else REVOKED_GENERATION
+        )
+
+
+@receiver(post_delete, sender=User)
+def revoke_tokens_on_delete(sender, instance, **kwargs):
+    cache_token_generation(instance.pk, REVOKED_GENERATION)
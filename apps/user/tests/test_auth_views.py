@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
 from rest_framework.test import APITestCase, APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
 User = get_user_model()
 
@@ -31,6 +33,7 @@ class LoginViewTests(APITestCase):
         self.assertIn("access", data["data"])
         self.assertIn("refresh", data["data"])
         self.assertEqual(data["data"]["user"]["username"], "login_user")
+        self.assertEqual(AccessToken(data["data"]["access"])["roles"], [])
 
     def test_login_wrong_password(self):
         response = self.client.post(LOGIN_URL, {"username": "login_user", "password": "wrongpass"})
@@ -67,6 +70,13 @@ class RefreshTokenViewTests(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn("access", response.json()["data"])
 
+    def test_refresh_reloads_role_claims(self):
+        group, _ = Group.objects.get_or_create(name="editor")
+        self.user.groups.add(group)
+        response = self.client.post(REFRESH_URL, {"refresh": self.refresh_token})
+        access = AccessToken(response.json()["data"]["access"])
+        self.assertEqual(access["roles"], ["editor"])
+
     def test_refresh_invalid_token(self):
         response = self.client.post(REFRESH_URL, {"refresh": "not.a.valid.token"})
         self.assertEqual(response.status_code, 401)
@@ -78,6 +88,7 @@ class RefreshTokenViewTests(APITestCase):
 
 class LogoutViewTests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = make_user("logout_user")
         self.refresh_token, self.access_token = get_tokens(self.user)
         self.client = APIClient()
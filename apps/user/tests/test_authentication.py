@@ -0,0 +1,105 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.user.authentication import ClaimsUser, StatelessJWTAuthentication
+from apps.user.tokens import RoleRefreshToken
+
+User = get_user_model()
+
+
+class StatelessJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="stateless", password="pass", email="stateless@test.com")
+        self.factory = APIRequestFactory()
+        self.auth = StatelessJWTAuthentication()
+
+    def _authenticate(self, token):
+        request = self.factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return self.auth.authenticate(request)
+
+    def test_builds_user_from_claims_without_query(self):
+        access = RoleRefreshToken.for_user(self.user).access_token
+        self._authenticate(access)  # warm the generation cache
+
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate(access)
+        self.assertIsInstance(user, ClaimsUser)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.username, "stateless")
+        self.assertTrue(user.is_authenticated)
+
+    def test_full_user_loaded_on_demand(self):
+        user, _ = self._authenticate(RoleRefreshToken.for_user(self.user).access_token)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, "stateless@test.com")
+            self.assertEqual(user.instance, self.user)
+
+    def test_staff_flags_groups_and_permissions_come_from_the_user(self):
+        self.user.is_staff = True
+        self.user.save(update_fields=["is_staff"])
+        group = Group.objects.create(name="Auditors")
+        group.permissions.add(Permission.objects.get(codename="view_datarecord"))
+        self.user.groups.add(group)
+
+        user, _ = self._authenticate(RoleRefreshToken.for_user(self.user).access_token)
+        self.assertTrue(user.is_staff)
+        self.assertFalse(user.is_superuser)
+        self.assertEqual(list(user.groups.values_list("name", flat=True)), ["Auditors"])
+        self.assertFalse(user.user_permissions.exists())
+        self.assertTrue(user.has_perm("records.view_datarecord"))
+        self.assertFalse(user.has_perm("records.delete_datarecord"))
+        self.assertTrue(user.has_module_perms("records"))
+
+    def test_deactivation_revokes_tokens(self):
+        access = RoleRefreshToken.for_user(self.user).access_token
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(access)
+
+    def test_reactivation_does_not_restore_old_tokens(self):
+        access = RoleRefreshToken.for_user(self.user).access_token
+        self.user.is_active = False
+        self.user.save()
+        self.user.is_active = True
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(access)
+        self._authenticate(RoleRefreshToken.for_user(self.user).access_token)
+
+    def test_password_change_revokes_tokens(self):
+        access = RoleRefreshToken.for_user(self.user).access_token
+        self.user.set_password("new-pass")
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(access)
+
+    def test_unrelated_save_keeps_tokens_valid(self):
+        access = RoleRefreshToken.for_user(self.user).access_token
+        self.user.first_name = "Renamed"
+        self.user.save()
+
+        user, _ = self._authenticate(access)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_refresh_rejected_after_deactivation(self):
+        refresh = RoleRefreshToken.for_user(self.user)
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(TokenError):
+            RoleRefreshToken(str(refresh)).access_token
+
+    def test_tokens_without_generation_use_database_lookup(self):
+        access = RefreshToken.for_user(self.user).access_token
+        user, _ = self._authenticate(access)
+        self.assertIsInstance(user, User)
@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.utils.permissions import add_role_claims
+
+GENERATION_CLAIM = "gen"
+USERNAME_CLAIM = "username"
+
+# Cached generation for users that are inactive or gone; matches no token.
+REVOKED_GENERATION = -1
+
+
+def _generation_key(user_id) -> str:
+    return f"user:{user_id}:token_generation"
+
+
+def get_token_generation(user_id) -> int:
+    generation = cache.get(_generation_key(user_id))
+    if generation is None:
+        from apps.user.models import User
+
+        row = User.objects.filter(pk=user_id).values_list("is_active", "token_generation").first()
+        generation = row[1] if row and row[0] else REVOKED_GENERATION
+        cache_token_generation(user_id, generation)
+    return generation
+
+
+def cache_token_generation(user_id, generation: int) -> None:
+    cache.set(_generation_key(user_id), generation, timeout=settings.AUTH_TOKEN_GENERATION_CACHE_TIMEOUT)
+
+
+class RoleRefreshToken(RefreshToken):
+    """
+    Refresh token whose access tokens carry the user's current role names, username
+    and token generation, which is everything StatelessJWTAuthentication needs.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[USERNAME_CLAIM] = user.get_username()
+        token[GENERATION_CLAIM] = user.token_generation
+        add_role_claims(token, user.pk)
+        return token
+
+    @property
+    def access_token(self):
+        user_id = self[api_settings.USER_ID_CLAIM]
+        if GENERATION_CLAIM in self and self[GENERATION_CLAIM] != get_token_generation(user_id):
+            raise TokenError("Token has been revoked")
+
+        # Roles are re-read on every refresh rather than copied from the refresh
+        # token, so a role change reaches clients within one access token lifetime.
+        access = super().access_token
+        add_role_claims(access, user_id)
+        return access
@@ -1,14 +1,20 @@
 from apps.utils.responses import BaseResponse
 from apps.utils.filters import DataRecordFilter
-from apps.utils.pagination import StandardResultsPagination
+from apps.utils.pagination import StandardResultsPagination, KeysetCursorPagination, AdaptiveCount
 from apps.utils.storage import MinIOStorage
+from apps.utils.conditional import make_etag, is_not_modified, if_match_etags
 from apps.utils.permissions import IsAdmin, IsEditorOrAdmin, IsAnyRole
 
 __all__ = [
     'BaseResponse',
     'DataRecordFilter',
     'StandardResultsPagination',
+    'KeysetCursorPagination',
+    'AdaptiveCount',
     'MinIOStorage',
+    'make_etag',
+    'is_not_modified',
+    'if_match_etags',
     'IsAdmin',
     'IsEditorOrAdmin',
     'IsAnyRole',
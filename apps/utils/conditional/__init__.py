@@ -0,0 +1,12 @@
+from apps.utils.conditional.etags import digest, if_match_etags, is_not_modified, make_etag
+from apps.utils.conditional.ranges import RangeNotSatisfiable, if_range_allows, parse_range
+
+__all__ = [
+    'make_etag',
+    'digest',
+    'is_not_modified',
+    'if_match_etags',
+    'parse_range',
+    'if_range_allows',
+    'RangeNotSatisfiable',
+]
@@ -0,0 +1,41 @@
+import hashlib
+
+from django.utils.http import parse_etags, quote_etag
+
+
+def make_etag(*parts) -> str:
+    """Strong entity tag built from the given version parts."""
+    return quote_etag("-".join(str(part) for part in parts))
+
+
+def digest(value: str) -> str:
+    return hashlib.blake2b(value.encode(), digest_size=8).hexdigest()
+
+
+def _strip_weak(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(request, etag: str) -> bool:
+    """
+    True when ``If-None-Match`` lists ``etag`` (or ``*``), meaning the client's
+    copy is current. Uses the weak comparison RFC 9110 prescribes for this header.
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return "*" in etags or etag in (_strip_weak(candidate) for candidate in etags)
+
+
+def if_match_etags(request) -> list[str] | None:
+    """
+    The entity tags ``If-Match`` accepts, for writes that compare them under their
+    own lock. If-Match uses the strong comparison, so weak tags should match
+    nothing. None when the header is absent or ``*``.
+    """
+    header = request.headers.get("If-Match")
+    if not header:
+        return None
+    etags = parse_etags(header)
+    return None if "*" in etags else etags
@@ -0,0 +1,58 @@
+import re
+
+from django.utils.http import parse_etags, parse_http_date_safe
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Resolve a single-range ``Range`` header against a representation of ``size``
+    bytes into inclusive ``(start, end)`` offsets.
+
+    Returns None when the whole representation should be served instead: no
+    header, a syntax this helper does not handle (including multiple ranges,
+    which servers may ignore) or an invalid range. Raises RangeNotSatisfiable
+    when the range lies beyond the end.
+    """
+    if not header:
+        return None
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+
+    if not first:
+        if not last:
+            return None
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(size - suffix, 0), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def if_range_allows(request, etag: str | None, last_modified: int | None) -> bool:
+    """
+    Whether a ``Range`` header may be honoured given ``If-Range``: only while the
+    client's validator still matches, using strong ETag or exact date comparison.
+    """
+    header = request.headers.get("If-Range")
+    if not header:
+        return True
+    header = header.strip()
+    if header.startswith(('"', "W/")):
+        return etag is not None and not header.startswith("W/") and parse_etags(header) == [etag]
+    date = parse_http_date_safe(header)
+    return date is not None and date == last_modified
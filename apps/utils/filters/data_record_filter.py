@@ -1,9 +1,16 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework.filters import BaseFilterBackend
-from django.db.models import Q
 
 
 class DataRecordFilter(BaseFilterBackend):
 
+    DEFAULT_ORDERING = '-created_at'
+
     ALLOWED_ORDERING_FIELDS = {
         'title', '-title',
         'created_at', '-created_at',
@@ -11,28 +18,122 @@ class DataRecordFilter(BaseFilterBackend):
         'is_active', '-is_active',
     }
 
+    # Appended to every ordering so that rows are totally ordered, which keyset
+    # (cursor) pagination relies on. They follow the direction of the primary field.
+    ORDERING_TIEBREAKERS = ('created_at', 'id')
+
+    # Used instead of DEFAULT_ORDERING when searching without an explicit ordering.
+    RELEVANCE_ORDERING = '-search_rank'
+
+    # Timestamp columns that accept range parameters. Every range is applied as a
+    # half-open ``column >= start AND column < end`` on the raw column, so it can be
+    # answered from a B-tree index instead of casting each row to a date.
+    DATE_RANGE_FIELDS = ('created_at', 'updated_at')
+
+    TIMEZONE_PARAM = 'tz'
+
+    def get_ordering(self, request) -> str:
+        ordering = request.query_params.get('ordering')
+        if ordering in self.ALLOWED_ORDERING_FIELDS:
+            return ordering
+        if request.query_params.get('search'):
+            return self.RELEVANCE_ORDERING
+        return self.DEFAULT_ORDERING
+
+    def get_ordering_keys(self, ordering: str) -> list[str]:
+        prefix = '-' if ordering.startswith('-') else ''
+        keys = [ordering]
+        for field in self.ORDERING_TIEBREAKERS:
+            if field != ordering.lstrip('-'):
+                keys.append(f'{prefix}{field}')
+        return keys
+
+    def get_timezone(self, request):
+        name = request.query_params.get(self.TIMEZONE_PARAM)
+        if not name:
+            return timezone.get_current_timezone()
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValidationError({self.TIMEZONE_PARAM: [f"Unknown time zone '{name}'."]})
+
+    def get_date_range_filters(self, request) -> dict:
+        """
+        Translate range parameters into timestamp bounds.
+
+        ``<field>_after`` / ``<field>_before`` take inclusive calendar dates in the
+        request's time zone and become ``>= start of day`` / ``< start of next day``.
+        ``<field>_gte`` / ``<field>_lt`` take ISO 8601 datetimes; naive values are
+        read in the request's time zone.
+        """
+        tz = self.get_timezone(request)
+        params = request.query_params
+        lookups = {}
+
+        for field in self.DATE_RANGE_FIELDS:
+            after = params.get(f'{field}_after')
+            if after:
+                lookups[f'{field}__gte'] = self._start_of_day(self._parse_date(f'{field}_after', after), tz)
+
+            before = params.get(f'{field}_before')
+            if before:
+                day = self._parse_date(f'{field}_before', before) + timedelta(days=1)
+                lookups[f'{field}__lt'] = self._start_of_day(day, tz)
+
+            for suffix in ('gte', 'lt'):
+                value = params.get(f'{field}_{suffix}')
+                if value:
+                    moment = self._parse_datetime(f'{field}_{suffix}', value, tz)
+                    lookups[f'{field}__{suffix}'] = self._tighter(lookups.get(f'{field}__{suffix}'), moment, suffix)
+
+        return lookups
+
     def filter_queryset(self, request, queryset, view):
         search = request.query_params.get('search')
         is_active = request.query_params.get('is_active')
-        created_at_after = request.query_params.get('created_at_after')
-        created_at_before = request.query_params.get('created_at_before')
-        ordering = request.query_params.get('ordering', '-created_at')
 
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
+            queryset = queryset.search(search)
 
         if is_active is not None:
             queryset = queryset.filter(is_active=is_active.lower() == 'true')
 
-        if created_at_after:
-            queryset = queryset.filter(created_at__date__gte=created_at_after)
+        date_range = self.get_date_range_filters(request)
+        if date_range:
+            queryset = queryset.filter(**date_range)
 
-        if created_at_before:
-            queryset = queryset.filter(created_at__date__lte=created_at_before)
+        return queryset.order_by(*self.get_ordering_keys(self.get_ordering(request)))
 
-        if ordering in self.ALLOWED_ORDERING_FIELDS:
-            queryset = queryset.order_by(ordering)
+    @staticmethod
+    def _start_of_day(day, tz) -> datetime:
+        # fold=0 resolves a midnight that falls in a DST gap to the transition instant,
+        # which is the first moment of that local date.
+        return datetime.combine(day, time.min, tzinfo=tz)
+
+    @staticmethod
+    def _tighter(current, candidate, suffix):
+        if current is None:
+            return candidate
+        return max(current, candidate) if suffix == 'gte' else min(current, candidate)
+
+    @staticmethod
+    def _parse_date(param, value):
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({param: ['Enter a valid date in YYYY-MM-DD format.']})
+        return parsed
 
-        return queryset
+    @staticmethod
+    def _parse_datetime(param, value, tz):
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({param: ['Enter a valid ISO 8601 datetime.']})
+        if timezone.is_naive(parsed):
+            parsed = parsed.replace(tzinfo=tz)
+        return parsed
@@ -1,3 +1,12 @@
 from apps.utils.pagination.base_pagination import StandardResultsPagination
+from apps.utils.pagination.cursor_pagination import KeysetCursorPagination
+from apps.utils.pagination.count_strategies import ExactCount, AdaptiveCount, get_count_version, invalidate_cached_counts
 
-__all__ = ['StandardResultsPagination']
+__all__ = [
+    'StandardResultsPagination',
+    'KeysetCursorPagination',
+    'ExactCount',
+    'AdaptiveCount',
+    'get_count_version',
+    'invalidate_cached_counts',
+]
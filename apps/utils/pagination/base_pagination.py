@@ -1,6 +1,71 @@
+from asgiref.sync import sync_to_async
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
+from apps.utils.pagination.count_strategies import ExactCount
+
+
+class _LookaheadPage(Page):
+    """A page that knows whether another one follows from reading one row past its end."""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class CountStrategyPaginator(Paginator):
+    """
+    Paginator that takes its count from a count strategy. An estimated count
+    bounds nothing: any page from 1 up is served, each reads one row past its end
+    to tell whether another page follows, and only an empty page past the first
+    is out of range.
+    """
+
+    def __init__(self, object_list, per_page, count_strategy, request, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+        self.request = request
+
+    @cached_property
+    def _count(self):
+        return self.count_strategy.count(self.object_list, self.request)
+
+    @cached_property
+    def count(self):
+        return self._count[0]
+
+    @property
+    def count_exact(self):
+        return self._count[1]
+
+    def validate_number(self, number):
+        if self.count_exact:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        if self.count_exact:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        return _LookaheadPage(rows[:self.per_page], number, self, has_next=len(rows) > self.per_page)
+
 
 class StandardResultsPagination(PageNumberPagination):
 
@@ -9,12 +74,23 @@ class StandardResultsPagination(PageNumberPagination):
     max_page_size = 100
     page_query_param = 'page'
 
+    def __init__(self, count_strategy=None):
+        self.count_strategy = count_strategy or ExactCount()
+
+    def django_paginator_class(self, object_list, per_page):
+        return CountStrategyPaginator(object_list, per_page, self.count_strategy, self.request)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        # Count strategies read the cache and run raw planner queries; keep them sync.
+        return await sync_to_async(self.paginate_queryset)(queryset, request, view)
+
     def get_paginated_response(self, data):
         return Response({
             'success': True,
             'message': 'Operation successful',
             'data': {
                 'count': self.page.paginator.count,
+                'count_exact': self.page.paginator.count_exact,
                 'total_pages': self.page.paginator.num_pages,
                 'current_page': self.page.number,
                 'page_size': self.get_page_size(self.request),
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+
+NON_FILTER_PARAMS = frozenset({'page', 'page_size', 'ordering', 'cursor', 'format'})
+
+
+def _version_key(namespace: str) -> str:
+    return f'{namespace}:count:version'
+
+
+def get_count_version(namespace: str):
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        cache.add(_version_key(namespace), time.time_ns(), timeout=None)
+        version = cache.get(_version_key(namespace))
+    return version
+
+
+def invalidate_cached_counts(namespace: str) -> None:
+    """Drop every cached count in ``namespace`` by moving it to a fresh version."""
+    cache.set(_version_key(namespace), time.time_ns(), timeout=None)
+
+
+class ExactCount:
+
+    def count(self, queryset, request) -> tuple[int, bool]:
+        return queryset.count(), True
+
+
+class AdaptiveCount:
+    """
+    Exact counts cached per normalized filter set, falling back to PostgreSQL
+    planner estimates once a result set is large enough that an exact COUNT(*)
+    costs more than the number is worth.
+
+    - Querysets that filter no further than the model's default manager are
+      estimated before the cache is read: from ``pg_class.reltuples``, which is
+      free to read, when the manager returns every row, otherwise from
+      ``EXPLAIN`` (reltuples would count rows the manager hides, such as
+      soft-deleted ones).
+    - Filtered querysets use the row estimate from ``EXPLAIN``.
+    - Anything under ``estimate_threshold`` rows is counted exactly and cached
+      under the current namespace version until invalidate_cached_counts().
+    """
+
+    def __init__(self, namespace: str, timeout: int | None = None, estimate_threshold: int | None = None):
+        self.namespace = namespace
+        self.timeout = timeout if timeout is not None else settings.RECORDS_COUNT_CACHE_TIMEOUT
+        self.estimate_threshold = (
+            estimate_threshold if estimate_threshold is not None
+            else settings.RECORDS_COUNT_ESTIMATE_THRESHOLD
+        )
+
+    def count(self, queryset, request) -> tuple[int, bool]:
+        queryset = queryset.order_by()
+        is_filtered = self.is_filtered(queryset)
+
+        if not is_filtered:
+            estimate = self.estimate_unfiltered_rows(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate, False
+
+        key = self.get_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached, True
+
+        if is_filtered:
+            estimate = self.estimate_query_rows(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate, False
+
+        exact = queryset.count()
+        cache.set(key, exact, timeout=self.timeout)
+        return exact, True
+
+    def get_cache_key(self, request) -> str:
+        params = sorted(
+            (name, value)
+            for name, values in request.query_params.lists()
+            if name not in NON_FILTER_PARAMS
+            for value in values
+            if value != ''
+        )
+        digest = hashlib.sha1(json.dumps(params).encode()).hexdigest()
+        return f'{self.namespace}:count:{get_count_version(self.namespace)}:{digest}'
+
+    @staticmethod
+    def is_filtered(queryset) -> bool:
+        """Whether ``queryset`` filters beyond what the model's default manager does."""
+        return queryset.query.where != queryset.model._default_manager.all().query.where
+
+    @classmethod
+    def estimate_unfiltered_rows(cls, queryset) -> int | None:
+        if queryset.model._default_manager.all().query.where:
+            return cls.estimate_query_rows(queryset)
+        return cls.estimate_table_rows(queryset)
+
+    @staticmethod
+    def estimate_table_rows(queryset) -> int | None:
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 until the table has been vacuumed or analyzed.
+        if row is None or row[0] < 0:
+            return None
+        return row[0]
+
+    @staticmethod
+    def estimate_query_rows(queryset) -> int | None:
+        if connections[queryset.db].vendor != 'postgresql':
+            return None
+        plan = json.loads(queryset.explain(format='json'))
+        return int(plan[0]['Plan']['Plan Rows'])
@@ -0,0 +1,176 @@
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Seek-based pagination over the ordering already applied to the queryset.
+
+    The ordering must end in a unique column (see DataRecordFilter.ORDERING_TIEBREAKERS)
+    so every row has a distinct position. Cursors carry the position of the boundary
+    row and are signed, so clients cannot forge or tamper with them. Each page is a
+    single indexed range scan with a LIMIT, no COUNT(*) and no OFFSET.
+    """
+
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+    signing_salt = 'apps.utils.pagination.cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self._page_queryset(queryset, request)
+        return self._set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        queryset = self._page_queryset(queryset, request)
+        return self._set_page([row async for row in queryset])
+
+    def _page_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+        self.ordering = self.get_ordering(queryset)
+        self.base_url = request.build_absolute_uri()
+
+        self.position, self.reverse = self.decode_cursor(request)
+
+        if self.reverse:
+            queryset = queryset.order_by(*[self._invert(key) for key in self.ordering])
+        if self.position is not None:
+            queryset = queryset.filter(self._seek_filter(self.position, self.reverse))
+        return queryset[:self.page_size + 1]
+
+    def _set_page(self, results):
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if self.reverse:
+            results.reverse()
+            self.has_next = self.position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.position is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            'success': True,
+            'message': 'Operation successful',
+            'data': {
+                'page_size': self.page_size,
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'results': data,
+            },
+        })
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_ordering(self, queryset):
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        pk_name = queryset.model._meta.pk.name
+        if not ordering or ordering[-1].lstrip('-') != pk_name:
+            prefix = '-' if ordering and ordering[0].startswith('-') else ''
+            ordering.append(f'{prefix}{pk_name}')
+        return ordering
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance, reverse):
+        payload = {
+            'o': self.ordering,
+            'p': [self._dump_value(self._get_value(instance, key)) for key in self.ordering],
+            'r': reverse,
+        }
+        token = signing.dumps(payload, salt=self.signing_salt, compress=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+
+        try:
+            payload = signing.loads(token, salt=self.signing_salt)
+            if payload['o'] != self.ordering or len(payload['p']) != len(self.ordering):
+                raise ValueError
+            position = [
+                self._load_value(key, value)
+                for key, value in zip(self.ordering, payload['p'])
+            ]
+            return position, bool(payload['r'])
+        except (signing.BadSignature, KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _seek_filter(self, position, reverse):
+        """
+        Expand ``(k1, k2, ...) > (v1, v2, ...)`` into
+        ``k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...`` honouring per-key direction,
+        and lead with a plain bound on ``k1`` so the planner can start an index
+        range scan at the cursor instead of filtering from the beginning.
+        """
+        seek = Q()
+        equal = {}
+        for key, value in zip(self.ordering, position):
+            field = key.lstrip('-')
+            descending = key.startswith('-') != reverse
+            lookup = 'lt' if descending else 'gt'
+            seek |= Q(**equal, **{f'{field}__{lookup}': value})
+            equal[field] = value
+
+        first_key = self.ordering[0]
+        first_lookup = 'lte' if first_key.startswith('-') != reverse else 'gte'
+        return Q(**{f'{first_key.lstrip("-")}__{first_lookup}': position[0]}) & seek
+
+    def _load_value(self, key, value):
+        try:
+            field = self.model._meta.get_field(key.lstrip('-'))
+        except FieldDoesNotExist:
+            # Annotations such as a search rank are stored as plain JSON values.
+            return value
+        return field.to_python(value)
+
+    @staticmethod
+    def _invert(key):
+        return key[1:] if key.startswith('-') else f'-{key}'
+
+    @staticmethod
+    def _get_value(instance, key):
+        field = key.lstrip('-')
+        if isinstance(instance, dict):
+            return instance[field]
+        return getattr(instance, field)
+
+    @staticmethod
+    def _dump_value(value):
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return value
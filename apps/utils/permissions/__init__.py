@@ -1,3 +1,11 @@
 from apps.utils.permissions.rbac import IsAdmin, IsEditorOrAdmin, IsAnyRole
+from apps.utils.permissions.roles import get_request_roles, add_role_claims, invalidate_user_roles
 
-__all__ = ["IsAdmin", "IsEditorOrAdmin", "IsAnyRole"]
+__all__ = [
+    "IsAdmin",
+    "IsEditorOrAdmin",
+    "IsAnyRole",
+    "get_request_roles",
+    "add_role_claims",
+    "invalidate_user_roles",
+]
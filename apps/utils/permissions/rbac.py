@@ -1,14 +1,16 @@
 from rest_framework.permissions import BasePermission
 
+from apps.utils.permissions.roles import get_request_roles
+
 
 class IsAdmin(BasePermission):
     message = "Admin role required."
 
     def has_permission(self, request, view):
-        return (
+        return bool(
             request.user
             and request.user.is_authenticated
-            and request.user.groups.filter(name="admin").exists()
+            and get_request_roles(request) & {"admin"}
         )
 
 
@@ -16,10 +18,10 @@ class IsEditorOrAdmin(BasePermission):
     message = "Editor or Admin role required."
 
     def has_permission(self, request, view):
-        return (
+        return bool(
             request.user
             and request.user.is_authenticated
-            and request.user.groups.filter(name__in=["admin", "editor"]).exists()
+            and get_request_roles(request) & {"admin", "editor"}
         )
 
 
@@ -27,8 +29,8 @@ class IsAnyRole(BasePermission):
     message = "Authentication with an assigned role is required."
 
     def has_permission(self, request, view):
-        return (
+        return bool(
             request.user
             and request.user.is_authenticated
-            and request.user.groups.filter(name__in=["admin", "editor", "viewer"]).exists()
+            and get_request_roles(request) & {"admin", "editor", "viewer"}
         )
@@ -0,0 +1,68 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+ROLES_CLAIM = "roles"
+ROLES_VERSION_CLAIM = "roles_version"
+
+_REQUEST_ROLES_ATTR = "_rbac_roles"
+
+
+def _version_key(user_id) -> str:
+    return f"user:{user_id}:roles_version"
+
+
+def get_user_roles(user_id) -> frozenset[str]:
+    from django.contrib.auth.models import Group
+
+    return frozenset(Group.objects.filter(user__id=user_id).values_list("name", flat=True))
+
+
+def get_roles_version(user_id):
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        cache.add(_version_key(user_id), time.time_ns(), timeout=None)
+        version = cache.get(_version_key(user_id))
+    return version
+
+
+def invalidate_user_roles(user_ids) -> None:
+    """Make role claims already issued to these users stale."""
+    version = time.time_ns()
+    cache.set_many({_version_key(user_id): version for user_id in user_ids}, timeout=None)
+
+
+def add_role_claims(token, user_id) -> None:
+    if not settings.RBAC_ROLES_IN_TOKEN:
+        return
+    # Read the version first: a change racing with issuance then leaves the claim stale.
+    token[ROLES_VERSION_CLAIM] = get_roles_version(user_id)
+    token[ROLES_CLAIM] = sorted(get_user_roles(user_id))
+
+
+def get_request_roles(request) -> frozenset[str]:
+    """
+    Role names of the authenticated user, resolved at most once per request.
+
+    A current ``roles`` claim on the access token is trusted as is; otherwise the
+    user's groups are read from the database.
+    """
+    roles = getattr(request, _REQUEST_ROLES_ATTR, None)
+    if roles is not None:
+        return roles
+
+    user = request.user
+    token = getattr(request, "auth", None)
+    if (
+        settings.RBAC_ROLES_IN_TOKEN
+        and hasattr(token, "get")
+        and token.get(ROLES_CLAIM) is not None
+        and token.get(ROLES_VERSION_CLAIM) == get_roles_version(user.pk)
+    ):
+        roles = frozenset(token[ROLES_CLAIM])
+    else:
+        roles = get_user_roles(user.pk)
+
+    setattr(request, _REQUEST_ROLES_ATTR, roles)
+    return roles
@@ -1,3 +1,4 @@
 from apps.utils.responses.base_response import BaseResponse
+from apps.utils.responses.streaming import aiter_chunks, streaming_content
 
-__all__ = ['BaseResponse']
+__all__ = ['BaseResponse', 'aiter_chunks', 'streaming_content']
@@ -32,6 +32,12 @@ class BaseResponse:
             status=status.HTTP_204_NO_CONTENT
         )
 
+    @staticmethod
+    def not_modified(etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        response['ETag'] = etag
+        return response
+
     @staticmethod
     def error(message, status_code=status.HTTP_400_BAD_REQUEST, errors=None):
         response_data = {
@@ -64,3 +70,10 @@ class BaseResponse:
             status_code=status.HTTP_400_BAD_REQUEST,
             errors=errors
         )
+
+    @staticmethod
+    def precondition_failed(message=None):
+        return BaseResponse.error(
+            message=message or 'Resource has been modified',
+            status_code=status.HTTP_412_PRECONDITION_FAILED
+        )
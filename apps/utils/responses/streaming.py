@@ -0,0 +1,33 @@
+from typing import AsyncIterator, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+
+_END = object()
+
+
+async def aiter_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """
+    Pull ``chunks`` one at a time through ``sync_to_async``. The iterator runs in the
+    thread-sensitive executor, so it keeps its database connection between chunks,
+    and it is closed there when the client goes away.
+    """
+    iterator = iter(chunks)
+    try:
+        while (chunk := await sync_to_async(next)(iterator, _END)) is not _END:
+            yield chunk
+    finally:
+        if hasattr(iterator, 'close'):
+            await sync_to_async(iterator.close)()
+
+
+def streaming_content(request, chunks: Iterator[bytes]) -> Iterable[bytes] | AsyncIterator[bytes]:
+    """
+    ``chunks`` as ``StreamingHttpResponse`` content for the server handling
+    ``request``. Under ASGI Django collects a sync iterator into a list before
+    sending anything, so there it gets an async iterator; WSGI servers iterate
+    the chunks directly.
+    """
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        return aiter_chunks(chunks)
+    return chunks
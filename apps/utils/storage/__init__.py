@@ -1,3 +1,14 @@
-from apps.utils.storage.minio_storage import MinIOStorage
+from apps.utils.storage.minio_storage import MinIOStorage, is_missing_object
+from apps.utils.storage.uploads import (
+    S3MultipartUploadHandler,
+    StreamedUploadedFile,
+    StreamingMultiPartParser,
+)
 
-__all__ = ["MinIOStorage"]
+__all__ = [
+    "MinIOStorage",
+    "S3MultipartUploadHandler",
+    "StreamedUploadedFile",
+    "StreamingMultiPartParser",
+    "is_missing_object",
+]
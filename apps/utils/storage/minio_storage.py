@@ -1,5 +1,22 @@
+import hashlib
+import threading
+
+from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.cache import cache
 from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+# DeleteObjects accepts at most this many keys per request.
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+
+def is_missing_object(error: ClientError) -> bool:
+    """Whether ``error`` means the object (or key) does not exist."""
+    return error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
 
 
 class MinIOStorage(S3Boto3Storage):
@@ -14,3 +31,168 @@ class MinIOStorage(S3Boto3Storage):
         kwargs.setdefault("querystring_auth", getattr(settings, "MINIO_PRESIGNED_URLS", True))
         kwargs.setdefault("file_overwrite", False)
         super().__init__(*args, **kwargs)
+
+    @property
+    def client(self):
+        """
+        boto3 S3 client shared by every storage with the same endpoint and
+        credentials in this process. Unlike the per-thread ``connection``
+        resources, clients are thread-safe.
+        """
+        key = (
+            self.endpoint_url, self.access_key, self.secret_key, self.region_name,
+            self.use_ssl, self.verify, self.signature_version, self.addressing_style,
+        )
+        client = _clients.get(key)
+        if client is None:
+            with _clients_lock:
+                client = _clients.get(key)
+                if client is None:
+                    client = _clients[key] = self._create_session().client(
+                        "s3",
+                        region_name=self.region_name,
+                        use_ssl=self.use_ssl,
+                        endpoint_url=self.endpoint_url,
+                        config=self.client_config,
+                        verify=self.verify,
+                    )
+        return client
+
+    def url(self, name, parameters=None, expire=None, http_method=None):
+        if parameters or http_method or not self.signs_urls():
+            return super().url(name, parameters=parameters, expire=expire, http_method=http_method)
+        return self.urls([name], expire=expire)[name]
+
+    def urls(self, names, expire=None) -> dict:
+        """
+        Download URLs for many object names at once.
+
+        Presigned URLs come from one cache round trip; only the misses are signed,
+        and those are cached until ``MINIO_PRESIGNED_URL_MIN_VALIDITY`` seconds
+        before their signature expires.
+        """
+        names = list(dict.fromkeys(name for name in names if name))
+        if not self.signs_urls():
+            return {name: super(MinIOStorage, self).url(name, expire=expire) for name in names}
+        return self._presigned_urls(names, expire)
+
+    def presigned_url(self, name, expire=None) -> str:
+        """A presigned download URL for ``name``, even when ``url()`` returns plain URLs."""
+        return self._presigned_urls([name], expire)[name]
+
+    def _presigned_urls(self, names, expire=None) -> dict:
+        expire = self.querystring_expire if expire is None else expire
+        keys = {self._url_cache_key(name, expire): name for name in names}
+        urls = {keys[key]: url for key, url in cache.get_many(list(keys)).items()}
+
+        signed = {key: self._sign(name, expire) for key, name in keys.items() if name not in urls}
+        if signed:
+            timeout = expire - settings.MINIO_PRESIGNED_URL_MIN_VALIDITY
+            if timeout > 0:
+                cache.set_many(signed, timeout=timeout)
+            urls.update((keys[key], url) for key, url in signed.items())
+        return urls
+
+    def presigned_post(self, name, max_size, expire=None, content_type=None) -> dict:
+        """
+        URL and form fields for a browser/client to POST ``name`` straight to the
+        bucket. The policy pins the key and rejects bodies larger than ``max_size``.
+        """
+        fields = {}
+        conditions = [["content-length-range", 1, max_size]]
+        if content_type:
+            fields["Content-Type"] = content_type
+            conditions.append({"Content-Type": content_type})
+        return self.client.generate_presigned_post(
+            self.bucket_name,
+            self._normalize_name(clean_name(name)),
+            Fields=fields,
+            Conditions=conditions,
+            ExpiresIn=self.querystring_expire if expire is None else expire,
+        )
+
+    def head(self, name) -> dict | None:
+        """Size, content type and ETag of an object, or None if it does not exist."""
+        try:
+            response = self.client.head_object(
+                Bucket=self.bucket_name, Key=self._normalize_name(clean_name(name)),
+            )
+        except ClientError as e:
+            if is_missing_object(e):
+                return None
+            raise
+        return {
+            "size": response["ContentLength"],
+            "content_type": response.get("ContentType"),
+            "etag": response.get("ETag"),
+            "last_modified": response.get("LastModified"),
+        }
+
+    def iter_object(self, name, start=None, end=None, chunk_size=64 * 1024):
+        """
+        Iterator over the bytes of ``name`` (optionally only ``start``-``end``,
+        inclusive) in chunks as they arrive from the bucket. The request is sent
+        right away; the connection is closed when the caller stops iterating.
+        """
+        params = {"Bucket": self.bucket_name, "Key": self._normalize_name(clean_name(name))}
+        if start is not None:
+            params["Range"] = f"bytes={start}-{'' if end is None else end}"
+        return self._iter_body(self.client.get_object(**params)["Body"], chunk_size)
+
+    def open_stream(self, name):
+        """
+        Read-only stream of ``name`` straight from the bucket, without spooling
+        the whole object first like ``open()`` does. The caller closes it.
+        """
+        return self.client.get_object(
+            Bucket=self.bucket_name, Key=self._normalize_name(clean_name(name)),
+        )["Body"]
+
+    def delete_many(self, names) -> dict:
+        """
+        Delete objects with one ``DeleteObjects`` request per
+        ``DELETE_OBJECTS_MAX_KEYS`` names. Missing objects count as deleted.
+        Returns the names that could not be deleted, with the error message.
+        """
+        keys = {self._normalize_name(clean_name(name)): name for name in names if name}
+        pending = list(keys)
+        errors = {}
+        for start in range(0, len(pending), DELETE_OBJECTS_MAX_KEYS):
+            chunk = pending[start:start + DELETE_OBJECTS_MAX_KEYS]
+            response = self.client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+            )
+            for error in response.get("Errors", []):
+                errors[keys[error["Key"]]] = f"{error.get('Code')}: {error.get('Message')}"
+        return errors
+
+    def iter_objects(self, prefix=""):
+        """Name and last-modified time of every object under ``prefix``, one listing page at a time."""
+        location = f"{self.location.rstrip('/')}/" if self.location else ""
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self._normalize_name(clean_name(prefix))):
+            for item in page.get("Contents", []):
+                yield item["Key"][len(location):], item["LastModified"]
+
+    @staticmethod
+    def _iter_body(body, chunk_size):
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    def signs_urls(self) -> bool:
+        """Whether ``url()`` returns presigned URLs."""
+        return self.querystring_auth and not self.custom_domain
+
+    def _sign(self, name, expire) -> str:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket_name, "Key": self._normalize_name(clean_name(name))},
+            ExpiresIn=expire,
+        )
+
+    def _url_cache_key(self, name, expire) -> str:
+        digest = hashlib.blake2b(name.encode(), digest_size=16).hexdigest()
+        return f"storage:url:{self.bucket_name}:{expire}:{digest}"
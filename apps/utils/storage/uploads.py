@@ -0,0 +1,208 @@
+import hashlib
+import logging
+import os
+import time
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+from django.utils.text import get_valid_filename
+from rest_framework.parsers import MultiPartParser
+from storages.utils import clean_name
+
+logger = logging.getLogger(__name__)
+
+
+def default_upload_key(file_name: str) -> str:
+    return f"uploads/{uuid.uuid4().hex}/{get_valid_filename(os.path.basename(file_name))}"
+
+
+class StreamedUploadedFile(UploadedFile):
+    """
+    A file that was streamed into object storage while the request was parsed.
+
+    It has no local content; ``key`` is the stored object's name, to be assigned
+    to a FileField as is instead of being saved again. ``sha256`` is the content
+    hash computed on the way through. ``deduplicated`` files were not stored at
+    all: ``key`` names an existing object with the same content.
+    """
+
+    def __init__(
+        self, key, storage, size, content_type=None, charset=None, metrics=None,
+        sha256=None, original_name=None, deduplicated=False,
+    ):
+        super().__init__(file=None, name=key, content_type=content_type, size=size, charset=charset)
+        self.key = key
+        self.storage = storage
+        self.metrics = metrics or {}
+        self.sha256 = sha256
+        self.original_name = original_name or os.path.basename(key)
+        self.deduplicated = deduplicated
+
+    def open(self, mode=None):
+        return self.storage.open(self.key, mode or "rb")
+
+    def close(self):
+        pass
+
+    def discard(self) -> None:
+        """Delete the stored object, e.g. when the request that carried it fails."""
+        if not self.deduplicated:
+            self.storage.delete(self.key)
+
+
+class S3MultipartUploadHandler(FileUploadHandler):
+    """
+    Stream each uploaded file into an S3 multipart upload as it arrives.
+
+    Memory per upload is bounded by the part size (``MINIO_MULTIPART_PART_SIZE``):
+    one buffered part plus the copy being sent. Nothing touches local disk. An upload that does
+    not complete is aborted, so MinIO drops the parts already received.
+
+    The SHA-256 of each file is computed while it streams. If ``content_lookup``
+    (``sha256 -> key or None``) finds the content already stored, the upload is
+    aborted instead of completed and the file points at the existing key; files
+    that fit in one part are then never sent to storage at all.
+    """
+
+    def __init__(self, request=None, storage=None, key_func=None, content_lookup=None):
+        super().__init__(request)
+        self.storage = storage or default_storage
+        self.key_func = key_func or default_upload_key
+        self.content_lookup = content_lookup
+        self.part_size = settings.MINIO_MULTIPART_PART_SIZE
+        self.upload_id = None
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        self.key = self.storage._normalize_name(clean_name(self.key_func(file_name)))
+        self.buffer = bytearray()
+        self.parts = []
+        self.hasher = hashlib.sha256()
+        self.started = time.monotonic()
+        response = self.storage.client.create_multipart_upload(
+            Bucket=self.storage.bucket_name,
+            Key=self.key,
+            ContentType=content_type or "application/octet-stream",
+        )
+        self.upload_id = response["UploadId"]
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.hasher.update(raw_data)
+        self.buffer += raw_data
+        if len(self.buffer) >= self.part_size:
+            self._upload_part()
+        return None
+
+    def file_complete(self, file_size):
+        sha256 = self.hasher.hexdigest()
+        existing = self.content_lookup(sha256) if self.content_lookup else None
+        if existing is not None:
+            upload_id, self.upload_id = self.upload_id, None
+            self._abort(upload_id)
+            logger.info("Upload of %s matches stored object %s; not stored again", self.key, existing)
+            return StreamedUploadedFile(
+                key=existing,
+                storage=self.storage,
+                size=file_size,
+                content_type=self.content_type,
+                charset=self.charset,
+                metrics={"bytes": file_size, "parts": len(self.parts), "deduplicated": True},
+                sha256=sha256,
+                original_name=self.file_name,
+                deduplicated=True,
+            )
+
+        # S3 needs at least one part; only the last one may be under the minimum size.
+        if self.buffer or not self.parts:
+            self._upload_part()
+        self.storage.client.complete_multipart_upload(
+            Bucket=self.storage.bucket_name,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self.parts},
+        )
+        self.upload_id = None
+
+        elapsed = time.monotonic() - self.started
+        metrics = {
+            "bytes": file_size,
+            "parts": len(self.parts),
+            "seconds": round(elapsed, 3),
+            "bytes_per_second": int(file_size / elapsed) if elapsed > 0 else None,
+        }
+        logger.info(
+            "Streamed %s to object storage: %d bytes in %d parts, %.3fs (%s B/s)",
+            self.key, file_size, len(self.parts), elapsed, metrics["bytes_per_second"],
+        )
+        return StreamedUploadedFile(
+            key=self.key,
+            storage=self.storage,
+            size=file_size,
+            content_type=self.content_type,
+            charset=self.charset,
+            metrics=metrics,
+            sha256=sha256,
+            original_name=self.file_name,
+        )
+
+    def upload_interrupted(self):
+        self.abort()
+
+    def abort(self) -> None:
+        if self.upload_id is None:
+            return
+        upload_id, self.upload_id = self.upload_id, None
+        logger.warning("Aborting streamed upload of %s after %d parts", self.key, len(self.parts))
+        self._abort(upload_id)
+
+    def _abort(self, upload_id) -> None:
+        try:
+            self.storage.client.abort_multipart_upload(
+                Bucket=self.storage.bucket_name, Key=self.key, UploadId=upload_id,
+            )
+        except Exception:
+            # A failed abort leaves parts behind; MinIO's stale-upload cleanup removes them.
+            logger.exception("Could not abort multipart upload %s of %s", upload_id, self.key)
+
+    def _upload_part(self):
+        part_number = len(self.parts) + 1
+        response = self.storage.client.upload_part(
+            Bucket=self.storage.bucket_name,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=bytes(self.buffer),
+        )
+        self.parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self.buffer.clear()
+
+
+class StreamingMultiPartParser(MultiPartParser):
+    """
+    MultiPartParser that streams file parts into object storage through
+    S3MultipartUploadHandler instead of buffering them in memory or temp files.
+
+    Set ``key_func`` (a staticmethod) on a subclass to choose object names, and
+    ``content_lookup`` to skip storing content that is already stored.
+    Multipart uploads still open when parsing fails, e.g. because the client
+    disconnected, are aborted.
+    """
+
+    key_func = None
+    content_lookup = None
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        request = parser_context["request"]
+        handler = S3MultipartUploadHandler(
+            request._request, key_func=self.key_func, content_lookup=self.content_lookup,
+        )
+        request._request.upload_handlers = [handler]
+        try:
+            return super().parse(stream, media_type, parser_context)
+        except BaseException:
+            handler.abort()
+            raise
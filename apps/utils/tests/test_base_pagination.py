@@ -0,0 +1,62 @@
+from django.test import TestCase
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.records.models.records_model import DataRecord
+from apps.utils.pagination import StandardResultsPagination
+
+
+class EstimatedCount:
+    """Count strategy that reports a fixed, inexact count."""
+
+    def __init__(self, estimate):
+        self.estimate = estimate
+
+    def count(self, queryset, request):
+        return self.estimate, False
+
+
+class StandardResultsPaginationTests(TestCase):
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        for i in range(5):
+            DataRecord.objects.create(title=f"Record {i}")
+        self.queryset = DataRecord.objects.order_by("id")
+
+    def _paginate(self, params, count_strategy=None):
+        paginator = StandardResultsPagination(count_strategy=count_strategy)
+        page = paginator.paginate_queryset(self.queryset, Request(self.factory.get("/api/records/", params)))
+        return paginator, page
+
+    def test_exact_count_bounds_pages(self):
+        paginator, page = self._paginate({"page": 3, "page_size": 2})
+        self.assertEqual(len(page), 1)
+        self.assertFalse(paginator.page.has_next())
+        with self.assertRaises(NotFound):
+            self._paginate({"page": 4, "page_size": 2})
+
+    def test_underestimate_does_not_hide_later_pages(self):
+        paginator, page = self._paginate({"page": 2, "page_size": 2}, EstimatedCount(1))
+        self.assertEqual([record.title for record in page], ["Record 2", "Record 3"])
+        self.assertTrue(paginator.page.has_next())
+        self.assertIsNotNone(paginator.get_next_link())
+
+        paginator, page = self._paginate({"page": 3, "page_size": 2}, EstimatedCount(1))
+        self.assertEqual(len(page), 1)
+        self.assertIsNone(paginator.get_next_link())
+
+    def test_overestimate_ends_at_the_last_real_page(self):
+        paginator, page = self._paginate({"page": 3, "page_size": 2}, EstimatedCount(1_000))
+        self.assertFalse(paginator.page.has_next())
+        with self.assertRaises(NotFound):
+            self._paginate({"page": 4, "page_size": 2}, EstimatedCount(1_000))
+
+    def test_estimated_first_page_may_be_empty(self):
+        paginator, page = self._paginate({}, EstimatedCount(1_000))
+        self.assertEqual(len(page), 5)
+
+        DataRecord.objects.all().delete()
+        paginator, page = self._paginate({}, EstimatedCount(1_000))
+        self.assertEqual(page, [])
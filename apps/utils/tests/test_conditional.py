@@ -0,0 +1,54 @@
+from django.test import SimpleTestCase
+from rest_framework.test import APIRequestFactory
+
+from apps.utils.conditional import (
+    RangeNotSatisfiable, if_match_etags, is_not_modified, make_etag, parse_range,
+)
+
+
+class ETagTests(SimpleTestCase):
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.etag = make_etag(42)
+
+    def test_make_etag_quotes_parts(self):
+        self.assertEqual(make_etag("l", 1, "ab"), '"l-1-ab"')
+
+    def test_if_none_match_uses_weak_comparison(self):
+        for header in (self.etag, f"W/{self.etag}", f'"other", {self.etag}', "*"):
+            with self.subTest(header=header):
+                request = self.factory.get("/", HTTP_IF_NONE_MATCH=header)
+                self.assertTrue(is_not_modified(request, self.etag))
+        self.assertFalse(is_not_modified(self.factory.get("/", HTTP_IF_NONE_MATCH='"other"'), self.etag))
+        self.assertFalse(is_not_modified(self.factory.get("/"), self.etag))
+
+    def test_if_match_etags(self):
+        self.assertIsNone(if_match_etags(self.factory.patch("/")))
+        self.assertIsNone(if_match_etags(self.factory.patch("/", HTTP_IF_MATCH="*")))
+        request = self.factory.patch("/", HTTP_IF_MATCH=f'"other", {self.etag}')
+        self.assertEqual(if_match_etags(request), ['"other"', self.etag])
+
+
+class RangeTests(SimpleTestCase):
+
+    def test_parse_range(self):
+        cases = {
+            None: None,
+            "bytes=0-9": (0, 9),
+            "bytes=90-": (90, 99),
+            "bytes=-10": (90, 99),
+            "bytes=-500": (0, 99),
+            "bytes=50-500": (50, 99),
+            "bytes=9-0": None,
+            "bytes=0-1,5-6": None,
+            "items=0-1": None,
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(parse_range(header, 100), expected)
+
+    def test_unsatisfiable(self):
+        for header in ("bytes=100-", "bytes=-0"):
+            with self.subTest(header=header), self.assertRaises(RangeNotSatisfiable):
+                parse_range(header, 100)
@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.records.models.records_model import DataRecord
+from apps.records.services import DataRecordService, RECORD_COUNT_NAMESPACE
+from apps.utils.pagination.count_strategies import AdaptiveCount
+
+
+class AdaptiveCountTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.strategy = AdaptiveCount(namespace=RECORD_COUNT_NAMESPACE, estimate_threshold=10_000)
+        DataRecord.objects.create(title="A", is_active=True)
+        DataRecord.objects.create(title="B", is_active=False)
+
+    def _request(self, params):
+        return Request(self.factory.get("/", params))
+
+    def test_exact_count_is_cached(self):
+        request = self._request({"is_active": "true"})
+        queryset = DataRecord.objects.filter(is_active=True)
+        self.assertEqual(self.strategy.count(queryset, request), (1, True))
+
+        DataRecord.objects.create(title="C", is_active=True)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.strategy.count(queryset, request), (1, True))
+
+    def test_service_writes_invalidate_cached_counts(self):
+        request = self._request({})
+        self.assertEqual(self.strategy.count(DataRecord.objects.all(), request), (2, True))
+
+        DataRecordService.create_record(title="C")
+        self.assertEqual(self.strategy.count(DataRecord.objects.all(), request), (3, True))
+
+    def test_cache_key_ignores_pagination_and_ordering(self):
+        first = self.strategy.get_cache_key(self._request({"is_active": "true", "page": 1, "ordering": "title"}))
+        second = self.strategy.get_cache_key(self._request({"page": 3, "is_active": "true"}))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, self.strategy.get_cache_key(self._request({"is_active": "false"})))
+
+    def test_large_filtered_result_uses_planner_estimate(self):
+        strategy = AdaptiveCount(namespace=RECORD_COUNT_NAMESPACE, estimate_threshold=1)
+        queryset = DataRecord.objects.filter(title__gte="")
+        count, exact = strategy.count(queryset, self._request({"search": "x"}))
+        self.assertFalse(exact)
+        self.assertGreaterEqual(count, 1)
+
+    def test_default_manager_filter_does_not_count_as_filtered(self):
+        self.assertFalse(AdaptiveCount.is_filtered(DataRecord.objects.all()))
+        self.assertTrue(AdaptiveCount.is_filtered(DataRecord.objects.filter(is_active=True)))
+        self.assertTrue(AdaptiveCount.is_filtered(DataRecord.all_objects.all()))
+
+    def test_large_unfiltered_list_estimates_live_rows_only(self):
+        deleted = DataRecord.objects.create(title="Deleted")
+        DataRecordService.delete_record(deleted.pk)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {DataRecord._meta.db_table}")
+        strategy = AdaptiveCount(namespace=RECORD_COUNT_NAMESPACE, estimate_threshold=1)
+        # Estimated before the cache is read.
+        cache.set(strategy.get_cache_key(self._request({})), 99)
+        with self.assertNumQueries(1):
+            count, exact = strategy.count(DataRecord.objects.all(), self._request({}))
+        self.assertFalse(exact)
+        self.assertEqual(count, 2)
+        self.assertEqual(AdaptiveCount.estimate_table_rows(DataRecord.objects.all()), 3)
+
+    def test_small_unfiltered_list_is_counted_exactly(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {DataRecord._meta.db_table}")
+        self.assertEqual(self.strategy.count(DataRecord.objects.all(), self._request({})), (2, True))
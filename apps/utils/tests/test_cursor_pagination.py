@@ -0,0 +1,104 @@
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.records.models.records_model import DataRecord
+from apps.utils.filters.data_record_filter import DataRecordFilter
+from apps.utils.pagination.cursor_pagination import KeysetCursorPagination
+
+
+def cursor_from(link):
+    return parse_qs(urlparse(link).query)["cursor"][0]
+
+
+class KeysetCursorPaginationTests(TestCase):
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        now = timezone.now()
+        titles = ["Delta", "alpha", "Charlie", "bravo", "Echo", "Delta", "alpha"]
+        for i, title in enumerate(titles):
+            record = DataRecord.objects.create(title=title, is_active=i % 2 == 0)
+            # Duplicate timestamps exercise the id tiebreaker.
+            DataRecord.objects.filter(pk=record.pk).update(
+                created_at=now - timedelta(minutes=i // 2),
+                updated_at=now - timedelta(minutes=i % 3),
+            )
+
+    def _page(self, params):
+        request = Request(self.factory.get("/api/records/", params))
+        queryset = DataRecordFilter().filter_queryset(request, DataRecord.objects.all(), view=None)
+        paginator = KeysetCursorPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        return paginator, [record.pk for record in page]
+
+    def _expected(self, ordering, **params):
+        if ordering:
+            params["ordering"] = ordering
+        request = Request(self.factory.get("/", params))
+        queryset = DataRecordFilter().filter_queryset(request, DataRecord.objects.all(), view=None)
+        return list(queryset.values_list("pk", flat=True))
+
+    def test_walks_every_allowed_ordering_without_gaps_or_duplicates(self):
+        for ordering in sorted(DataRecordFilter.ALLOWED_ORDERING_FIELDS):
+            with self.subTest(ordering=ordering):
+                params = {"ordering": ordering, "page_size": 2, "cursor": ""}
+                seen = []
+                while True:
+                    paginator, ids = self._page(params)
+                    seen.extend(ids)
+                    next_link = paginator.get_next_link()
+                    if not next_link:
+                        break
+                    params["cursor"] = cursor_from(next_link)
+                self.assertEqual(seen, self._expected(ordering))
+
+    def test_walks_search_relevance_ordering(self):
+        DataRecord.objects.filter(title="alpha").update(description="delta delta")
+        params = {"search": "delta", "page_size": 1, "cursor": ""}
+        seen = []
+        while True:
+            paginator, ids = self._page(params)
+            seen.extend(ids)
+            if not paginator.get_next_link():
+                break
+            params["cursor"] = cursor_from(paginator.get_next_link())
+        self.assertEqual(seen, self._expected(None, search="delta"))
+
+    def test_previous_link_returns_preceding_page(self):
+        params = {"ordering": "title", "page_size": 3, "cursor": ""}
+        first_paginator, first_ids = self._page(params)
+        self.assertIsNone(first_paginator.get_previous_link())
+
+        params["cursor"] = cursor_from(first_paginator.get_next_link())
+        second_paginator, _ = self._page(params)
+
+        params["cursor"] = cursor_from(second_paginator.get_previous_link())
+        _, previous_ids = self._page(params)
+        self.assertEqual(previous_ids, first_ids)
+
+    def test_tampered_cursor_rejected(self):
+        paginator, _ = self._page({"page_size": 2, "cursor": ""})
+        token = cursor_from(paginator.get_next_link())
+        with self.assertRaises(NotFound):
+            self._page({"page_size": 2, "cursor": token[:-2] + "xx"})
+
+    def test_cursor_from_other_ordering_rejected(self):
+        paginator, _ = self._page({"ordering": "title", "page_size": 2, "cursor": ""})
+        token = cursor_from(paginator.get_next_link())
+        with self.assertRaises(NotFound):
+            self._page({"ordering": "-created_at", "page_size": 2, "cursor": token})
+
+    def test_deep_page_query_has_no_offset(self):
+        paginator, _ = self._page({"page_size": 2, "cursor": ""})
+        token = cursor_from(paginator.get_next_link())
+        with self.assertNumQueries(1) as ctx:
+            self._page({"page_size": 2, "cursor": token})
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertNotIn("OFFSET", sql)
+        self.assertNotIn("COUNT(", sql)
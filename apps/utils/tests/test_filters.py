@@ -1,4 +1,8 @@
-from django.test import TestCase
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.utils import timezone
 from rest_framework.test import APIRequestFactory
 from rest_framework.request import Request
 
@@ -31,6 +35,16 @@ class DataRecordFilterTests(TestCase):
         self.assertEqual(qs.count(), 1)
         self.assertEqual(qs.first().title, "Project Plan")
 
+    def test_search_matches_prefix_of_every_word(self):
+        qs = self._filter({"search": "meet not"})
+        self.assertEqual(list(qs.values_list("title", flat=True)), ["Meeting Notes"])
+
+    def test_search_orders_by_relevance_unless_ordering_given(self):
+        qs = self._filter({"search": "report"})
+        self.assertEqual(qs.first().title, "Annual Report")
+        qs = self._filter({"search": "report", "ordering": "title"})
+        self.assertEqual(list(qs.values_list("title", flat=True)), ["Annual Report", "Project Plan"])
+
     def test_search_no_match_returns_empty(self):
         qs = self._filter({"search": "xyz_nomatch"})
         self.assertEqual(qs.count(), 0)
@@ -52,3 +66,88 @@ class DataRecordFilterTests(TestCase):
         # Should not raise; falls back to model default ordering
         qs = self._filter({"ordering": "invalid_field"})
         self.assertEqual(qs.count(), 3)
+
+
+class DateRangeFilterTests(TestCase):
+    """The sargable ranges must select exactly what ``created_at__date`` lookups did."""
+
+    WINDOWS = [
+        # America/New_York: spring forward 2025-03-09 02:00, fall back 2025-11-02 02:00.
+        ("America/New_York", date(2025, 3, 8)),
+        ("America/New_York", date(2025, 11, 1)),
+        # America/Santiago: clocks jump from 00:00 to 01:00 on 2025-09-07.
+        ("America/Santiago", date(2025, 9, 6)),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        for _, first_day in cls.WINDOWS:
+            start = datetime.combine(first_day, datetime.min.time(), tzinfo=dt_timezone.utc)
+            for step in range(0, 4 * 24 * 2):
+                record = DataRecord.objects.create(title=f"{first_day} {step}")
+                moment = start + timedelta(minutes=30 * step)
+                DataRecord.objects.filter(pk=record.pk).update(created_at=moment, updated_at=moment)
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def _filter(self, params):
+        request = Request(self.factory.get("/", params))
+        return DataRecordFilter().filter_queryset(request, DataRecord.objects.all(), view=None)
+
+    def _ids(self, queryset):
+        return set(queryset.values_list("pk", flat=True))
+
+    def _assert_matches_date_lookup(self, tz_name, params):
+        with timezone.override(tz_name):
+            lookups = {}
+            if "created_at_after" in params:
+                lookups["created_at__date__gte"] = params["created_at_after"]
+            if "created_at_before" in params:
+                lookups["created_at__date__lte"] = params["created_at_before"]
+            expected = self._ids(DataRecord.objects.filter(**lookups))
+        actual = self._ids(self._filter({**params, "tz": tz_name}))
+        self.assertTrue(expected)
+        self.assertEqual(actual, expected)
+
+    def test_date_ranges_match_date_lookups_across_dst(self):
+        for tz_name, first_day in self.WINDOWS:
+            days = [(first_day + timedelta(days=offset)).isoformat() for offset in range(3)]
+            for after in days:
+                for before in days:
+                    if before < after:
+                        continue
+                    with self.subTest(tz=tz_name, after=after, before=before):
+                        self._assert_matches_date_lookup(
+                            tz_name, {"created_at_after": after, "created_at_before": before}
+                        )
+                with self.subTest(tz=tz_name, after=after):
+                    self._assert_matches_date_lookup(tz_name, {"created_at_after": after})
+
+    @override_settings(TIME_ZONE="America/New_York")
+    def test_defaults_to_current_time_zone(self):
+        expected = self._ids(DataRecord.objects.filter(created_at__date__lte="2025-03-09"))
+        self.assertEqual(self._ids(self._filter({"created_at_before": "2025-03-09"})), expected)
+
+    def test_datetime_bounds_are_half_open(self):
+        qs = self._filter({"created_at_gte": "2025-03-09T06:00:00Z", "created_at_lt": "2025-03-09T07:00:00Z"})
+        self.assertEqual(qs.count(), 2)
+
+    def test_naive_datetime_uses_request_time_zone(self):
+        qs = self._filter({"created_at_gte": "2025-03-09T01:00:00", "created_at_lt": "2025-03-09T03:00:00", "tz": "America/New_York"})
+        # 01:00-03:00 local on the spring-forward night is a single real hour.
+        self.assertEqual(qs.count(), 2)
+
+    def test_updated_at_range(self):
+        qs = self._filter({"updated_at_gte": "2025-11-02T00:00:00Z", "updated_at_before": "2025-11-02", "tz": "UTC"})
+        self.assertEqual(qs.count(), 48)
+
+    def test_range_lookups_do_not_cast_column(self):
+        sql = str(self._filter({"created_at_after": "2025-03-09", "tz": "America/New_York"}).query)
+        self.assertNotIn("AT TIME ZONE", sql)
+
+    def test_invalid_values_raise_validation_error(self):
+        for params in ({"created_at_after": "2025-13-01"}, {"updated_at_gte": "yesterday"}, {"tz": "Mars/Olympus"}):
+            with self.subTest(params=params):
+                with self.assertRaises(ValidationError):
+                    self._filter(params)
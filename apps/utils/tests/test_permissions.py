@@ -1,7 +1,9 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
-from django.test import TestCase, RequestFactory
+from django.core.cache import cache
+from django.test import TestCase, RequestFactory, override_settings
 
+from apps.user.tokens import RoleRefreshToken
 from apps.utils.permissions.rbac import IsAdmin, IsEditorOrAdmin, IsAnyRole
 
 User = get_user_model()
@@ -17,6 +19,7 @@ def make_user(username, group_name=None):
 
 class PermissionTestBase(TestCase):
     def setUp(self):
+        cache.clear()
         self.factory = RequestFactory()
         self.admin_user = make_user("admin_user", "admin")
         self.editor_user = make_user("editor_user", "editor")
@@ -81,3 +84,47 @@ class IsAnyRoleTests(PermissionTestBase):
 
     def test_no_group_denied(self):
         self.assertFalse(self._has_perm(self.perm, self.no_group_user))
+
+
+class RoleResolutionTests(PermissionTestBase):
+    def _request(self, user, token=None):
+        request = self.factory.get("/")
+        request.user = user
+        request.auth = token
+        return request
+
+    def _check_all(self, request):
+        return [perm.has_permission(request, view=None) for perm in (IsAdmin(), IsEditorOrAdmin(), IsAnyRole())]
+
+    def test_roles_loaded_once_per_request(self):
+        request = self._request(self.editor_user)
+        with self.assertNumQueries(1):
+            self.assertEqual(self._check_all(request), [False, True, True])
+
+    def test_current_token_claim_needs_no_query(self):
+        token = RoleRefreshToken.for_user(self.admin_user).access_token
+        request = self._request(self.admin_user, token)
+        with self.assertNumQueries(0):
+            self.assertEqual(self._check_all(request), [True, True, True])
+
+    def test_membership_change_invalidates_claim(self):
+        token = RoleRefreshToken.for_user(self.viewer_user).access_token
+        self.viewer_user.groups.add(Group.objects.get(name="admin"))
+
+        request = self._request(self.viewer_user, token)
+        with self.assertNumQueries(1):
+            self.assertTrue(IsAdmin().has_permission(request, view=None))
+
+    def test_group_removed_from_user_side_invalidates_claim(self):
+        token = RoleRefreshToken.for_user(self.editor_user).access_token
+        Group.objects.get(name="editor").user_set.remove(self.editor_user)
+
+        request = self._request(self.editor_user, token)
+        self.assertFalse(IsEditorOrAdmin().has_permission(request, view=None))
+
+    @override_settings(RBAC_ROLES_IN_TOKEN=False)
+    def test_claims_ignored_when_disabled(self):
+        token = RoleRefreshToken.for_user(self.admin_user).access_token
+        self.assertNotIn("roles", token.payload)
+        with self.assertNumQueries(1):
+            self.assertTrue(IsAdmin().has_permission(self._request(self.admin_user, token), view=None))
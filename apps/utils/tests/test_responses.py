@@ -0,0 +1,31 @@
+from django.test import RequestFactory, SimpleTestCase
+from django.test.client import AsyncRequestFactory
+
+from apps.utils.responses import streaming_content
+
+
+class StreamingContentTests(SimpleTestCase):
+
+    def setUp(self):
+        self.pulled = []
+        self.closed = False
+
+    def chunks(self):
+        try:
+            for chunk in (b"a", b"b", b"c"):
+                self.pulled.append(chunk)
+                yield chunk
+        finally:
+            self.closed = True
+
+    def test_wsgi_gets_the_iterator(self):
+        chunks = self.chunks()
+        self.assertIs(streaming_content(RequestFactory().get("/"), chunks), chunks)
+
+    async def test_asgi_pulls_one_chunk_at_a_time(self):
+        content = streaming_content(AsyncRequestFactory().get("/"), self.chunks())
+        self.assertEqual(await anext(content), b"a")
+        self.assertEqual(self.pulled, [b"a"])
+
+        await content.aclose()
+        self.assertTrue(self.closed)
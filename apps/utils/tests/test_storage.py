@@ -0,0 +1,210 @@
+import hashlib
+import io
+import threading
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.utils.storage import (
+    MinIOStorage,
+    S3MultipartUploadHandler,
+    StreamedUploadedFile,
+    StreamingMultiPartParser,
+)
+
+
+class MinIOStorageUrlTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.storage = MinIOStorage()
+
+    def test_presigned_url_is_signed_once_and_cached(self):
+        with mock.patch.object(self.storage.client, "generate_presigned_url", wraps=self.storage.client.generate_presigned_url) as sign:
+            first = self.storage.url("records/a.pdf")
+            second = self.storage.url("records/a.pdf")
+        self.assertEqual(first, second)
+        self.assertEqual(sign.call_count, 1)
+        self.assertIn("Signature", first)
+
+    def test_matches_unbatched_url(self):
+        url = self.storage.urls(["records/a b.pdf"])["records/a b.pdf"]
+        expected = super(MinIOStorage, self.storage).url("records/a b.pdf")
+        self.assertEqual(urlparse(url).path, urlparse(expected).path)
+        self.assertEqual(parse_qs(urlparse(url).query).keys(), parse_qs(urlparse(expected).query).keys())
+
+    def test_batch_signs_only_misses_in_one_cache_round_trip(self):
+        self.storage.urls(["records/a.pdf"])
+        with mock.patch.object(self.storage, "_sign", wraps=self.storage._sign) as sign, \
+                mock.patch("apps.utils.storage.minio_storage.cache.get_many", wraps=cache.get_many) as get_many:
+            urls = self.storage.urls(["records/a.pdf", "records/b.pdf", "", None, "records/b.pdf"])
+        self.assertEqual(sorted(urls), ["records/a.pdf", "records/b.pdf"])
+        self.assertEqual(get_many.call_count, 1)
+        sign.assert_called_once_with("records/b.pdf", self.storage.querystring_expire)
+
+    @override_settings(MINIO_PRESIGNED_URL_MIN_VALIDITY=600)
+    def test_cache_entry_expires_before_signature(self):
+        with mock.patch("apps.utils.storage.minio_storage.cache.set_many") as set_many:
+            self.storage.urls(["records/a.pdf"], expire=3600)
+        self.assertEqual(set_many.call_args.kwargs["timeout"], 3000)
+
+    @override_settings(MINIO_PRESIGNED_URL_MIN_VALIDITY=600)
+    def test_short_lived_urls_are_not_cached(self):
+        self.storage.urls(["records/a.pdf"], expire=300)
+        self.assertEqual(cache.get_many([self.storage._url_cache_key("records/a.pdf", 300)]), {})
+
+    def test_client_is_shared_across_instances_and_threads(self):
+        clients = []
+        thread = threading.Thread(target=lambda: clients.append(MinIOStorage().client))
+        thread.start()
+        thread.join()
+        self.assertIs(clients[0], self.storage.client)
+        self.assertIsNot(MinIOStorage(bucket_name="other", access_key="x").client, self.storage.client)
+
+    def test_unsigned_storage_skips_cache(self):
+        storage = MinIOStorage(querystring_auth=False)
+        url = storage.urls(["records/a.pdf"])["records/a.pdf"]
+        self.assertNotIn("X-Amz-Signature", url)
+
+
+class MinIOStorageBatchTests(SimpleTestCase):
+
+    def setUp(self):
+        self.client = mock.Mock()
+        patcher = mock.patch.object(MinIOStorage, "client", new_callable=mock.PropertyMock, return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.storage = MinIOStorage()
+
+    def test_delete_many_sends_at_most_1000_keys_per_request(self):
+        self.client.delete_objects.side_effect = [
+            {},
+            {"Errors": [{"Key": "records/1500.pdf", "Code": "AccessDenied", "Message": "Access Denied"}]},
+            {},
+        ]
+        errors = self.storage.delete_many([f"records/{i}.pdf" for i in range(2500)] + [""])
+
+        sizes = [len(call.kwargs["Delete"]["Objects"]) for call in self.client.delete_objects.call_args_list]
+        self.assertEqual(sizes, [1000, 1000, 500])
+        self.assertTrue(self.client.delete_objects.call_args.kwargs["Delete"]["Quiet"])
+        self.assertEqual(errors, {"records/1500.pdf": "AccessDenied: Access Denied"})
+
+    def test_iter_objects_walks_every_page(self):
+        self.client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "records/a.pdf", "LastModified": 1}, {"Key": "records/b.pdf", "LastModified": 2}]},
+            {"Contents": [{"Key": "records/c.pdf", "LastModified": 3}]},
+            {},
+        ]
+        self.assertEqual(
+            list(self.storage.iter_objects("records/")),
+            [("records/a.pdf", 1), ("records/b.pdf", 2), ("records/c.pdf", 3)],
+        )
+        self.client.get_paginator.assert_called_once_with("list_objects_v2")
+
+
+class FakeMultipartClient:
+
+    def __init__(self):
+        self.parts = {}
+        self.completed = {}
+        self.aborted = []
+
+    def create_multipart_upload(self, Bucket, Key, ContentType):
+        upload_id = f"upload-{len(self.parts) + 1}"
+        self.parts[upload_id] = []
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.parts[UploadId].append(Body)
+        return {"ETag": f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed[Key] = b"".join(self.parts.pop(UploadId))
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(Key)
+        self.parts.pop(UploadId)
+
+
+class DisconnectingStream:
+
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def read(self, size=-1):
+        chunk = self.data.read(size)
+        if not chunk:
+            raise OSError("Client disconnected")
+        return chunk
+
+    def readline(self, size=-1):
+        return self.data.readline(size)
+
+
+@override_settings(MINIO_MULTIPART_PART_SIZE=10)
+@mock.patch.object(S3MultipartUploadHandler, "chunk_size", 4)
+class StreamingMultiPartParserTests(SimpleTestCase):
+
+    def setUp(self):
+        self.client = FakeMultipartClient()
+        patcher = mock.patch.object(MinIOStorage, "client", new_callable=mock.PropertyMock, return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.factory = APIRequestFactory()
+
+    def _request(self, content, truncate=None, parser=None):
+        body = encode_multipart(BOUNDARY, {"title": "T", "file": SimpleUploadedFile("doc.pdf", content)})
+        django_request = self.factory.generic("POST", "/", body, content_type=MULTIPART_CONTENT)
+        if truncate:
+            django_request._stream = DisconnectingStream(body[:-truncate])
+        return Request(django_request, parsers=[parser or StreamingMultiPartParser()])
+
+    def test_streams_file_in_bounded_parts(self):
+        content = bytes(range(256)) * 4
+        with mock.patch.object(MinIOStorage, "_sign") as sign:
+            request = self._request(content)
+            uploaded = request.FILES["file"]
+        sign.assert_not_called()
+
+        self.assertIsInstance(uploaded, StreamedUploadedFile)
+        self.assertEqual(uploaded.size, len(content))
+        self.assertTrue(uploaded.key.startswith("uploads/") and uploaded.key.endswith("/doc.pdf"))
+        self.assertEqual(self.client.completed[uploaded.key], content)
+        self.assertGreater(uploaded.metrics["parts"], 1)
+        self.assertEqual(uploaded.metrics["bytes"], len(content))
+        self.assertEqual(uploaded.sha256, hashlib.sha256(content).hexdigest())
+        self.assertEqual(uploaded.original_name, "doc.pdf")
+        self.assertEqual(request.data["title"], "T")
+
+    def test_known_content_is_not_stored_again(self):
+        content = bytes(range(256)) * 4
+        lookup = mock.Mock(return_value="blobs/existing.pdf")
+        parser = StreamingMultiPartParser()
+        parser.content_lookup = lookup
+
+        uploaded = self._request(content, parser=parser).FILES["file"]
+
+        lookup.assert_called_once_with(hashlib.sha256(content).hexdigest())
+        self.assertEqual((uploaded.key, uploaded.deduplicated), ("blobs/existing.pdf", True))
+        self.assertEqual(self.client.completed, {})
+        self.assertEqual(len(self.client.aborted), 1)
+        with mock.patch.object(MinIOStorage, "delete") as delete:
+            uploaded.discard()
+        delete.assert_not_called()
+
+    def test_empty_file_still_completes(self):
+        request = self._request(b"")
+        self.assertEqual(self.client.completed[request.FILES["file"].key], b"")
+
+    def test_disconnect_aborts_multipart_upload(self):
+        request = self._request(b"x" * 5000, truncate=2000)
+        with self.assertRaises(OSError):
+            request.data
+        self.assertEqual(len(self.client.aborted), 1)
+        self.assertEqual(self.client.completed, {})
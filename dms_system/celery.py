@@ -0,0 +1,47 @@
+import logging
+import os
+
+from botocore.exceptions import ConnectionError as S3ConnectionError
+from celery import Celery
+from django.db import InterfaceError, OperationalError, transaction
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "dms_system.settings")
+
+logger = logging.getLogger(__name__)
+
+app = Celery("dms_system")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
+
+# Errors worth retrying: the database, cache or bucket was briefly unreachable.
+# Anything else is a bug or bad input and fails the task right away.
+TRANSIENT_ERRORS = (
+    OperationalError,
+    InterfaceError,
+    RedisConnectionError,
+    RedisTimeoutError,
+    S3ConnectionError,
+)
+
+# Retry policy shared by the tasks: exponential backoff with jitter, capped.
+RETRY_POLICY = {
+    "autoretry_for": TRANSIENT_ERRORS,
+    "retry_backoff": True,
+    "retry_backoff_max": 600,
+    "retry_jitter": True,
+}
+
+
+def enqueue_on_commit(task, *args, **kwargs) -> None:
+    """
+    Send ``task`` once the current transaction commits (right away outside one).
+    Publishing errors are logged rather than raised: the write already committed.
+    """
+    def send():
+        try:
+            task.apply_async(args, kwargs)
+        except Exception:
+            logger.exception("Could not enqueue %s", task.name)
+
+    transaction.on_commit(send)
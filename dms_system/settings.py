@@ -23,6 +23,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "drf_spectacular",
     "storages",
@@ -64,6 +65,11 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "dms_system.wsgi.application"
+ASGI_APPLICATION = "dms_system.asgi.application"
+
+# Route the records CRUD endpoints to their async views. Only worth it under an
+# ASGI server (see docker-compose.yml); under WSGI every request pays for an event loop.
+RECORDS_ASYNC_VIEWS = env.bool("RECORDS_ASYNC_VIEWS", default=False)
 
 DATABASES = {
         "default": {
@@ -85,6 +91,63 @@ CACHES = {
     }
 }
 
+# List endpoints: cached exact counts expire after this many seconds and result
+# sets estimated above the threshold report planner estimates instead.
+RECORDS_COUNT_CACHE_TIMEOUT = env.int("RECORDS_COUNT_CACHE_TIMEOUT", default=300)
+RECORDS_COUNT_ESTIMATE_THRESHOLD = env.int("RECORDS_COUNT_ESTIMATE_THRESHOLD", default=100_000)
+
+# Serialized record payloads served by the detail endpoint. Keep the timeout well
+# below the presigned URL lifetime, since payloads embed the file URL. Concurrent
+# misses wait up to LOCK_WAIT seconds for the caller that rebuilds the entry.
+RECORDS_DETAIL_CACHE_TIMEOUT = env.int("RECORDS_DETAIL_CACHE_TIMEOUT", default=300)
+RECORDS_DETAIL_CACHE_LOCK_TIMEOUT = 5
+RECORDS_DETAIL_CACHE_LOCK_WAIT = 0.5
+# Writes drop cached counts and details inline and again after commit. Set this to
+# also drop them from the light queue that many seconds after commit (0: off).
+RECORDS_CACHE_REINVALIDATE_DELAY = env.int("RECORDS_CACHE_REINVALIDATE_DELAY", default=0)
+
+# /api/records/bulk/ endpoints: items accepted per request and written per transaction.
+RECORDS_BULK_MAX_ITEMS = env.int("RECORDS_BULK_MAX_ITEMS", default=10_000)
+RECORDS_BULK_CHUNK_SIZE = env.int("RECORDS_BULK_CHUNK_SIZE", default=500)
+
+# Exports read this many rows per server-side cursor fetch. Export job state (and
+# so the download link) is kept in the cache for RECORDS_EXPORT_JOB_TIMEOUT seconds.
+RECORDS_EXPORT_CHUNK_SIZE = env.int("RECORDS_EXPORT_CHUNK_SIZE", default=2000)
+RECORDS_EXPORT_JOB_TIMEOUT = env.int("RECORDS_EXPORT_JOB_TIMEOUT", default=24 * 3600)
+
+# Imports commit this many source rows (and the job's progress) per transaction and
+# keep the first RECORDS_IMPORT_MAX_REPORTED_ERRORS rejected rows for the report.
+# CSV fields longer than RECORDS_IMPORT_MAX_FIELD_SIZE characters reject their row.
+RECORDS_IMPORT_BATCH_SIZE = env.int("RECORDS_IMPORT_BATCH_SIZE", default=2000)
+RECORDS_IMPORT_MAX_REPORTED_ERRORS = 1000
+RECORDS_IMPORT_MAX_FIELD_SIZE = env.int("RECORDS_IMPORT_MAX_FIELD_SIZE", default=10 * 1024 * 1024)
+# A completed import deletes its source; reconcile_record_files deletes any other
+# source older than this unless a pending or running import reads it.
+RECORDS_IMPORT_SOURCE_MAX_AGE = env.int("RECORDS_IMPORT_SOURCE_MAX_AGE", default=7 * 24 * 3600)
+
+# Background file processing: the first RECORDS_FILE_TEXT_MAX_BYTES of text files
+# are indexed for search; images up to RECORDS_THUMBNAIL_MAX_BYTES get a thumbnail
+# that fits in RECORDS_THUMBNAIL_SIZE pixels.
+RECORDS_FILE_TEXT_MAX_BYTES = env.int("RECORDS_FILE_TEXT_MAX_BYTES", default=512 * 1024)
+RECORDS_THUMBNAIL_MAX_BYTES = env.int("RECORDS_THUMBNAIL_MAX_BYTES", default=50 * 1024 ** 2)
+RECORDS_THUMBNAIL_SIZE = 256
+
+# Objects records stop using are queued and deleted RECORDS_OBJECT_DELETE_BATCH_SIZE
+# keys per DeleteObjects request (S3 allows at most 1000). reconcile_record_files
+# leaves objects younger than RECORDS_ORPHAN_MIN_AGE seconds alone, so direct
+# uploads still waiting for their commit are not mistaken for strays.
+RECORDS_OBJECT_DELETE_BATCH_SIZE = 1000
+RECORDS_ORPHAN_MIN_AGE = env.int("RECORDS_ORPHAN_MIN_AGE", default=2 * 24 * 3600)
+
+# Deleting a record only sets deleted_at. purge_deleted_records removes rows
+# deleted more than RECORDS_PURGE_AFTER seconds ago, RECORDS_PURGE_BATCH_SIZE at a
+# time with RECORDS_PURGE_PAUSE seconds in between, and stops starting batches
+# after RECORDS_PURGE_TIME_LIMIT seconds (keep it under HEAVY_TASK_SOFT_TIME_LIMIT).
+RECORDS_PURGE_AFTER = env.int("RECORDS_PURGE_AFTER", default=7 * 24 * 3600)
+RECORDS_PURGE_BATCH_SIZE = env.int("RECORDS_PURGE_BATCH_SIZE", default=500)
+RECORDS_PURGE_PAUSE = env.float("RECORDS_PURGE_PAUSE", default=0.5)
+RECORDS_PURGE_TIME_LIMIT = env.int("RECORDS_PURGE_TIME_LIMIT", default=1800)
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -107,7 +170,7 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "apps.utils.pagination.base_pagination.StandardResultsPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.user.authentication.StatelessJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
@@ -116,6 +179,8 @@ REST_FRAMEWORK = {
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
+    # Bulk endpoints report per-item errors keyed by item index.
+    "LIST_SERIALIZER_ERRORS_AS_DICT": True,
     "DEFAULT_FILTER_BACKENDS": [
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
@@ -132,6 +197,15 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
 }
 
+# Embed the user's role names in access tokens so RBAC checks need no database
+# query. Group membership changes invalidate issued claims through a per-user
+# version kept in the cache.
+RBAC_ROLES_IN_TOKEN = env.bool("RBAC_ROLES_IN_TOKEN", default=True)
+
+# StatelessJWTAuthentication checks the token's generation claim against this
+# cached copy of User.token_generation; signals refresh it on deactivation.
+AUTH_TOKEN_GENERATION_CACHE_TIMEOUT = env.int("AUTH_TOKEN_GENERATION_CACHE_TIMEOUT", default=600)
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "DMS System API",
     "DESCRIPTION": "Document Management System REST API",
@@ -139,8 +213,55 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
-CELERY_BROKER_URL = env("REDIS_URL", default="redis://127.0.0.1:6379/0")
-CELERY_RESULT_BACKEND = env("REDIS_URL", default="redis://127.0.0.1:6379/0")
+# Eager mode runs tasks inline in the calling process, with no broker or
+# worker; use it for local development and tests without Redis.
+CELERY_TASK_ALWAYS_EAGER = env.bool("CELERY_TASK_ALWAYS_EAGER", default=False)
+CELERY_TASK_EAGER_PROPAGATES = True
+if CELERY_TASK_ALWAYS_EAGER:
+    CELERY_BROKER_URL = "memory://"
+    CELERY_RESULT_BACKEND = "cache+memory://"
+else:
+    CELERY_BROKER_URL = env("REDIS_URL", default="redis://127.0.0.1:6379/0")
+    CELERY_RESULT_BACKEND = env("REDIS_URL", default="redis://127.0.0.1:6379/0")
+CELERY_RESULT_EXPIRES = 86400
+CELERY_TASK_SERIALIZER = "json"
+CELERY_ACCEPT_CONTENT = ["json"]
+
+# Three queues so long export/import jobs never hold up quick cache work or the
+# processing of newly stored files: "heavy" gets a small worker pool, "files" and
+# "light" larger ones. Unrouted tasks are light.
+CELERY_TASK_DEFAULT_QUEUE = "light"
+CELERY_TASK_ROUTES = {
+    "apps.records.tasks.export_records": {"queue": "heavy"},
+    "apps.records.tasks.import_records": {"queue": "heavy"},
+    "apps.records.tasks.process_record_file": {"queue": "files"},
+    "apps.records.tasks.purge_deleted_records": {"queue": "heavy"},
+}
+# Tasks are acknowledged after they finish, so a crashed worker's task is
+# redelivered; one task is reserved at a time so heavy jobs don't queue up
+# behind a busy process.
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# Time limits for light tasks; heavy and files tasks get HEAVY_TASK_* through annotations.
+# The soft limit raises SoftTimeLimitExceeded in the task so it can record the
+# failure; the hard limit kills the process.
+CELERY_TASK_SOFT_TIME_LIMIT = env.int("CELERY_TASK_SOFT_TIME_LIMIT", default=60)
+CELERY_TASK_TIME_LIMIT = env.int("CELERY_TASK_TIME_LIMIT", default=90)
+HEAVY_TASK_SOFT_TIME_LIMIT = env.int("HEAVY_TASK_SOFT_TIME_LIMIT", default=3600)
+HEAVY_TASK_TIME_LIMIT = env.int("HEAVY_TASK_TIME_LIMIT", default=3900)
+CELERY_TASK_ANNOTATIONS = {
+    name: {"soft_time_limit": HEAVY_TASK_SOFT_TIME_LIMIT, "time_limit": HEAVY_TASK_TIME_LIMIT}
+    for name, route in CELERY_TASK_ROUTES.items()
+    if route["queue"] in ("heavy", "files")
+}
+# Give up publishing quickly when the broker is down instead of blocking the request.
+CELERY_TASK_PUBLISH_RETRY_POLICY = {
+    "max_retries": 3,
+    "interval_start": 0,
+    "interval_step": 0.2,
+    "interval_max": 0.5,
+}
 
 MINIO_ENDPOINT_URL = env("MINIO_ENDPOINT_URL", default="http://localhost:9000")
 MINIO_ACCESS_KEY = env("MINIO_ACCESS_KEY", default="minioadmin")
@@ -148,6 +269,26 @@ MINIO_SECRET_KEY = env("MINIO_SECRET_KEY", default="minioadmin")
 MINIO_BUCKET_NAME = env("MINIO_BUCKET_NAME", default="dms-records")
 MINIO_USE_SSL = env("MINIO_USE_SSL")
 MINIO_PRESIGNED_URLS = env("MINIO_PRESIGNED_URLS")
+# Presigned download URLs are valid for AWS_QUERYSTRING_EXPIRE seconds and are
+# reused from the cache while at least MIN_VALIDITY seconds remain. Keep it above
+# RECORDS_DETAIL_CACHE_TIMEOUT, since cached record payloads embed these URLs.
+AWS_QUERYSTRING_EXPIRE = env.int("MINIO_PRESIGNED_URL_EXPIRE", default=3600)
+MINIO_PRESIGNED_URL_MIN_VALIDITY = env.int("MINIO_PRESIGNED_URL_MIN_VALIDITY", default=600)
+
+# Direct uploads: clients POST files straight to MinIO with a presigned policy valid
+# for UPLOAD_URL_EXPIRE seconds, then commit the key within UPLOAD_TOKEN_MAX_AGE.
+RECORDS_UPLOAD_MAX_SIZE = env.int("RECORDS_UPLOAD_MAX_SIZE", default=5 * 1024 ** 3)
+RECORDS_UPLOAD_URL_EXPIRE = env.int("RECORDS_UPLOAD_URL_EXPIRE", default=900)
+RECORDS_UPLOAD_TOKEN_MAX_AGE = env.int("RECORDS_UPLOAD_TOKEN_MAX_AGE", default=24 * 3600)
+
+# Part size for uploads streamed through the API into S3 multipart uploads, and so
+# the most memory one upload holds. S3 requires at least 5 MiB for all but the last part.
+MINIO_MULTIPART_PART_SIZE = env.int("MINIO_MULTIPART_PART_SIZE", default=8 * 1024 * 1024)
+
+# /api/records/<pk>/file/ proxies objects in chunks of this size, or redirects to a
+# presigned URL by default when RECORDS_FILE_REDIRECT is set (?redirect= overrides).
+RECORDS_FILE_STREAM_CHUNK_SIZE = 256 * 1024
+RECORDS_FILE_REDIRECT = env.bool("RECORDS_FILE_REDIRECT", default=False)
 
 STORAGES = {
     "default": {